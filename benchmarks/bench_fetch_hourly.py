@@ -0,0 +1,119 @@
+"""Benchmark: sequential vs concurrent weather + marine fetch in OpenMeteoClient.
+
+Starts a local aiohttp stub server that mimics the Open-Meteo forecast and marine
+endpoints with configurable artificial latency, then measures:
+
+- sequential: weather request awaited, then marine request (previous behaviour)
+- concurrent: OpenMeteoClient.fetch_hourly_forecast(include_marine=True)
+
+Requires the Home Assistant development environment (homeassistant + aiohttp).
+Run from the repository root:
+
+    python benchmarks/bench_fetch_hourly.py --weather-delay 0.4 --marine-delay 0.6 --runs 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from aiohttp import ClientSession, web
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from custom_components.fishing_assistant.api import (  # noqa: E402
+    OpenMeteoClient,
+    normalize_hourly_merged,
+)
+
+HOURS = 168
+
+
+def _hourly_payload(variables):
+    start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    times = [(start + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M") for i in range(HOURS)]
+    hourly = {"time": times}
+    for idx, var in enumerate(variables):
+        hourly[var] = [round(1.0 + idx + (i % 24) / 10.0, 2) for i in range(HOURS)]
+    return {"latitude": 0.0, "longitude": 0.0, "hourly": hourly}
+
+
+def _make_app(weather_delay: float, marine_delay: float) -> web.Application:
+    async def forecast(request: web.Request) -> web.Response:
+        await asyncio.sleep(weather_delay)
+        variables = request.query.get("hourly", "").split(",")
+        return web.json_response(_hourly_payload(variables))
+
+    async def marine(request: web.Request) -> web.Response:
+        await asyncio.sleep(marine_delay)
+        variables = request.query.get("hourly", "").split(",")
+        return web.json_response(_hourly_payload(variables))
+
+    app = web.Application()
+    app.router.add_get("/v1/forecast", forecast)
+    app.router.add_get("/v1/marine", marine)
+    return app
+
+
+async def _run(args: argparse.Namespace) -> None:
+    runner = web.AppRunner(_make_app(args.weather_delay, args.marine_delay))
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    base = f"http://127.0.0.1:{port}/v1"
+
+    async with ClientSession() as session:
+        client = OpenMeteoClient(
+            session=session, weather_url=f"{base}/forecast", marine_url=f"{base}/marine"
+        )
+        weather_vars = ["temperature_2m", "cloudcover", "precipitation", "wind_speed_10m", "pressure_msl"]
+        marine_vars = ["wave_height", "wave_period", "sea_surface_temperature"]
+
+        async def sequential():
+            weather = await client._fetch_open_meteo(f"{base}/forecast", 0.0, 0.0, weather_vars, 7)
+            marine_raw = await client._fetch_open_meteo(f"{base}/marine", 0.0, 0.0, marine_vars, 7, is_marine=True)
+            return normalize_hourly_merged(weather, marine_raw)
+
+        async def concurrent():
+            return await client.fetch_hourly_forecast(0.0, 0.0, include_marine=True, forecast_days=7)
+
+        results = {}
+        for label, fn in (("sequential", sequential), ("concurrent", concurrent)):
+            await fn()  # warm up connection pool
+            samples = []
+            for _ in range(args.runs):
+                t0 = time.perf_counter()
+                rows = await fn()
+                samples.append(time.perf_counter() - t0)
+            assert len(rows) == HOURS
+            results[label] = samples
+
+    await runner.cleanup()
+
+    print(f"weather_delay={args.weather_delay}s marine_delay={args.marine_delay}s runs={args.runs}")
+    for label, samples in results.items():
+        print(
+            f"{label:>11}: median={statistics.median(samples) * 1000:8.1f} ms  "
+            f"min={min(samples) * 1000:8.1f} ms  max={max(samples) * 1000:8.1f} ms"
+        )
+    seq = statistics.median(results["sequential"])
+    conc = statistics.median(results["concurrent"])
+    print(f"speedup: {seq / conc:.2f}x (saved {(seq - conc) * 1000:.1f} ms per fetch)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--weather-delay", type=float, default=0.4)
+    parser.add_argument("--marine-delay", type=float, default=0.6)
+    parser.add_argument("--runs", type=int, default=10)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,11 @@
 
 Provides:
 - OpenMeteoClient: async fetch of hourly weather + optional marine data
-- normalize_hourly_merged: converts Open-Meteo `hourly` arrays into a list of
-  timestamped dicts following the integration's canonical forecast contract.
+- fetch_current: Open-Meteo `current` block
+- normalize_hourly_series: Open-Meteo `hourly` arrays as a columnar HourlySeries
+- normalize_current_response: canonical-keyed values of a `current` block
+- normalize_hourly_merged: row view of the same data as a list of timestamped dicts
+  following the integration's canonical forecast contract.
 
 Normalization contract (per hourly item):
 {
@@ -23,20 +26,24 @@ Changes in this file:
 - Request Open-Meteo using API variable names (e.g. `windspeed_10m`).
 - Normalize response keys to canonical internal names (e.g. `wind_speed_10m`).
 - Accept both API and canonical names where reasonable.
-- Keep robust parsing, defensive logging, numeric coercion, and UTC time normalization.
+- Keep robust parsing and defensive logging; numeric coercion and UTC time handling
+  live in hourly_series.HourlySeries.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import math
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import aiohttp
-from homeassistant.util import dt as dt_util
 
 from .const import OPEN_METEO_MARINE_URL, OPEN_METEO_URL
+from .helpers.circuit_breaker import BREAKERS
+from .helpers.request_budget import DEFAULT_PRIORITY, REQUEST_BUDGET, Priority, call_weight
+from .hourly_series import HourlySeries
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,6 +58,13 @@ CANONICAL_TO_API: Dict[str, str] = {
     # marine
     "wave_height": "wave_height",
     "wave_period": "wave_period",
+    "wave_direction": "wave_direction",
+    "wind_wave_height": "wind_wave_height",
+    "wind_wave_period": "wind_wave_period",
+    "wind_wave_direction": "wind_wave_direction",
+    "swell_wave_height": "swell_wave_height",
+    "swell_wave_period": "swell_wave_period",
+    "swell_wave_direction": "swell_wave_direction",
     "sea_surface_temperature": "sea_surface_temperature",
 }
 
@@ -66,17 +80,118 @@ API_TO_CANONICAL: Dict[str, str] = {
     "pressure_msl": "pressure_msl",
     "wave_height": "wave_height",
     "wave_period": "wave_period",
+    "wave_direction": "wave_direction",
+    "wind_wave_height": "wind_wave_height",
+    "wind_wave_period": "wind_wave_period",
+    "wind_wave_direction": "wind_wave_direction",
+    "swell_wave_height": "swell_wave_height",
+    "swell_wave_period": "swell_wave_period",
+    "swell_wave_direction": "swell_wave_direction",
     "sea_surface_temperature": "sea_surface_temperature",
     # Add more aliases here if you encounter other naming variants
 }
 
+# Default canonical variable sets requested from Open-Meteo
+DEFAULT_HOURLY_VARIABLES = (
+    "temperature_2m",
+    "cloudcover",
+    "precipitation",
+    "wind_speed_10m",
+    "pressure_msl",
+)
+
+# Every marine variable the integration consumes: the merged hourly series and
+# MarineDataFetcher's current/daily aggregates are both built from one request.
+# Callers request the subset their entries need (see variable_planner).
+MARINE_HOURLY_VARIABLES = (
+    "wave_height",
+    "wave_direction",
+    "wave_period",
+    "wind_wave_height",
+    "wind_wave_period",
+    "swell_wave_height",
+    "swell_wave_period",
+)
+
+# Per-request timeouts (seconds). Weather and marine requests run concurrently and
+# each is bounded independently, so a slow marine endpoint never delays weather errors.
+WEATHER_TIMEOUT = 15
+MARINE_TIMEOUT = 15
+META_TIMEOUT = 10
+CURRENT_TIMEOUT = 10
+
+# Multi-location batching: fetches arriving within BATCH_WINDOW seconds of each other
+# that request the same endpoint/variables/days are sent as one request with
+# comma-separated coordinates. Large batches are split to keep URLs reasonable.
+BATCH_WINDOW = 0.25
+MAX_BATCH_LOCATIONS = 50
+
+# (base_url, api variables, forecast_days, forecast_hours, timeout)
+_BatchKey = Tuple[str, Tuple[str, ...], int, Optional[int], float]
+
+
+class OpenMeteoHTTPError(RuntimeError):
+    """Open-Meteo answered with a non-200 status."""
+
+    def __init__(self, message: str, status: int) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def is_upstream_failure(exc: BaseException) -> bool:
+    """Return True for errors that suggest the endpoint is down or overloaded.
+
+    Timeouts, connection errors, unparseable bodies, 5xx and 429 count; other 4xx
+    responses mean the endpoint works and rejected this particular request.
+    """
+    if isinstance(exc, OpenMeteoHTTPError):
+        return exc.status >= 500 or exc.status == 429
+    return True
+
 
 class OpenMeteoClient:
     """Async client to fetch and normalize Open-Meteo data."""
 
-    def __init__(self, session: Optional[aiohttp.ClientSession] = None) -> None:
-        # If a session is supplied, we won't close it.
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        weather_url: str = OPEN_METEO_URL,
+        marine_url: str = OPEN_METEO_MARINE_URL,
+        weather_timeout: float = WEATHER_TIMEOUT,
+        marine_timeout: float = MARINE_TIMEOUT,
+        batch_window: float = 0.0,
+    ) -> None:
+        # If a session is supplied, we won't close it. Otherwise one session is
+        # created lazily and reused for every request until async_close().
         self._session = session
+        self._owned_session: Optional[aiohttp.ClientSession] = None
+        self._weather_url = weather_url
+        self._marine_url = marine_url
+        self._weather_timeout = weather_timeout
+        self._marine_timeout = marine_timeout
+        # batch_window > 0 enables multi-location batching (see _fetch_location)
+        self._batch_window = float(batch_window or 0.0)
+        self._pending: Dict[_BatchKey, List[Tuple[float, float, asyncio.Future, Priority]]] = {}
+        self._flush_handles: Dict[_BatchKey, asyncio.TimerHandle] = {}
+        self._flush_tasks: Set[asyncio.Task] = set()
+        self.batch_stats: Dict[str, int] = {"requests": 0, "locations": 0}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the injected session, or a lazily created one owned by this client."""
+        if self._session is not None:
+            return self._session
+        if self._owned_session is None or self._owned_session.closed:
+            self._owned_session = aiohttp.ClientSession()
+        return self._owned_session
+
+    async def async_close(self) -> None:
+        """Close the session owned by this client (injected sessions are left open)."""
+        if self._owned_session is not None and not self._owned_session.closed:
+            try:
+                await self._owned_session.close()
+            except Exception:
+                _LOGGER.debug("Error closing Open-Meteo client session", exc_info=True)
+        self._owned_session = None
 
     async def fetch_hourly_forecast(
         self,
@@ -89,75 +204,192 @@ class OpenMeteoClient:
     ) -> List[Dict[str, Any]]:
         """Fetch hourly forecast (weather + optional marine) and return normalized list.
 
-        Returns a list of dicts (one per hour) normalized per contract.
+        Returns a list of dicts (one per hour) normalized per contract. This is a row
+        view of fetch_hourly_series(); internal callers use the series directly.
+        """
+        series = await self.fetch_hourly_series(
+            latitude,
+            longitude,
+            include_marine=include_marine,
+            forecast_days=forecast_days,
+            hourly_vars=hourly_vars,
+            marine_vars=marine_vars,
+        )
+        return series.rows()
+
+    async def fetch_hourly_series(
+        self,
+        latitude: float,
+        longitude: float,
+        include_marine: bool = False,
+        forecast_days: int = 7,
+        hourly_vars: Optional[Iterable[str]] = None,
+        marine_vars: Optional[Iterable[str]] = None,
+        priority: Priority = DEFAULT_PRIORITY,
+        forecast_hours: Optional[int] = None,
+    ) -> HourlySeries:
+        """Fetch hourly forecast (weather + optional marine) as a columnar HourlySeries.
+
+        `priority` orders the requests in the shared request budget (see
+        request_budget.request_priority). With `forecast_hours` only the hours from
+        the current one onwards are requested instead of `forecast_days` whole days
+        (Open-Meteo's hour-range parameter), for short-horizon refreshes that
+        HourlySeries.splice merges into a cached series.
         """
         if hourly_vars is None:
             # Use canonical internal names here — they will be mapped to API names below
-            hourly_vars = (
-                "temperature_2m",
-                "cloudcover",
-                "precipitation",
-                "wind_speed_10m",
-                "pressure_msl",
-            )
+            hourly_vars = DEFAULT_HOURLY_VARIABLES
         if marine_vars is None:
-            marine_vars = (
-                "wave_height",
-                "wave_period",
-                "sea_surface_temperature",
-            )
+            marine_vars = MARINE_HOURLY_VARIABLES
 
         _LOGGER.debug(
-            "Fetching Open-Meteo weather: lat=%s lon=%s canonical_vars=%s days=%s",
+            "Fetching Open-Meteo weather: lat=%s lon=%s canonical_vars=%s days=%s hours=%s",
             latitude,
             longitude,
             ",".join(hourly_vars),
             forecast_days,
+            forecast_hours,
         )
 
-        # Request weather (map canonical -> API names)
-        weather_data = await self._fetch_open_meteo(
-            OPEN_METEO_URL,
-            latitude,
-            longitude,
-            list(hourly_vars),
-            forecast_days,
-            is_marine=False,
+        # Weather and marine run concurrently, each with its own timeout; the merged
+        # result is ready once the slower of the two finishes.
+        weather_task = asyncio.ensure_future(
+            self._fetch_location(
+                self._weather_url,
+                latitude,
+                longitude,
+                list(hourly_vars),
+                forecast_days,
+                is_marine=False,
+                timeout=self._weather_timeout,
+                priority=priority,
+                forecast_hours=forecast_hours,
+            )
         )
-
-        marine_data = None
+        marine_task: Optional[asyncio.Future] = None
         if include_marine:
-            try:
-                _LOGGER.debug("Fetching Open-Meteo marine data")
-                marine_data = await self._fetch_open_meteo(
-                    OPEN_METEO_MARINE_URL,
+            _LOGGER.debug("Fetching Open-Meteo marine data")
+            marine_task = asyncio.ensure_future(
+                self._fetch_location(
+                    self._marine_url,
                     latitude,
                     longitude,
                     list(marine_vars),
                     forecast_days,
                     is_marine=True,
+                    timeout=self._marine_timeout,
+                    priority=priority,
+                    forecast_hours=forecast_hours,
                 )
+            )
+
+        try:
+            weather_data = await weather_task
+        except BaseException:
+            # Weather is required: fail fast and don't leave the marine request running
+            if marine_task is not None:
+                if not marine_task.done():
+                    marine_task.cancel()
+                elif not marine_task.cancelled():
+                    marine_task.exception()  # mark retrieved; result is discarded
+            raise
+
+        marine_data = None
+        if marine_task is not None:
+            try:
+                marine_data = await marine_task
+            except asyncio.CancelledError:
+                raise
             except Exception as exc:  # defensive: don't break flow due to marine failure
                 _LOGGER.debug(
                     "Open-Meteo marine fetch failed; proceeding without marine. Error: %s", exc
                 )
 
-        normalized = normalize_hourly_merged(weather_data, marine_data)
+        series = normalize_hourly_series(weather_data, marine_data)
 
         # Additional debug (non-fatal)
         try:
             _LOGGER.debug(
-                "Open-Meteo normalized forecast count=%d; first_items=%s",
-                len(normalized),
-                normalized[:3],
+                "Open-Meteo normalized forecast hours=%d; variables=%s",
+                len(series),
+                sorted(series.columns),
             )
         except Exception:
             # Never raise from logging
             _LOGGER.debug("Failed to log normalized forecast preview")
 
-        return normalized
+        return series
 
-    async def _fetch_open_meteo(
+    async def fetch_current(
+        self,
+        latitude: float,
+        longitude: float,
+        variables: Optional[Iterable[str]] = None,
+        include_marine: bool = False,
+        marine_vars: Optional[Iterable[str]] = None,
+        priority: Priority = DEFAULT_PRIORITY,
+    ) -> Dict[str, Any]:
+        """Fetch Open-Meteo's `current` block for one location (no hourly data).
+
+        Returns canonical-keyed values plus "time" (UTC datetime the values are
+        valid for). Marine values are merged in when requested; a marine failure
+        only drops them. Weather failures raise like fetch_hourly_series.
+        """
+        weather_task = asyncio.ensure_future(
+            self._fetch_current_block(
+                self._weather_url, latitude, longitude, variables or DEFAULT_HOURLY_VARIABLES, priority
+            )
+        )
+        marine_task: Optional[asyncio.Future] = None
+        if include_marine:
+            marine_task = asyncio.ensure_future(
+                self._fetch_current_block(
+                    self._marine_url, latitude, longitude, marine_vars or MARINE_HOURLY_VARIABLES, priority
+                )
+            )
+        try:
+            values = normalize_current_response(await weather_task)
+        except BaseException:
+            if marine_task is not None:
+                if not marine_task.done():
+                    marine_task.cancel()
+                elif not marine_task.cancelled():
+                    marine_task.exception()
+            raise
+        if marine_task is not None:
+            try:
+                marine = normalize_current_response(await marine_task)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                _LOGGER.debug("Open-Meteo marine current fetch failed; proceeding without marine. Error: %s", exc)
+            else:
+                marine.pop("time", None)
+                for key, value in marine.items():
+                    values.setdefault(key, value)
+        if values.get("time") is None:
+            raise RuntimeError("Open-Meteo current block has no time")
+        return values
+
+    async def _fetch_current_block(
+        self, base_url: str, latitude: float, longitude: float, requested_vars: Iterable[str], priority: Priority
+    ) -> Any:
+        """GET the `current` block of `base_url` through the circuit breaker and request budget."""
+        api_vars = _to_api_vars(requested_vars)
+        params = {
+            "latitude": latitude,
+            "longitude": longitude,
+            "current": ",".join(sorted(api_vars)),
+            "timezone": "UTC",
+        }
+        breaker = BREAKERS.get(base_url)
+        breaker.raise_if_open()
+        async with REQUEST_BUDGET.slot(base_url, weight=call_weight(1, len(api_vars), 1), priority=priority):
+            return await breaker.call(
+                lambda: self._get_json(base_url, params, CURRENT_TIMEOUT), is_failure=is_upstream_failure
+            )
+
+    async def _fetch_location(
         self,
         base_url: str,
         latitude: float,
@@ -165,142 +397,209 @@ class OpenMeteoClient:
         requested_vars: List[str],
         forecast_days: int,
         is_marine: bool = False,
+        timeout: float = WEATHER_TIMEOUT,
+        priority: Priority = DEFAULT_PRIORITY,
+        forecast_hours: Optional[int] = None,
     ) -> Dict[str, Any]:
+        """Return the raw Open-Meteo response for one location, batching when enabled."""
+        # Fail fast instead of joining a batch that would be rejected anyway
+        BREAKERS.get(base_url).raise_if_open()
+        if self._batch_window <= 0:
+            return await self._fetch_open_meteo(
+                base_url,
+                latitude,
+                longitude,
+                requested_vars,
+                forecast_days,
+                is_marine=is_marine,
+                timeout=timeout,
+                priority=priority,
+                forecast_hours=forecast_hours,
+            )
+
+        key: _BatchKey = (
+            base_url,
+            tuple(sorted(_to_api_vars(requested_vars))),
+            int(forecast_days),
+            int(forecast_hours) if forecast_hours else None,
+            float(timeout),
+        )
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        pending = self._pending.setdefault(key, [])
+        pending.append((float(latitude), float(longitude), future, priority))
+
+        if len(pending) >= MAX_BATCH_LOCATIONS:
+            self._start_flush(key)
+        elif key not in self._flush_handles:
+            self._flush_handles[key] = asyncio.get_running_loop().call_later(
+                self._batch_window, self._start_flush, key
+            )
+        return await future
+
+    def _start_flush(self, key: _BatchKey) -> None:
+        """Detach the pending batch for `key` and send it in a background task."""
+        handle = self._flush_handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._flush_batch(key, batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_batch(self, key: _BatchKey, batch: List[Tuple[float, float, asyncio.Future, Priority]]) -> None:
+        """Send one multi-location request for `batch` and resolve each waiter with its own response."""
+        base_url, api_vars, forecast_days, forecast_hours, timeout = key
+
+        # Waiters for identical coordinates (e.g. entries in one grid cell) share a slot
+        coords: List[Tuple[float, float]] = []
+        slot_of: Dict[Tuple[float, float], int] = {}
+        for lat, lon, _future, _priority in batch:
+            if (lat, lon) not in slot_of:
+                slot_of[(lat, lon)] = len(coords)
+                coords.append((lat, lon))
+
+        self.batch_stats["requests"] += 1
+        self.batch_stats["locations"] += len(coords)
+        _LOGGER.debug("Open-Meteo batch request to %s for %d locations (%d waiters)", base_url, len(coords), len(batch))
+
+        try:
+            data = await self._fetch_open_meteo(
+                base_url,
+                ",".join(str(lat) for lat, _ in coords),
+                ",".join(str(lon) for _, lon in coords),
+                list(api_vars),
+                forecast_days,
+                timeout=timeout,
+                forecast_hours=forecast_hours,
+                # The batch is as urgent as its most urgent waiter
+                priority=min(p for _lat, _lon, _future, p in batch),
+            )
+            # Open-Meteo returns a list for multi-location requests and a dict for one
+            results = data if isinstance(data, list) else [data]
+            if len(results) != len(coords):
+                raise RuntimeError(
+                    f"Open-Meteo batch returned {len(results)} results for {len(coords)} locations"
+                )
+        except BaseException as exc:
+            for _lat, _lon, future, _priority in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            return
+
+        for lat, lon, future, _priority in batch:
+            if not future.done():
+                future.set_result(results[slot_of[(lat, lon)]])
+
+    async def fetch_model_meta(self, meta_url: str, timeout: float = META_TIMEOUT) -> Dict[str, Any]:
+        """Fetch an Open-Meteo model metadata document (see refresh_planner.ModelRun)."""
+
+        async def _get() -> Any:
+            session = self._get_session()
+            client_timeout = aiohttp.ClientTimeout(total=timeout)
+            async with session.get(meta_url, timeout=client_timeout) as resp:
+                if resp.status != 200:
+                    raise OpenMeteoHTTPError(f"Open-Meteo metadata returned status {resp.status}", resp.status)
+                return await resp.json(content_type=None)
+
+        BREAKERS.get(meta_url).raise_if_open()
+        async with REQUEST_BUDGET.slot(meta_url):
+            data = await BREAKERS.get(meta_url).call(_get, is_failure=is_upstream_failure)
+        if not isinstance(data, dict):
+            raise RuntimeError("Open-Meteo metadata is not a JSON object")
+        return data
+
+    async def _fetch_open_meteo(
+        self,
+        base_url: str,
+        latitude: Any,
+        longitude: Any,
+        requested_vars: List[str],
+        forecast_days: int,
+        is_marine: bool = False,
+        timeout: float = WEATHER_TIMEOUT,
+        priority: Priority = DEFAULT_PRIORITY,
+        forecast_hours: Optional[int] = None,
+    ) -> Any:
         """Perform HTTP GET to Open-Meteo and return parsed JSON.
 
         requested_vars can be either canonical internal names or API names; we map them
         to API names when building the request. We also tolerate being passed API names directly.
-        Raises RuntimeError for non-200 responses or JSON parse failure.
+        latitude/longitude may be comma-separated lists, in which case Open-Meteo returns
+        a list with one response per location.
+        Raises RuntimeError for non-200 responses or JSON parse failure, and
+        CircuitOpenError without a request while the endpoint's circuit is open.
+        Waits for a slot in the request budget first (RequestBudgetExceeded when the
+        daily budget is used up).
         """
-        # Build the set of API variable names to request
-        api_vars: Set[str] = set()
-        for v in requested_vars:
-            if v in CANONICAL_TO_API:
-                api_vars.add(CANONICAL_TO_API[v])
-            else:
-                # If user passed an API-style name or unknown canonical, request it as-is
-                api_vars.add(v)
+        api_vars = _to_api_vars(requested_vars)
 
         params = {
             "latitude": latitude,
             "longitude": longitude,
             "hourly": ",".join(sorted(api_vars)),
             "timezone": "UTC",
-            "forecast_days": forecast_days,
         }
+        if forecast_hours:
+            params["forecast_hours"] = int(forecast_hours)
+        else:
+            params["forecast_days"] = forecast_days
+
+        # An open circuit rejects before the request takes (and is counted against) the budget
+        BREAKERS.get(base_url).raise_if_open()
+        days = math.ceil(int(forecast_hours) / 24) if forecast_hours else forecast_days
+        weight = call_weight(str(latitude).count(",") + 1, len(api_vars), days)
+        async with REQUEST_BUDGET.slot(base_url, weight=weight, priority=priority):
+            return await BREAKERS.get(base_url).call(
+                lambda: self._get_json(base_url, params, timeout), is_failure=is_upstream_failure
+            )
 
-        session = self._session or aiohttp.ClientSession()
-        close_session = self._session is None
+    async def _get_json(self, base_url: str, params: Dict[str, Any], timeout: float) -> Any:
+        session = self._get_session()
 
         _LOGGER.debug("Open-Meteo request to %s params=%s", base_url, params)
-        try:
-            timeout = aiohttp.ClientTimeout(total=15)  # seconds; adjust if you want shorter/longer
-            async with session.get(base_url, params=params, timeout=timeout) as resp:
-                text = await resp.text()
-                if resp.status != 200:
-                    _LOGGER.debug(
-                        "Open-Meteo non-200 response: status=%s body=%s", resp.status, text
-                    )
-                    raise RuntimeError(f"Open-Meteo returned status {resp.status}")
-
-                try:
-                    # tolerate content-types that may not be exact JSON MIME
-                    json_data = await resp.json(content_type=None)
-                    if not isinstance(json_data, dict):
-                        _LOGGER.debug("Open-Meteo returned non-dict JSON: %s", type(json_data))
-                    return json_data
-                except Exception as exc:
-                    _LOGGER.debug(
-                        "Failed to parse Open-Meteo JSON: %s; raw body (truncated)=%s",
-                        exc,
-                        (text or "")[:1000],
-                    )
-                    raise
-        finally:
-            if close_session:
-                try:
-                    await session.close()
-                except Exception:
-                    _LOGGER.debug("Error closing temporary aiohttp session", exc_info=True)
-
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        async with session.get(base_url, params=params, timeout=client_timeout) as resp:
+            text = await resp.text()
+            if resp.status != 200:
+                _LOGGER.debug(
+                    "Open-Meteo non-200 response: status=%s body=%s", resp.status, text
+                )
+                raise OpenMeteoHTTPError(f"Open-Meteo returned status {resp.status}", resp.status)
 
-# -----------------------------
-# Normalization helpers
-# -----------------------------
+            try:
+                # tolerate content-types that may not be exact JSON MIME
+                json_data = await resp.json(content_type=None)
+                if not isinstance(json_data, (dict, list)):
+                    _LOGGER.debug("Open-Meteo returned unexpected JSON: %s", type(json_data))
+                return json_data
+            except Exception as exc:
+                _LOGGER.debug(
+                    "Failed to parse Open-Meteo JSON: %s; raw body (truncated)=%s",
+                    exc,
+                    (text or "")[:1000],
+                )
+                raise
 
 
-def _to_utc_iso(dt_val: Any) -> Optional[str]:
-    """Parse a datetime-like value and return UTC ISO string with 'Z' suffix.
+def _to_api_vars(requested_vars: Iterable[str]) -> Set[str]:
+    """Map canonical variable names to Open-Meteo API names (unknown names pass through)."""
+    api_vars: Set[str] = set()
+    for v in requested_vars:
+        if v in CANONICAL_TO_API:
+            api_vars.add(CANONICAL_TO_API[v])
+        else:
+            # If user passed an API-style name or unknown canonical, request it as-is
+            api_vars.add(v)
+    return api_vars
 
-    Accepts datetime objects or strings parsable by Home Assistant's dt_util.parse_datetime.
-    If parsing fails returns None.
 
-    Note: dt_util.parse_datetime may return a naive datetime interpreted as local time.
-    Here we treat naive datetimes as UTC to avoid accidental timezone shifts in normalized
-    output. If you prefer local->UTC conversion, adjust accordingly.
-    """
-    if dt_val is None:
-        return None
-    try:
-        if isinstance(dt_val, datetime):
-            parsed = dt_val
-        else:
-            parsed = dt_util.parse_datetime(str(dt_val))
-        if parsed is None:
-            return None
-
-        # Treat naive datetimes as UTC (explicit) to keep normalization deterministic
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=timezone.utc)
-        parsed_utc = parsed.astimezone(timezone.utc)
-        return parsed_utc.strftime("%Y-%m-%dT%H:%M:%SZ")
-    except Exception:
-        _LOGGER.debug("Failed to parse/normalize time value: %s", dt_val, exc_info=True)
-        return None
-
-
-def _coerce_numeric(value: Any) -> Any:
-    """Coerce numeric-like values to int/float; leave booleans alone.
-
-    Returns:
-    - int for integer-like values
-    - float for decimal-like values
-    - None for empty/"nan"/NaN
-    - original value for non-numeric strings
-    """
-    if value is None:
-        return None
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, (int, float)):
-        try:
-            if isinstance(value, float) and math.isnan(value):
-                return None
-        except Exception:
-            pass
-        return value
-    if isinstance(value, str):
-        s = value.strip()
-        if s == "":
-            return None
-        if s.lower() == "nan":
-            return None
-        # Try integer-ish
-        try:
-            # handles negative integers as well
-            if s.lstrip("-").isdigit():
-                return int(s)
-            f = float(s)
-            if math.isnan(f):
-                return None
-            # Prefer int when the float is integral
-            if abs(f - int(f)) < 1e-9:
-                return int(f)
-            return f
-        except Exception:
-            return value
-    # Fallback: return original
-    return value
+# -----------------------------
+# Normalization helpers
+# -----------------------------
 
 
 def normalize_hourly_response(raw: Optional[Dict[str, Any]]) -> Dict[str, List[Any]]:
@@ -324,110 +623,56 @@ def normalize_hourly_response(raw: Optional[Dict[str, Any]]) -> Dict[str, List[A
     return out
 
 
-def normalize_hourly_merged(
+def normalize_hourly_series(
     weather_raw: Optional[Dict[str, Any]], marine_raw: Optional[Dict[str, Any]] = None
-) -> List[Dict[str, Any]]:
-    """Merge weather and marine hourly arrays from Open-Meteo into a normalized list.
+) -> HourlySeries:
+    """Build a columnar HourlySeries from Open-Meteo weather and marine responses.
 
     - Uses weather_raw.hourly.time as canonical timeline where available, otherwise marine time.
-    - Coerces numeric-like strings to numbers.
-    - Converts empty/"nan"/NaN to None.
-    - Normalizes times to UTC ISO strings with 'Z' suffix.
-    - Response keys are canonical internal names (e.g. 'wind_speed_10m').
+    - Weather values win; marine values fill variables/hours the weather response lacks.
+    - Numeric-like strings are coerced; empty/"nan"/NaN/non-numeric values become NaN.
+    - Column keys are canonical internal names (e.g. 'wind_speed_10m').
     """
-    weather_hourly = normalize_hourly_response(weather_raw)
-    marine_hourly = normalize_hourly_response(marine_raw)
-
-    # Determine canonical times
-    times = weather_hourly.get("time") or marine_hourly.get("time") or []
-
-    # Normalize times to UTC ISO strings preserving index alignment
-    times_iso: List[Optional[str]] = [_to_utc_iso(t) for t in times]
-    expected_len = len(times_iso)
-
-    # Collect keys excluding 'time'
-    keys = set(weather_hourly.keys()) | set(marine_hourly.keys())
-    keys.discard("time")
-
-    # If we have no timeline but some scalar fields, return a single snapshot with first values
-    if expected_len == 0:
-        now_iso = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        item: Dict[str, Any] = {"time": now_iso}
-        for k in keys:
-            vals = weather_hourly.get(k) or marine_hourly.get(k)
-            chosen = None
-            if isinstance(vals, list) and len(vals) > 0:
-                chosen = vals[0]
-            else:
-                chosen = None
-            chosen = _coerce_numeric(chosen)
-            item[k] = chosen
-        return [item]
-
-    # Log any length mismatches (non-fatal): helpful for debugging inconsistent upstream data
-    for src_name, arr in (("weather", weather_hourly), ("marine", marine_hourly)):
-        for k, v in arr.items():
-            if k == "time":
+    return HourlySeries.from_hourly_arrays(
+        normalize_hourly_response(weather_raw), normalize_hourly_response(marine_raw)
+    )
+
+
+def normalize_current_response(raw: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the `current` block of an Open-Meteo response with canonical keys.
+
+    Values are floats (None when missing or non-numeric); "time" is a UTC datetime
+    (None when unparseable) and the block's "interval" is dropped. Returns an
+    empty dict for invalid input.
+    """
+    if not raw or not isinstance(raw, dict) or not isinstance(raw.get("current"), dict):
+        return {}
+    out: Dict[str, Any] = {}
+    for k, v in raw["current"].items():
+        if k == "interval":
+            continue
+        if k == "time":
+            try:
+                parsed = datetime.fromisoformat(str(v))
+            except ValueError:
+                out["time"] = None
                 continue
-            if isinstance(v, list) and len(v) != expected_len:
-                _LOGGER.debug(
-                    "Open-Meteo variable '%s' from %s has length %d but expected %d (times length).",
-                    k,
-                    src_name,
-                    len(v),
-                    expected_len,
-                )
+            out["time"] = parsed.replace(tzinfo=timezone.utc) if parsed.tzinfo is None else parsed
+            continue
+        try:
+            value = float(v) if v is not None and not isinstance(v, bool) else None
+        except (TypeError, ValueError):
+            value = None
+        out[API_TO_CANONICAL.get(k, k)] = None if value is not None and math.isnan(value) else value
+    return out
 
-    # Build normalized list
-    normalized: List[Dict[str, Any]] = []
-    for idx in range(expected_len):
-        t_iso = times_iso[idx] if idx < len(times_iso) else None
-        if t_iso is None:
-            _LOGGER.debug(
-                "Unparseable/missing time at index %d raw=%s",
-                idx,
-                times[idx] if idx < len(times) else None,
-            )
 
-        item: Dict[str, Any] = {"time": t_iso}
-        for k in keys:
-            val: Any = None
+def normalize_hourly_merged(
+    weather_raw: Optional[Dict[str, Any]], marine_raw: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """Merge weather and marine hourly arrays from Open-Meteo into a normalized list.
 
-            # Prefer weather source
-            src_arr = weather_hourly.get(k)
-            if isinstance(src_arr, list):
-                val = src_arr[idx] if idx < len(src_arr) else None
-            else:
-                # Scalar -> broadcast
-                if src_arr is not None:
-                    val = src_arr
-
-            # Fallback to marine source
-            if val is None:
-                src_arr2 = marine_hourly.get(k)
-                if isinstance(src_arr2, list):
-                    val = src_arr2[idx] if idx < len(src_arr2) else None
-                else:
-                    if src_arr2 is not None:
-                        val = src_arr2
-
-            # Normalize sentinel values
-            if isinstance(val, str) and val.strip() == "":
-                val = None
-            if isinstance(val, str) and val.strip().lower() == "nan":
-                val = None
-            if isinstance(val, float):
-                try:
-                    if math.isnan(val):
-                        val = None
-                except Exception:
-                    pass
-
-            # Coerce numeric-like strings -> numbers
-            val = _coerce_numeric(val)
-
-            item[k] = val
-
-        normalized.append(item)
-
-    return normalized
\ No newline at end of file
+    Row view of normalize_hourly_series(): times are UTC ISO strings with 'Z'
+    suffix, numeric values are floats and missing values are None.
+    """
+    return normalize_hourly_series(weather_raw, marine_raw).rows()
@@ -10,6 +10,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, List
+import json
 import logging
 import math
 
@@ -22,6 +23,7 @@ from .data_schema import (
     ScoringResult,
 )
 from .data_formatter import DataFormatter
+from .variable_planner import RequestInputs
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,6 +37,10 @@ class BaseScorer(ABC):
     summaries and logging.
     """
 
+    # Canonical Open-Meteo hourly variables the scorer reads (see required_inputs)
+    WEATHER_INPUTS: tuple = ()
+    MARINE_INPUTS: tuple = ()
+
     def __init__(
         self,
         latitude: float,
@@ -56,6 +62,11 @@ class BaseScorer(ABC):
         self.species_profiles = species_profiles or {}
         self._component_scores: ComponentScores = {}
         self._conditions_summary: str = ""
+        # Forecast step results of the previous calculate_forecast call, keyed by inputs
+        self._forecast_memo: Dict[Any, ScoringResult] = {}
+        self._forecast_memo_next: Dict[Any, ScoringResult] = {}
+        self.forecast_steps_reused = 0
+        self.forecast_steps_scored = 0
 
         _LOGGER.debug(
             "Initialized %s for species: %s at (%.6f, %.6f)",
@@ -65,6 +76,15 @@ class BaseScorer(ABC):
             self.longitude,
         )
 
+    @classmethod
+    def required_inputs(cls, config: Optional[Dict[str, Any]] = None) -> RequestInputs:
+        """Return the hourly variables an entry configured with `config` needs upstream.
+
+        The request for the entry's grid cell is planned from these (see
+        variable_planner), so a variable no scorer declares is never requested.
+        """
+        return RequestInputs.of(cls.WEATHER_INPUTS, cls.MARINE_INPUTS)
+
     # ----------------------------
     # Abstract methods to override
     # ----------------------------
@@ -109,6 +129,54 @@ class BaseScorer(ABC):
     def _score_time_of_day(self, current_time: Any, astro: Dict[str, Any]) -> float:
         raise NotImplementedError
 
+    # ----------------------------
+    # Forecast step memo
+    # ----------------------------
+    def _begin_forecast(self) -> None:
+        """Start a calculate_forecast pass; steps scored now replace the previous memo."""
+        self._forecast_memo_next = {}
+
+    def _end_forecast(self) -> None:
+        self._forecast_memo = self._forecast_memo_next
+        self._forecast_memo_next = {}
+
+    def _score_forecast_step(
+        self,
+        weather_data: Dict[str, Any],
+        astro_data: Optional[Dict[str, Any]],
+        tide_data: Optional[Dict[str, Any]],
+        marine_data: Optional[Dict[str, Any]],
+        forecast_time: Any,
+    ) -> ScoringResult:
+        """Score one forecast step, reusing the previous pass's result when its inputs are unchanged.
+
+        After a short-horizon refresh only the steps inside the refreshed hours have
+        new inputs, so only those are scored again. Returns a shallow copy callers
+        may annotate.
+        """
+        try:
+            key: Any = json.dumps(
+                [str(forecast_time), weather_data, astro_data, tide_data, marine_data], sort_keys=True, default=str
+            )
+        except (TypeError, ValueError):
+            key = None
+
+        result = self._forecast_memo.get(key) if key is not None else None
+        if result is None:
+            result = self.calculate_score(
+                weather_data=weather_data,
+                astro_data=astro_data,
+                tide_data=tide_data,
+                marine_data=marine_data,
+                current_time=forecast_time,
+            )
+            self.forecast_steps_scored += 1
+        else:
+            self.forecast_steps_reused += 1
+        if key is not None and isinstance(result, dict):
+            self._forecast_memo_next[key] = result
+        return dict(result) if isinstance(result, dict) else result
+
     # ----------------------------
     # Public API
     # ----------------------------
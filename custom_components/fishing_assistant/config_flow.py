@@ -33,6 +33,10 @@ from .const import (
     CONF_AUTO_APPLY_THRESHOLDS,
     CONF_THRESHOLDS,
     CONF_TIME_PERIODS,
+    CONF_GRID_TOLERANCE,
+    DEFAULT_GRID_TOLERANCE,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
     TIDE_MODE_PROXY,
     TIDE_MODE_SENSOR,
     HABITAT_PRESETS,
@@ -817,6 +821,18 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                             mode="dropdown",
                         )
                     ),
+                    vol.Optional(
+                        CONF_GRID_TOLERANCE,
+                        default=self.config_entry.options.get(CONF_GRID_TOLERANCE, DEFAULT_GRID_TOLERANCE),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(min=0.001, max=0.25, step=0.001, unit_of_measurement="°", mode="box")
+                    ),
+                    vol.Optional(
+                        CONF_UPDATE_INTERVAL,
+                        default=self.config_entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(min=1, max=24, step=1, unit_of_measurement="h", mode="slider")
+                    ),
                 }
             ),
         )
@@ -847,6 +863,18 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     vol.Required("max_wave_height", default=thresholds.get("max_wave_height", 2.0)): selector.NumberSelector(
                         selector.NumberSelectorConfig(min=0.5, max=5.0, step=0.5, unit_of_measurement="m", mode="slider")
                     ),
+                    vol.Optional(
+                        CONF_GRID_TOLERANCE,
+                        default=self.config_entry.options.get(CONF_GRID_TOLERANCE, DEFAULT_GRID_TOLERANCE),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(min=0.001, max=0.25, step=0.001, unit_of_measurement="°", mode="box")
+                    ),
+                    vol.Optional(
+                        CONF_UPDATE_INTERVAL,
+                        default=self.config_entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(min=1, max=24, step=1, unit_of_measurement="h", mode="slider")
+                    ),
                 }
             ),
         )
\ No newline at end of file
@@ -27,6 +27,41 @@ CONF_AUTO_APPLY_THRESHOLDS = "auto_apply_thresholds"
 CONF_SPECIES_ID = "species_id"
 CONF_SPECIES_REGION = "species_region"
 CONF_TIME_PERIODS = "time_periods"
+CONF_GRID_TOLERANCE = "grid_tolerance"
+
+# Size (degrees) of the grid cells nearby entries share forecasts in (~2 km at
+# mid latitudes, the finest Open-Meteo model resolution)
+DEFAULT_GRID_TOLERANCE = 0.02
+# Locations this close (degrees) share one astronomy forecast; 0.01 deg shifts
+# rise/set times by a few seconds at most
+ASTRO_LOCATION_TOLERANCE = 0.01
+# Minutes between the sun/moon altitude samples computed with each astronomy day
+ASTRO_SAMPLE_MINUTES = 15
+
+# Hours between scheduled score updates (counted from local midnight: 6 -> 00/06/12/18)
+CONF_UPDATE_INTERVAL = "update_interval_hours"
+DEFAULT_UPDATE_INTERVAL = 6
+# Entries are spread over this many seconds after each scheduled hour
+UPDATE_JITTER_SECONDS = 120
+# Current conditions (Open-Meteo `current` block) and live scores refresh this often
+LIVE_UPDATE_MINUTES = 5
+
+# Upstream circuit breaker: open after this many consecutive failures, then probe
+# again after a backoff (seconds) that doubles per failed probe, randomised by +/-20%
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_BASE_BACKOFF = 60
+CIRCUIT_MAX_BACKOFF = 1800
+CIRCUIT_JITTER = 0.2
+
+# Open-Meteo free-tier limits in API calls (shared by all endpoints; a request for
+# several locations, more than 10 variables or more than 14 days counts as several)
+OPEN_METEO_MINUTE_LIMIT = 600
+OPEN_METEO_HOUR_LIMIT = 5000
+OPEN_METEO_DAY_LIMIT = 10000
+# Open-Meteo requests in flight at once across all entries
+OPEN_METEO_MAX_CONCURRENT = 4
+# Share of the daily budget reserved for entries with visible sensors
+BUDGET_VISIBLE_RESERVE = 0.1
 
 # Mode options
 MODE_FRESHWATER = "freshwater"
@@ -243,9 +278,18 @@ OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
 # Open-Meteo Marine API endpoint
 OPEN_METEO_MARINE_URL = "https://marine-api.open-meteo.com/v1/marine"
 
+# Open-Meteo model metadata (last run initialisation/availability time and update
+# interval) read by the refresh planner. Forecast responses carry no run time, so
+# these representative models stand in for the weather and marine endpoints.
+OPEN_METEO_WEATHER_META_URL = "https://api.open-meteo.com/data/dwd_icon/static/meta.json"
+OPEN_METEO_MARINE_META_URL = "https://marine-api.open-meteo.com/data/ecmwf_wam025/static/meta.json"
+
 # Sensor names for ocean mode
 SENSOR_OCEAN_SCORE = "ocean_fishing_score"
 SENSOR_TIDE_STATE = "tide_state"
 SENSOR_TIDE_STRENGTH = "tide_strength"
 SENSOR_WAVE_HEIGHT = "wave_height"
-SENSOR_WAVE_PERIOD = "wave_period"
\ No newline at end of file
+SENSOR_WAVE_PERIOD = "wave_period"
+# Memory budget (bytes) of the shared cache manager (helpers.cache). Least recently
+# used entries are evicted beyond it.
+CACHE_MEMORY_BUDGET = 64 * 1024 * 1024
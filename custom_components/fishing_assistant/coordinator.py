@@ -0,0 +1,213 @@
+"""Per-entry data coordinator for Fishing Assistant.
+
+FishingDataCoordinator fetches weather, forecast, astronomy and (in ocean mode)
+tide and marine data once per update cycle for all sensors of an entry, and
+overlays live current conditions between cycles (async_refresh_current).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .api import MARINE_HOURLY_VARIABLES
+from .const import DOMAIN
+from .hourly_series import current_weather_from_values
+
+_LOGGER = logging.getLogger(__name__)
+
+# Astro keys holding ISO datetime strings in calculate_astronomy_forecast output
+ASTRO_TIME_KEYS = ("sunrise", "sunset", "moonrise", "moonset", "moon_transit", "moon_underfoot")
+
+
+@dataclass(frozen=True)
+class FishingDataSnapshot:
+    """Immutable bundle of one entry's data for one update cycle; treat the dicts as read-only."""
+
+    weather: Dict[str, Any]
+    forecast: Dict[str, Dict[str, Any]]
+    astro_forecast: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    tide: Optional[Dict[str, Any]] = None
+    marine: Optional[Dict[str, Any]] = None
+    fetched_at: Optional[datetime] = None
+    # Set when weather/marine data is an older copy served because refreshing failed
+    stale_since: Optional[datetime] = None
+    # Time the live `current` values overlaid on weather/marine are valid for
+    live_at: Optional[datetime] = None
+
+    def astro_for_today(self) -> Dict[str, Any]:
+        """Return today's astro entry with ISO times parsed into datetimes.
+
+        Mirrors the shape the sensors used to build from calculate_astronomy_forecast:
+        a numeric `moon_phase` when available and datetime values for the event keys.
+        """
+        astro: Dict[str, Any] = {}
+        today_iso = dt_util.as_local(dt_util.now()).date().isoformat()
+        today_entry = (self.astro_forecast or {}).get(today_iso)
+        if not isinstance(today_entry, dict):
+            return astro
+
+        mp = today_entry.get("moon_phase")
+        try:
+            if mp is not None:
+                astro["moon_phase"] = float(mp)
+        except Exception:
+            astro["moon_phase"] = None
+
+        for k in ASTRO_TIME_KEYS:
+            v = today_entry.get(k)
+            if v:
+                try:
+                    astro[k] = dt_util.parse_datetime(str(v))
+                except Exception:
+                    astro[k] = None
+        return astro
+
+
+class FishingDataCoordinator(DataUpdateCoordinator[FishingDataSnapshot]):
+    """Fetch shared weather/forecast/astro (and tide/marine) data for one config entry."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        latitude: float,
+        longitude: float,
+        weather_fetcher: Any,
+        tide_proxy: Optional[Any] = None,
+        marine_fetcher: Optional[Any] = None,
+        astro_days: int = 2,
+        forecast_days: int = 7,
+    ) -> None:
+        super().__init__(hass, _LOGGER, name=f"{DOMAIN}_{entry_id}", update_interval=None)
+        self.entry_id = entry_id
+        self.latitude = float(latitude)
+        self.longitude = float(longitude)
+        self.weather_fetcher = weather_fetcher
+        self.tide_proxy = tide_proxy
+        self.marine_fetcher = marine_fetcher
+        self.astro_days = int(astro_days)
+        self.forecast_days = int(forecast_days)
+        self._cycle: Optional[datetime] = None
+        # series_fetched_at of the weather source when the current snapshot was built
+        self._source_fetched: Optional[datetime] = None
+        # Live values last overlaid on the snapshot (see async_refresh_current)
+        self._live_values: Optional[Dict[str, Any]] = None
+        self._cycle_lock = asyncio.Lock()
+
+    async def async_get_snapshot(self, now: Optional[datetime] = None) -> FishingDataSnapshot:
+        """Return the snapshot for the hourly cycle containing `now`, refreshing at most once per cycle.
+
+        A snapshot is also rebuilt within the cycle once the weather source has swapped
+        in a newer hourly series (a new model run), so out-of-cycle updates see it.
+
+        Raises RuntimeError when the refresh for this cycle failed, so sensors keep
+        their existing "fail loudly" behaviour.
+        """
+        now = now or dt_util.now()
+        cycle = now.replace(minute=0, second=0, microsecond=0)
+
+        async with self._cycle_lock:
+            source_fetched = self._source_fetched_at()
+            if self.data is None or self._cycle != cycle or source_fetched != self._source_fetched:
+                await self.async_refresh()
+                if not self.last_update_success or self.data is None:
+                    raise RuntimeError(
+                        f"Fishing data refresh failed for entry {self.entry_id}"
+                    ) from self.last_exception
+                self._cycle = cycle
+                self._source_fetched = self._source_fetched_at()
+
+        return self.data
+
+    async def async_refresh_current(self) -> Optional[FishingDataSnapshot]:
+        """Overlay the weather source's live conditions on the current snapshot.
+
+        Only the current weather and marine values change; returns None when there
+        is no snapshot yet or the source has no live values (nothing to rescore).
+        """
+        source = getattr(self.weather_fetcher, "open_meteo_client", None)
+        get_live = getattr(source, "async_get_live_current", None)
+        if self.data is None or get_live is None:
+            return None
+        values = await get_live()
+        if not values:
+            return None
+
+        async with self._cycle_lock:
+            snapshot = self.data
+            if values is self._live_values and snapshot.live_at is not None:
+                return snapshot
+            live_weather = current_weather_from_values(values)
+            weather = {**snapshot.weather, **{k: v for k, v in live_weather.items() if v is not None}}
+            marine = snapshot.marine
+            if isinstance(marine, dict) and isinstance(marine.get("current"), dict):
+                live_marine = {k: values[k] for k in MARINE_HOURLY_VARIABLES if values.get(k) is not None}
+                if live_marine:
+                    live_marine["timestamp"] = values["time"].strftime("%Y-%m-%dT%H:%M:%SZ")
+                    marine = {**marine, "current": {**marine["current"], **live_marine}}
+            snapshot = dataclasses.replace(snapshot, weather=weather, marine=marine, live_at=values["time"])
+            self.data = snapshot
+            self._live_values = values
+        return snapshot
+
+    def _source_fetched_at(self) -> Optional[datetime]:
+        source = getattr(self.weather_fetcher, "open_meteo_client", None)
+        fetched = getattr(source, "series_fetched_at", None)
+        return fetched if isinstance(fetched, datetime) else None
+
+    async def _async_update_data(self) -> FishingDataSnapshot:
+        """Fetch all shared inputs for this entry once."""
+        try:
+            weather = await self.weather_fetcher.get_weather_data()
+            forecast = await self.weather_fetcher.get_forecast(days=self.forecast_days)
+        except Exception as exc:
+            raise UpdateFailed(f"Weather fetch failed: {exc}") from exc
+
+        astro_forecast = await self._async_get_astro_forecast()
+
+        tide = await self.tide_proxy.get_tide_data() if self.tide_proxy else None
+        marine = await self.marine_fetcher.get_marine_data() if self.marine_fetcher else None
+
+        return FishingDataSnapshot(
+            weather=weather or {},
+            forecast=forecast or {},
+            astro_forecast=astro_forecast,
+            tide=tide,
+            marine=marine,
+            fetched_at=dt_util.now(),
+            stale_since=self._stale_since(marine),
+        )
+
+    async def _async_get_astro_forecast(self) -> Dict[str, Dict[str, Any]]:
+        """Return the astro forecast (days are memoized and persisted by helpers.astro)."""
+        try:
+            from .helpers.astro import calculate_astronomy_forecast
+
+            return await calculate_astronomy_forecast(
+                self.hass, self.latitude, self.longitude, days=self.astro_days
+            ) or {}
+        except Exception:
+            _LOGGER.debug("Astronomy forecast failed for entry %s", self.entry_id, exc_info=True)
+            return {}
+
+    def _stale_since(self, marine: Optional[Dict[str, Any]]) -> Optional[datetime]:
+        """Return the earliest staleness marker of the weather series and marine data."""
+        markers = []
+        source = getattr(self.weather_fetcher, "open_meteo_client", None)
+        weather_stale = getattr(source, "series_stale_since", None)
+        if isinstance(weather_stale, datetime):
+            markers.append(weather_stale)
+        if isinstance(marine, dict) and marine.get("stale_since"):
+            marine_stale = dt_util.parse_datetime(str(marine["stale_since"]))
+            if marine_stale is not None:
+                markers.append(marine_stale)
+        return min(markers) if markers else None
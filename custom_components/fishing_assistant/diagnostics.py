@@ -0,0 +1,53 @@
+"""Diagnostics support for Fishing Assistant."""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_LATITUDE, CONF_LONGITUDE, DOMAIN
+from .helpers.astro import ASTRO_JOBS
+from .helpers.cache import CACHE
+from .helpers.circuit_breaker import BREAKERS
+from .helpers.ephemeris import EPHEMERIS
+from .helpers.grid import GRID_CELLS
+from .helpers.request_budget import REQUEST_BUDGET
+from .http_session import async_get_session_stats
+from .marine_data import _INFLIGHT as _MARINE_INFLIGHT
+from .persistent_cache import get_persistent_cache
+from .scheduler import DATA_SCHEDULER
+from .weather_fetcher import _INFLIGHT as _WEATHER_INFLIGHT
+
+TO_REDACT = {CONF_LATITUDE, CONF_LONGITUDE}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    client = hass.data.get(DOMAIN, {}).get("open_meteo_client")
+    persistent = get_persistent_cache(hass)
+    scheduler = hass.data.get(DOMAIN, {}).get(DATA_SCHEDULER)
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "http": async_get_session_stats(hass),
+        "batching": dict(client.batch_stats) if client is not None else {},
+        "circuits": BREAKERS.stats(),
+        "request_budget": REQUEST_BUDGET.stats(),
+        "grid_cells": async_redact_data(GRID_CELLS.stats_for(entry.entry_id), TO_REDACT),
+        "coalescing": {
+            "weather": _WEATHER_INFLIGHT.stats(),
+            "marine": _MARINE_INFLIGHT.stats(),
+        },
+        "cache": CACHE.stats(),
+        "persistent_cache": persistent.stats() if persistent is not None else {},
+        "scheduler": scheduler.stats() if scheduler is not None else {},
+        "astro_jobs": ASTRO_JOBS.stats(),
+        "ephemeris": EPHEMERIS.stats(),
+    }
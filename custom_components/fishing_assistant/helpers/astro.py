@@ -1,12 +1,31 @@
-from datetime import datetime, timedelta, timezone
-from typing import Dict
-from skyfield.api import load, wgs84
+"""Astronomy forecast (sun/moon events and moon phase) computed with skyfield.
+
+The computation runs as one executor job per location and window; cancelling
+the last waiting caller stops it. Computed days are memoized (NS_ASTRO_DAY) and
+persisted, together with sun/moon state sampled every ASTRO_SAMPLE_MINUTES
+(NS_ASTRO_SAMPLES) for astro_state_at() and sun_times_at().
+"""
+
+from datetime import date, datetime, timedelta, timezone, tzinfo
+from array import array
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from skyfield import almanac
-import os
+import asyncio
+import threading
+import time
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 import logging
 import math
 
+import numpy as np
+
+from ..const import ASTRO_LOCATION_TOLERANCE, ASTRO_SAMPLE_MINUTES
+from ..persistent_cache import get_persistent_cache
+from .cache import CACHE, NS_ASTRO_DAY, NS_ASTRO_SAMPLES
+from .ephemeris import EPHEMERIS
+from .grid import snap_location
+
 # zoneinfo is available on Python 3.9+. Use it when available.
 try:
     from zoneinfo import ZoneInfo  # type: ignore
@@ -15,9 +34,199 @@ except Exception:
 
 _LOGGER = logging.getLogger(__name__)
 
+_EVENT_KEYS = ("moon_phase", "moonrise", "moonset", "moon_transit", "moon_underfoot", "sunrise", "sunset")
+_SAMPLE_COLUMNS = ("sun_altitude", "moon_altitude", "moon_illumination", "moon_distance_km")
+# Sun altitude at sunrise/sunset: upper limb on the horizon, with refraction (as almanac.sunrise_sunset)
+_SUNRISE_ALTITUDE = -0.8333
+
+
+class AstroJobCancelled(Exception):
+    """Raised inside an astronomy job whose caller was cancelled."""
+
+
+class AstroJobStats:
+    """Counters and timings of the offloaded astronomy jobs."""
+
+    def __init__(self) -> None:
+        self.jobs = 0
+        self.cancelled = 0
+        self.failed = 0
+        self.days_computed = 0
+        self.days_reused = 0
+        self.worker_seconds = 0.0
+        self.loop_seconds = 0.0
+        self.last_worker_seconds: Optional[float] = None
+        self.last_loop_seconds: Optional[float] = None
+
+    def record(self, worker_seconds: float) -> None:
+        self.jobs += 1
+        self.worker_seconds += worker_seconds
+        self.last_worker_seconds = worker_seconds
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "jobs": self.jobs,
+            "cancelled": self.cancelled,
+            "failed": self.failed,
+            "days_computed": self.days_computed,
+            "days_reused": self.days_reused,
+            "worker_seconds": round(self.worker_seconds, 4),
+            "loop_seconds": round(self.loop_seconds, 4),
+            "last_worker_seconds": round(self.last_worker_seconds, 4) if self.last_worker_seconds is not None else None,
+            "last_loop_seconds": round(self.last_loop_seconds, 4) if self.last_loop_seconds is not None else None,
+        }
+
+
+ASTRO_JOBS = AstroJobStats()
+
+# Jobs in flight: (location key, first day, days) -> [task, waiting callers]
+_RUNNING: Dict[Tuple[Any, ...], List[Any]] = {}
+
+
+class AstroSamples:
+    """Sun/moon state sampled every `step` seconds over one UTC day, both ends included (NaN: not computed)."""
+
+    __slots__ = ("start", "step") + _SAMPLE_COLUMNS
+
+    def __init__(
+        self,
+        start: int,
+        step: int,
+        sun_altitude: array,
+        moon_altitude: array,
+        moon_illumination: array,
+        moon_distance_km: array,
+    ) -> None:
+        self.start = start
+        self.step = step
+        self.sun_altitude = sun_altitude
+        self.moon_altitude = moon_altitude
+        self.moon_illumination = moon_illumination
+        self.moon_distance_km = moon_distance_km
+
+    def to_storage(self) -> Dict[str, Any]:
+        """Return a JSON-safe dict (NaN as None)."""
+        data: Dict[str, Any] = {"start": self.start, "step": self.step}
+        for name in _SAMPLE_COLUMNS:
+            data[name] = [None if math.isnan(v) else v for v in getattr(self, name)]
+        return data
+
+    @classmethod
+    def from_storage(cls, data: Dict[str, Any]) -> "AstroSamples":
+        columns = {
+            name: array("d", (math.nan if v is None else float(v) for v in data[name])) for name in _SAMPLE_COLUMNS
+        }
+        return cls(start=int(data["start"]), step=int(data["step"]), **columns)
+
+    def at(self, when: datetime) -> Optional[Dict[str, Any]]:
+        """Return the state at `when`, interpolated between the two bracketing samples."""
+        n = len(self.sun_altitude)
+        offset = (when.timestamp() - self.start) / self.step
+        if n < 2 or offset < 0 or offset > n - 1:
+            return None
+        i = min(int(offset), n - 2)
+        frac = offset - i
+
+        def _value(column: array) -> Optional[float]:
+            value = column[i] + (column[i + 1] - column[i]) * frac
+            return None if math.isnan(value) else value
+
+        return {
+            "sun_altitude": _value(self.sun_altitude),
+            "sun_rising": self.sun_altitude[i + 1] > self.sun_altitude[i],
+            "moon_altitude": _value(self.moon_altitude),
+            "moon_illumination": _value(self.moon_illumination),
+            "moon_distance_km": _value(self.moon_distance_km),
+        }
+
+    def crossings(self, name: str, level: float) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Return when column `name` first rises and first falls through `level`, interpolated (None: never)."""
+        column = getattr(self, name)
+        rising = falling = None
+        for i in range(len(column) - 1):
+            a, b = column[i] - level, column[i + 1] - level
+            if math.isnan(a) or math.isnan(b) or (a < 0) == (b < 0):
+                continue
+            when = datetime.fromtimestamp(self.start + self.step * (i + a / (a - b)), tz=timezone.utc)
+            if b > a and rising is None:
+                rising = when
+            elif b < a and falling is None:
+                falling = when
+        return rising, falling
+
+
+def _location_key(lat: float, lon: float, tolerance: Optional[float]) -> Tuple[float, float, str]:
+    """Return the (lat, lon) the memo is computed for and its key."""
+    if tolerance:
+        lat, lon = snap_location(lat, lon, tolerance)
+    return lat, lon, f"{float(lat):.4f}_{float(lon):.4f}"
+
+
+def astro_state_at(
+    lat: float, lon: float, when: datetime, tolerance: Optional[float] = ASTRO_LOCATION_TOLERANCE
+) -> Optional[Dict[str, Any]]:
+    """Return the sampled sun/moon state at `when` (aware datetime) for a location.
+
+    Keys: sun_altitude, sun_rising, moon_altitude, moon_illumination (0..1) and
+    moon_distance_km. None when calculate_astronomy_forecast has not computed that
+    day for the location.
+    """
+    try:
+        _, _, location_key = _location_key(lat, lon, tolerance)
+        ds = when.astimezone(timezone.utc).date().isoformat()
+        samples = CACHE.get(NS_ASTRO_SAMPLES, (location_key, ds))
+        return samples.at(when) if samples is not None else None
+    except Exception:
+        _LOGGER.debug("Failed to look up astro state at %s", when, exc_info=True)
+        return None
+
+
+def sun_times_at(
+    lat: float, lon: float, when: datetime, tolerance: Optional[float] = ASTRO_LOCATION_TOLERANCE
+) -> Optional[Tuple[Optional[datetime], Optional[datetime]]]:
+    """Return (sunrise, sunset) of the UTC day of `when` from the sampled sun altitude.
+
+    Either is None when the sun does not rise or set that day; returns None when
+    the day has no samples for the location.
+    """
+    try:
+        _, _, location_key = _location_key(lat, lon, tolerance)
+        ds = when.astimezone(timezone.utc).date().isoformat()
+        samples = CACHE.get(NS_ASTRO_SAMPLES, (location_key, ds))
+        return samples.crossings("sun_altitude", _SUNRISE_ALTITUDE) if samples is not None else None
+    except Exception:
+        _LOGGER.debug("Failed to look up sun times at %s", when, exc_info=True)
+        return None
+
+
+def _local_timezone(hass: HomeAssistant) -> tzinfo:
+    """Return the configured time zone (UTC when unavailable)."""
+    tz = None
+    try:
+        tz_name = None
+        if hasattr(hass, "config") and getattr(hass.config, "time_zone", None):
+            tz_name = hass.config.time_zone
+        elif hasattr(hass, "timezone") and hass.timezone:
+            tz_name = str(hass.timezone)
+        if tz_name and ZoneInfo is not None:
+            try:
+                tz = ZoneInfo(tz_name)
+            except Exception:
+                _LOGGER.debug("ZoneInfo could not load %s, falling back to UTC", tz_name, exc_info=True)
+                tz = timezone.utc
+        else:
+            tz = timezone.utc
+    except Exception:
+        tz = timezone.utc
+    return tz
+
 
 async def calculate_astronomy_forecast(
-    hass: HomeAssistant, lat: float, lon: float, days: int = 7
+    hass: HomeAssistant,
+    lat: float,
+    lon: float,
+    days: int = 7,
+    tolerance: Optional[float] = ASTRO_LOCATION_TOLERANCE,
 ) -> Dict[str, dict]:
     """
     Calculate a per-day astronomy forecast.
@@ -37,122 +246,225 @@ async def calculate_astronomy_forecast(
       3) Fallback to local civil noon (12:00 local time) if HA timezone available.
       4) Final fallback is 12:00 UTC.
 
+    Computed days are memoized per location (NS_ASTRO_DAY) and persisted, so
+    they survive restarts: only days missing from the memo are computed, so a rolling window adds one day at a time and
+    shorter windows are served from longer ones. Locations within `tolerance`
+    degrees share one memo (None: exact coordinates).
+
     The function is defensive: it logs issues and returns None for values that
-    cannot be computed rather than raising.
+    cannot be computed rather than raising. The computation runs in the executor
+    (see _compute_forecast); cancelling the last caller waiting for it also stops
+    the job.
     """
-    ts = load.timescale()
-
-    # Ensure local data directory exists
-    data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
-    os.makedirs(data_dir, exist_ok=True)
-
-    eph_path = os.path.join(data_dir, "de421.bsp")
+    mark = time.perf_counter()
+    start_date = datetime.now(timezone.utc).date()
+    lat, lon, location_key = _location_key(lat, lon, tolerance)
+    dates = [(start_date + timedelta(days=i)).isoformat() for i in range(days)]
+    known: Dict[str, Optional[dict]] = {ds: CACHE.get(NS_ASTRO_DAY, (location_key, ds)) for ds in dates}
+    persistent = get_persistent_cache(hass)
+    # A day whose samples were evicted is computed again with them (or read back from disk)
+    missing = [
+        ds
+        for ds in dates
+        if (known[ds] is None or CACHE.peek(NS_ASTRO_SAMPLES, (location_key, ds)) is None)
+        and not _restore_day(persistent, location_key, ds, known)
+    ]
+    ASTRO_JOBS.days_reused += len(dates) - len(missing)
+    loop_seconds = time.perf_counter() - mark
+
+    if missing:
+        first = date.fromisoformat(missing[0])
+        span = (date.fromisoformat(missing[-1]) - first).days + 1
+        tz = _local_timezone(hass)
+        computed = await _async_join_job(
+            (location_key, missing[0], span), lambda: _async_run_job(hass, lat, lon, first, span, tz)
+        )
+        mark = time.perf_counter()
+        if computed is not None:
+            forecast, samples = computed
+            ASTRO_JOBS.days_computed += len(forecast)
+            for ds, day in forecast.items():
+                # A day without a moon phase hit an ephemeris error; compute it again next time
+                if day.get("moon_phase") is not None:
+                    CACHE.set(NS_ASTRO_DAY, (location_key, ds), day)
+                    if ds in samples:
+                        CACHE.set(NS_ASTRO_SAMPLES, (location_key, ds), samples[ds])
+                        if persistent is not None:
+                            persistent.set(
+                                _persist_key(location_key, ds),
+                                {"events": day, "samples": samples[ds].to_storage()},
+                                dt_util.utcnow(),
+                            )
+                if ds in known:
+                    known[ds] = day
+        loop_seconds += time.perf_counter() - mark
+        ASTRO_JOBS.loop_seconds += loop_seconds
+        ASTRO_JOBS.last_loop_seconds = loop_seconds
+
+    # Copies: callers annotate the returned days
+    return {ds: dict(known[ds]) if known[ds] is not None else {key: None for key in _EVENT_KEYS} for ds in dates}
+
+
+def _persist_key(location_key: str, ds: str) -> str:
+    return f"astro_day:{location_key}:{ds}"
+
+
+def _restore_day(persistent: Any, location_key: str, ds: str, known: Dict[str, Optional[dict]]) -> bool:
+    """Load a day's events and samples persisted before a restart into the memo; False when absent."""
+    entry = persistent.get(_persist_key(location_key, ds)) if persistent is not None else None
+    if entry is None:
+        return False
+    try:
+        day = {key: entry.data["events"].get(key) for key in _EVENT_KEYS}
+        samples = AstroSamples.from_storage(entry.data["samples"])
+    except Exception:
+        _LOGGER.debug("Discarding unreadable persisted astro day %s", ds, exc_info=True)
+        return False
+    CACHE.set(NS_ASTRO_DAY, (location_key, ds), day)
+    CACHE.set(NS_ASTRO_SAMPLES, (location_key, ds), samples)
+    known[ds] = day
+    return True
+
+
+async def _async_join_job(key: Tuple[Any, ...], factory: Callable[[], Awaitable[Any]]) -> Any:
+    """Await the job for `key`, starting it unless one is running; the last cancelled waiter cancels it."""
+    job = _RUNNING.get(key)
+    if job is None:
+        job = _RUNNING[key] = [asyncio.ensure_future(factory()), 0]
+    job[1] += 1
+    try:
+        return await asyncio.shield(job[0])
+    except asyncio.CancelledError:
+        if job[1] == 1 and not job[0].done():
+            job[0].cancel()
+        raise
+    finally:
+        job[1] -= 1
+        if job[1] == 0 and _RUNNING.get(key) is job:
+            del _RUNNING[key]
+
+
+async def _async_run_job(
+    hass: HomeAssistant, lat: float, lon: float, start_date: date, days: int, tz: tzinfo
+) -> Optional[Tuple[Dict[str, dict], Dict[str, AstroSamples]]]:
+    """Compute the events and samples of `days` days from `start_date` in the executor; None when it failed."""
+    try:
+        eph = await EPHEMERIS.async_get(hass)
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        _LOGGER.error("Failed to load or download ephemeris: %s", exc, exc_info=True)
+        return None
 
-    # Try to reuse a cached ephemeris object stored on hass.data to avoid reloading the
-    # BSP file (and to avoid repeated downloads). Cache structure in hass.data[DOMAIN]["ephemeris"]:
-    # {"obj": <eph object>, "path": <path>, "mtime": <file mtime or None>}
+    cancel = threading.Event()
     try:
-        from ..const import DOMAIN
+        forecast, samples, worker_seconds = await hass.async_add_executor_job(
+            _timed_compute, eph, lat, lon, start_date, days, tz, cancel
+        )
+    except asyncio.CancelledError:
+        cancel.set()
+        ASTRO_JOBS.cancelled += 1
+        raise
+    except Exception as exc:
+        ASTRO_JOBS.failed += 1
+        _LOGGER.error("Astronomy forecast failed for (%s, %s): %s", lat, lon, exc, exc_info=True)
+        return None
 
-        hass_store = hass.data.setdefault(DOMAIN, {})
-        eph_cache = hass_store.get("ephemeris") or {}
-        eph = None
+    ASTRO_JOBS.record(worker_seconds)
+    _LOGGER.debug(
+        "Astronomy forecast for %d days from %s computed in %.3fs off the event loop", days, start_date, worker_seconds
+    )
+    return forecast, samples
 
-        # Determine file mtime if file exists
-        try:
-            file_mtime = os.path.getmtime(eph_path) if os.path.exists(eph_path) else None
-        except Exception:
-            file_mtime = None
 
-        # Reuse cached object if path and mtime match
-        try:
-            if eph_cache and eph_cache.get("obj") is not None and eph_cache.get("path") == eph_path and eph_cache.get("mtime") == file_mtime:
-                eph = eph_cache.get("obj")
-        except Exception:
-            eph = None
+def _timed_compute(
+    eph: Any, lat: float, lon: float, start_date: date, days: int, tz: tzinfo, cancel: threading.Event
+) -> Tuple[Dict[str, dict], Dict[str, AstroSamples], float]:
+    started = time.perf_counter()
+    forecast = _compute_forecast(eph, lat, lon, start_date, days, tz, cancel)
+    try:
+        samples = _compute_samples(eph, lat, lon, start_date, days, ASTRO_SAMPLE_MINUTES, cancel)
+    except AstroJobCancelled:
+        raise
+    except Exception as exc:
+        _LOGGER.warning("Sampling sun/moon state failed for (%s, %s): %s", lat, lon, exc)
+        samples = {}
+    return forecast, samples, time.perf_counter() - started
+
+
+def _compute_samples(
+    eph: Any,
+    lat: float,
+    lon: float,
+    start_date: date,
+    days: int,
+    step_minutes: int,
+    cancel: threading.Event,
+) -> Dict[str, AstroSamples]:
+    """Sample sun/moon state over each day in one array-valued pass (executor only)."""
+    _check_cancelled(cancel)
+    ts = EPHEMERIS.timescale()
+    per_day = 1440 // step_minutes + 1  # both midnights
+    minutes = (np.arange(days)[:, None] * 1440 + np.arange(per_day)[None, :] * step_minutes).ravel()
+    t = ts.utc(start_date.year, start_date.month, start_date.day, 0, minutes)
+
+    observer = (eph["earth"] + EPHEMERIS.topos(lat, lon)).at(t)
+    sun_altitude = observer.observe(eph["sun"]).apparent().altaz()[0].degrees
+    moon_alt, _moon_az, moon_distance = observer.observe(eph["moon"]).apparent().altaz()
+    moon_illumination = almanac.fraction_illuminated(eph, "moon", t)
+
+    samples: Dict[str, AstroSamples] = {}
+    for i in range(days):
+        d = start_date + timedelta(days=i)
+        day = slice(i * per_day, (i + 1) * per_day)
+        samples[d.isoformat()] = AstroSamples(
+            start=int(datetime(d.year, d.month, d.day, tzinfo=timezone.utc).timestamp()),
+            step=step_minutes * 60,
+            sun_altitude=array("d", sun_altitude[day].tolist()),
+            moon_altitude=array("d", moon_alt.degrees[day].tolist()),
+            moon_illumination=array("d", moon_illumination[day].tolist()),
+            moon_distance_km=array("d", moon_distance.km[day].tolist()),
+        )
+    return samples
 
-        # If not cached, load (or download) and store in hass.data cache
-        if eph is None:
-            if not os.path.exists(eph_path):
-                _LOGGER.info("Skyfield ephemeris not found — downloading to %s", eph_path)
 
-                def download_eph():
-                    import urllib.request
+def _check_cancelled(cancel: threading.Event) -> None:
+    if cancel.is_set():
+        raise AstroJobCancelled()
 
-                    url = "https://naif.jpl.nasa.gov/pub/naif/generic_kernels/spk/planets/de421.bsp"
-                    urllib.request.urlretrieve(url, eph_path)
-                    return load(eph_path)
 
-                eph = await hass.async_add_executor_job(download_eph)
-            else:
-                eph = await hass.async_add_executor_job(lambda: load(eph_path))
+def _compute_forecast(
+    eph: Any,
+    lat: float,
+    lon: float,
+    start_date: date,
+    days: int,
+    tz: tzinfo,
+    cancel: threading.Event,
+) -> Dict[str, dict]:
+    """Run every almanac search for the forecast window (executor only: blocks for a while).
 
-            # Store in cache
-            try:
-                hass_store["ephemeris"] = {"obj": eph, "path": eph_path, "mtime": os.path.getmtime(eph_path) if os.path.exists(eph_path) else None}
-            except Exception:
-                # Don't let caching failures break functionality
-                _LOGGER.debug("Failed to cache ephemeris in hass.data", exc_info=True)
-    except Exception as exc:
-        _LOGGER.error("Failed to load or download ephemeris: %s", exc, exc_info=True)
-        # Return empty forecast (all None) for requested days
-        forecast = {}
-        start_date = datetime.now(timezone.utc).date()
-        for i in range(days):
-            d = start_date + timedelta(days=i)
-            forecast[d.isoformat()] = {
-                "moon_phase": None,
-                "moonrise": None,
-                "moonset": None,
-                "moon_transit": None,
-                "moon_underfoot": None,
-                "sunrise": None,
-                "sunset": None,
-            }
-        return forecast
-    except Exception as exc:
-        _LOGGER.error("Failed to load or download ephemeris: %s", exc, exc_info=True)
-        # Return empty forecast (all None) for requested days
-        forecast = {}
-        start_date = datetime.now(timezone.utc).date()
-        for i in range(days):
-            d = start_date + timedelta(days=i)
-            forecast[d.isoformat()] = {
-                "moon_phase": None,
-                "moonrise": None,
-                "moonset": None,
-                "moon_transit": None,
-                "moon_underfoot": None,
-                "sunrise": None,
-                "sunset": None,
-            }
-        return forecast
+    Raises AstroJobCancelled between stages once `cancel` is set.
+    """
+    ts = EPHEMERIS.timescale()
 
     try:
-        location = wgs84.latlon(lat, lon)
+        location = EPHEMERIS.topos(lat, lon)
     except Exception as exc:
         _LOGGER.error("Invalid lat/lon (%s, %s): %s", lat, lon, exc, exc_info=True)
-        location = wgs84.latlon(lat, lon)  # still try; skyfield will raise if truly invalid
+        raise
 
-    start_date = datetime.now(timezone.utc).date()
     end_date = start_date + timedelta(days=days)
 
     t0 = ts.utc(start_date.year, start_date.month, start_date.day)
     t1 = ts.utc(end_date.year, end_date.month, end_date.day)
 
     # Prepare containers
-    events = {
-        "moon_phase": {},
-        "moonrise": {},
-        "moonset": {},
-        "moon_transit": {},
-        "moon_underfoot": {},
-        "sunrise": {},
-        "sunset": {},
-    }
+    events = {key: {} for key in _EVENT_KEYS}
 
     # Helper to safely call almanac.find_discrete and log errors
     def _safe_find_discrete(t0_, t1_, func, name):
+        _check_cancelled(cancel)
         try:
             return almanac.find_discrete(t0_, t1_, func)
         except Exception as exc:
@@ -161,44 +473,21 @@ async def calculate_astronomy_forecast(
 
     # -- Precompute sun transits (upper meridian) so we can sample at real solar noon --
     sun_transit_map = {}
-    try:
-        times_sun, events_sun = _safe_find_discrete(
-            t0, t1, almanac.meridian_transits(eph, eph["Sun"], location), "sun_transits"
-        )
-        for t, ev in zip(times_sun, events_sun):
-            try:
-                # ev == 1 indicates upper transit (solar noon); ev == 0 indicates lower transit
-                if int(ev) != 1:
-                    continue
-                date_str = t.utc_datetime().date().isoformat()
-                sun_transit_map[date_str] = t.utc_datetime()  # tz-aware naive in UTC
-            except Exception:
-                _LOGGER.debug("Skipping sun transit at %s", t, exc_info=True)
-    except Exception:
-        # Already logged in _safe_find_discrete; continue with empty map
-        sun_transit_map = {}
-
-    # Determine timezone to sample local civil noon if needed
-    tz = None
-    try:
-        tz_name = None
-        if hasattr(hass, "config") and getattr(hass.config, "time_zone", None):
-            tz_name = hass.config.time_zone
-        elif hasattr(hass, "timezone") and hass.timezone:
-            tz_name = str(hass.timezone)
-        if tz_name and ZoneInfo is not None:
-            try:
-                tz = ZoneInfo(tz_name)
-            except Exception:
-                _LOGGER.debug("ZoneInfo could not load %s, falling back to UTC", tz_name, exc_info=True)
-                tz = timezone.utc
-        else:
-            tz = timezone.utc
-    except Exception:
-        tz = timezone.utc
+    times_sun, events_sun = _safe_find_discrete(
+        t0, t1, almanac.meridian_transits(eph, eph["Sun"], location), "sun_transits"
+    )
+    for t, ev in zip(times_sun, events_sun):
+        try:
+            # ev == 1 indicates upper transit (solar noon); ev == 0 indicates lower transit
+            if int(ev) != 1:
+                continue
+            date_str = t.utc_datetime().date().isoformat()
+            sun_transit_map[date_str] = t.utc_datetime()  # tz-aware naive in UTC
+        except Exception:
+            _LOGGER.debug("Skipping sun transit at %s", t, exc_info=True)
 
     # Helper to estimate solar noon using longitude
-    def _estimated_solar_noon_utc(d: datetime.date) -> datetime:
+    def _estimated_solar_noon_utc(d: date) -> datetime:
         # Solar noon UTC ~= 12:00 UTC - (lon / 15 hours)
         try:
             offset_hours = lon / 15.0
@@ -210,10 +499,13 @@ async def calculate_astronomy_forecast(
             return datetime(d.year, d.month, d.day, 12, 0, 0, tzinfo=timezone.utc)
 
     # --- Compute a per-day continuous moon_phase fraction (0.0..1.0) at local solar noon when possible ---
+    # All sampling instants are chosen first and evaluated in one array-valued skyfield call.
+    _check_cancelled(cancel)
     try:
         earth = eph["earth"]
         sun = eph["sun"]
         moon = eph["moon"]
+        samples = []  # (date string, UTC datetime, sampling method)
         for i in range(days):
             d = start_date + timedelta(days=i)
             ds = d.isoformat()
@@ -249,34 +541,36 @@ async def calculate_astronomy_forecast(
                     t_sample_dt = datetime(d.year, d.month, d.day, 12, 0, 0, tzinfo=timezone.utc)
                     used_sampling = "utc_noon_fallback"
 
-            # Build skyfield Time from the UTC datetime
-            try:
-                t_sample = ts.utc(
-                    t_sample_dt.year,
-                    t_sample_dt.month,
-                    t_sample_dt.day,
-                    t_sample_dt.hour,
-                    t_sample_dt.minute,
-                    t_sample_dt.second,
-                )
-            except Exception:
-                # final fallback to simple midday UTC
-                t_sample = ts.utc(d.year, d.month, d.day, 12, 0, 0)
-                used_sampling = "final_utc_noon"
+            samples.append((ds, t_sample_dt, used_sampling))
+
+        def _illuminated_fraction(t_sample):
+            # Sun-Moon angular separation at t_sample (scalar or array Time) -> illuminated fraction
+            observer = earth.at(t_sample)
+            astrom_sun = observer.observe(sun).apparent()
+            astrom_moon = observer.observe(moon).apparent()
+            sep = astrom_sun.separation_from(astrom_moon).radians
+            return np.clip((1.0 + np.cos(sep)) / 2.0, 0.0, 1.0)
 
+        if samples:
+            # Whole seconds, as the per-day Time objects were built
+            fields = ("year", "month", "day", "hour", "minute", "second")
+            parts = [[getattr(dt_, field) for _, dt_, _ in samples] for field in fields]
             try:
-                # Compute Sun-Moon angular separation at t_sample and derive illuminated fraction
-                astrom_sun = earth.at(t_sample).observe(sun).apparent()
-                astrom_moon = earth.at(t_sample).observe(moon).apparent()
-                sep = astrom_sun.separation_from(astrom_moon).radians
-                frac = (1.0 + math.cos(sep)) / 2.0
-                frac = max(0.0, min(1.0, float(frac)))
-                events["moon_phase"][ds] = frac
+                fractions = _illuminated_fraction(ts.utc(*parts))
+                for (ds, _, _), frac in zip(samples, fractions):
+                    events["moon_phase"][ds] = float(frac)
             except Exception:
-                _LOGGER.debug(
-                    "Failed to compute moon phase for %s using sampling=%s", ds, used_sampling, exc_info=True
-                )
-                events["moon_phase"][ds] = None
+                # One bad instant spoils the batch: evaluate the days one at a time
+                _LOGGER.debug("Vectorized moon phase failed; sampling per day", exc_info=True)
+                for ds, t_sample_dt, used_sampling in samples:
+                    try:
+                        t_sample = ts.utc(*(getattr(t_sample_dt, field) for field in fields))
+                        events["moon_phase"][ds] = float(_illuminated_fraction(t_sample))
+                    except Exception:
+                        _LOGGER.debug(
+                            "Failed to compute moon phase for %s using sampling=%s", ds, used_sampling, exc_info=True
+                        )
+                        events["moon_phase"][ds] = None
     except Exception:
         _LOGGER.warning("Per-day moon phase sampling failed; falling back to discrete phase events")
         phase_map = {0: 0.0, 1: 0.25, 2: 0.5, 3: 0.75}
@@ -329,6 +623,7 @@ async def calculate_astronomy_forecast(
         d1 = target_date + timedelta(days=2)
         t0_fb = ts.utc(d0.year, d0.month, d0.day)
         t1_fb = ts.utc(d1.year, d1.month, d1.day)
+        _check_cancelled(cancel)
         try:
             times_fb, evs_fb = almanac.find_discrete(t0_fb, t1_fb, func_factory(eph_obj, loc))
             return times_fb, evs_fb
@@ -378,16 +673,7 @@ async def calculate_astronomy_forecast(
     # Build final forecast dict with consistent keys and ISO date keys
     forecast = {}
     for i in range(days):
-        d = start_date + timedelta(days=i)
-        ds = d.isoformat()
-        forecast[ds] = {
-            "moon_phase": events["moon_phase"].get(ds),
-            "moonrise": events["moonrise"].get(ds),
-            "moonset": events["moonset"].get(ds),
-            "moon_transit": events["moon_transit"].get(ds),
-            "moon_underfoot": events["moon_underfoot"].get(ds),
-            "sunrise": events["sunrise"].get(ds),
-            "sunset": events["sunset"].get(ds),
-        }
+        ds = (start_date + timedelta(days=i)).isoformat()
+        forecast[ds] = {key: events[key].get(ds) for key in _EVENT_KEYS}
 
-    return forecast
\ No newline at end of file
+    return forecast
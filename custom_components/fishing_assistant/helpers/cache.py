@@ -0,0 +1,249 @@
+"""Process-wide cache manager with namespaced TTLs and a memory budget.
+
+CACHE holds every in-memory cache of the integration. Entries are owned by
+config entries and released when they unload; over budget, expired and then
+least recently used entries are evicted. peek(..., allow_expired=True) still
+returns expired values.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+from ..const import CACHE_MEMORY_BUDGET
+
+_LOGGER = logging.getLogger(__name__)
+
+NS_WEATHER = "weather"
+NS_FORECAST = "forecast"
+NS_MARINE = "marine"
+NS_TIDE = "tide"
+NS_ASTRO = "astro"
+NS_ASTRO_DAY = "astro_day"
+NS_ASTRO_SAMPLES = "astro_samples"
+NS_MODEL_RUN = "model_run"
+
+# Default time-to-live per namespace (None: never expires, only evicted)
+DEFAULT_TTLS: Dict[str, Optional[timedelta]] = {
+    NS_WEATHER: timedelta(minutes=30),
+    NS_FORECAST: timedelta(minutes=30),
+    NS_MARINE: timedelta(hours=1),
+    NS_TIDE: timedelta(minutes=15),
+    NS_ASTRO: timedelta(hours=1),
+    # One computed day of sun/moon events per location; kept until the day has passed
+    NS_ASTRO_DAY: timedelta(days=9),
+    NS_ASTRO_SAMPLES: timedelta(days=9),
+    NS_MODEL_RUN: timedelta(minutes=10),
+}
+
+# Containers deeper than this are not walked when estimating sizes
+_MAX_SIZE_DEPTH = 6
+
+
+def estimate_size(value: Any, _depth: int = 0, _seen: Optional[Set[int]] = None) -> int:
+    """Return a rough estimate of the memory held by `value` in bytes."""
+    seen = _seen if _seen is not None else set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if _depth >= _MAX_SIZE_DEPTH or isinstance(value, (str, bytes, int, float, bool, array)) or value is None:
+        return size
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += estimate_size(k, _depth + 1, seen) + estimate_size(v, _depth + 1, seen)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += estimate_size(item, _depth + 1, seen)
+    elif hasattr(value, "__slots__"):
+        for name in value.__slots__:
+            size += estimate_size(getattr(value, name, None), _depth + 1, seen)
+    elif hasattr(value, "__dict__"):
+        size += estimate_size(vars(value), _depth + 1, seen)
+    return size
+
+
+@dataclass
+class CacheEntry:
+    """A cached value with its storage time, expiry and owning config entries."""
+
+    value: Any
+    stored_at: datetime
+    expires_at: Optional[datetime]
+    size: int
+    owners: Set[str] = field(default_factory=set)
+
+    def expired(self, now: Optional[datetime] = None) -> bool:
+        if self.expires_at is None:
+            return False
+        return (now or datetime.now(timezone.utc)) >= self.expires_at
+
+    def age(self, now: Optional[datetime] = None) -> timedelta:
+        return (now or datetime.now(timezone.utc)) - self.stored_at
+
+
+@dataclass
+class _NamespaceStats:
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class CacheManager:
+    """LRU cache of (namespace, key) entries under one memory budget."""
+
+    def __init__(
+        self,
+        budget_bytes: int = CACHE_MEMORY_BUDGET,
+        ttls: Optional[Dict[str, Optional[timedelta]]] = None,
+    ) -> None:
+        self.budget_bytes = int(budget_bytes)
+        self._ttls: Dict[str, Optional[timedelta]] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self._entries: "OrderedDict[Tuple[str, Hashable], CacheEntry]" = OrderedDict()
+        self._stats: Dict[str, _NamespaceStats] = {}
+        self._bytes = 0
+
+    def _ns_stats(self, namespace: str) -> _NamespaceStats:
+        stats = self._stats.get(namespace)
+        if stats is None:
+            stats = self._stats[namespace] = _NamespaceStats()
+        return stats
+
+    def ttl_for(self, namespace: str) -> Optional[timedelta]:
+        return self._ttls.get(namespace)
+
+    def get(self, namespace: str, key: Hashable, now: Optional[datetime] = None) -> Any:
+        """Return the fresh value for `key`, or None (counted as a miss)."""
+        entry = self.get_entry(namespace, key, now)
+        return entry.value if entry is not None else None
+
+    def get_entry(self, namespace: str, key: Hashable, now: Optional[datetime] = None) -> Optional[CacheEntry]:
+        """Return the fresh entry for `key`, counting a hit or miss."""
+        stats = self._ns_stats(namespace)
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            stats.misses += 1
+            return None
+        if entry.expired(now):
+            stats.misses += 1
+            stats.expired += 1
+            return None
+        self._entries.move_to_end((namespace, key))
+        stats.hits += 1
+        return entry
+
+    def peek(self, namespace: str, key: Hashable, allow_expired: bool = False) -> Optional[CacheEntry]:
+        """Return the entry for `key` without touching counters or LRU order."""
+        entry = self._entries.get((namespace, key))
+        if entry is None or (not allow_expired and entry.expired()):
+            return None
+        return entry
+
+    def set(
+        self,
+        namespace: str,
+        key: Hashable,
+        value: Any,
+        owner: Optional[str] = None,
+        stored_at: Optional[datetime] = None,
+        ttl: Optional[timedelta] = None,
+        size: Optional[int] = None,
+    ) -> CacheEntry:
+        """Store `value`, keeping the owners of the entry it replaces, then enforce the budget.
+
+        `ttl` overrides the namespace policy; `size` overrides the estimate (e.g. for
+        objects whose footprint the estimate cannot see).
+        """
+        stored_at = stored_at or datetime.now(timezone.utc)
+        ttl = ttl if ttl is not None else self._ttls.get(namespace)
+        old = self._entries.pop((namespace, key), None)
+        owners: Set[str] = set(old.owners) if old is not None else set()
+        if old is not None:
+            self._bytes -= old.size
+        if owner:
+            owners.add(owner)
+        entry = CacheEntry(
+            value=value,
+            stored_at=stored_at,
+            expires_at=stored_at + ttl if ttl is not None else None,
+            size=int(size) if size is not None else estimate_size(value),
+            owners=owners,
+        )
+        self._entries[(namespace, key)] = entry
+        self._bytes += entry.size
+        self._enforce_budget(keep=(namespace, key))
+        return entry
+
+    def invalidate(self, namespace: str, key: Hashable) -> None:
+        entry = self._entries.pop((namespace, key), None)
+        if entry is not None:
+            self._bytes -= entry.size
+            self._ns_stats(namespace).invalidations += 1
+
+    def release(self, owner: str) -> int:
+        """Forget `owner` everywhere and drop the entries nobody else uses; return how many."""
+        dropped = 0
+        for cache_key in list(self._entries):
+            entry = self._entries[cache_key]
+            if owner not in entry.owners:
+                continue
+            entry.owners.discard(owner)
+            if not entry.owners:
+                self.invalidate(*cache_key)
+                dropped += 1
+        if dropped:
+            _LOGGER.debug("Released %d cache entries of %s", dropped, owner)
+        return dropped
+
+    def _enforce_budget(self, keep: Tuple[str, Hashable]) -> None:
+        if self._bytes <= self.budget_bytes:
+            return
+        now = datetime.now(timezone.utc)
+        # Expired entries go first, then least recently used ones
+        candidates = [k for k, e in self._entries.items() if k != keep and e.expired(now)]
+        candidates += [k for k, e in self._entries.items() if k != keep and not e.expired(now)]
+        for cache_key in candidates:
+            if self._bytes <= self.budget_bytes:
+                break
+            entry = self._entries.pop(cache_key)
+            self._bytes -= entry.size
+            self._ns_stats(cache_key[0]).evictions += 1
+        if self._bytes > self.budget_bytes:
+            _LOGGER.debug("Cache entry %s alone exceeds the memory budget (%d bytes)", keep, self._bytes)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return totals plus per-namespace counters, entry counts and byte estimates."""
+        namespaces: Dict[str, Dict[str, Any]] = {}
+        for name, counters in self._stats.items():
+            total = counters.hits + counters.misses
+            namespaces[name] = {
+                "hits": counters.hits,
+                "misses": counters.misses,
+                "expired": counters.expired,
+                "evictions": counters.evictions,
+                "invalidations": counters.invalidations,
+                "hit_ratio": round(counters.hits / total, 3) if total else None,
+                "entries": 0,
+                "bytes": 0,
+            }
+        for (name, _key), entry in self._entries.items():
+            ns = namespaces.setdefault(name, {"entries": 0, "bytes": 0})
+            ns["entries"] += 1
+            ns["bytes"] += entry.size
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "budget_bytes": self.budget_bytes,
+            "namespaces": namespaces,
+        }
+
+
+CACHE = CacheManager()
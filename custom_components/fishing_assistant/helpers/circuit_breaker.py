@@ -0,0 +1,185 @@
+"""Circuit breaker for upstream endpoints.
+
+After CIRCUIT_FAILURE_THRESHOLD consecutive failures calls fail at once with
+CircuitOpenError. After a jittered backoff one probe is let through; a failed
+probe doubles the backoff. BREAKERS keeps one breaker per endpoint URL.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ..const import (
+    CIRCUIT_BASE_BACKOFF,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_JITTER,
+    CIRCUIT_MAX_BACKOFF,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an endpoint whose circuit is open."""
+
+    def __init__(self, name: str, retry_at: Optional[datetime]) -> None:
+        until = retry_at.isoformat() if retry_at else "the running probe completes"
+        super().__init__(f"Circuit for {name} is open until {until}")
+        self.name = name
+        self.retry_at = retry_at
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker with jittered exponential backoff."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        base_backoff: float = CIRCUIT_BASE_BACKOFF,
+        max_backoff: float = CIRCUIT_MAX_BACKOFF,
+        jitter: float = CIRCUIT_JITTER,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = max(int(failure_threshold), 1)
+        self.base_backoff = float(base_backoff)
+        self.max_backoff = float(max_backoff)
+        self.jitter = float(jitter)
+        self.state = STATE_CLOSED
+        self.failures = 0
+        # Consecutive openings without a successful probe (drives the backoff)
+        self.openings = 0
+        self.opened_at: Optional[datetime] = None
+        self.retry_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self.rejected = 0
+
+    def _now(self) -> datetime:
+        return datetime.now(timezone.utc)
+
+    def is_open(self, now: Optional[datetime] = None) -> bool:
+        """Return True while calls would be rejected (no probe is due yet)."""
+        if self.state == STATE_HALF_OPEN:
+            return True
+        if self.state != STATE_OPEN:
+            return False
+        return self.retry_at is not None and (now or self._now()) < self.retry_at
+
+    def raise_if_open(self) -> None:
+        """Raise CircuitOpenError while open, without claiming the probe slot."""
+        if self.is_open():
+            self.rejected += 1
+            raise CircuitOpenError(self.name, self.retry_at)
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless the call may go ahead (possibly as the probe)."""
+        if self.state == STATE_CLOSED:
+            return
+        now = self._now()
+        if self.state == STATE_OPEN and (self.retry_at is None or now >= self.retry_at):
+            self.state = STATE_HALF_OPEN
+            _LOGGER.debug("Circuit %s half-open: sending probe", self.name)
+            return
+        self.rejected += 1
+        raise CircuitOpenError(self.name, self.retry_at)
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[Any]],
+        is_failure: Callable[[BaseException], bool] = lambda exc: True,
+    ) -> Any:
+        """Await `fn()` through the breaker.
+
+        Exceptions for which `is_failure` returns False (e.g. a 400 response) prove
+        the endpoint is reachable and count as success for the circuit.
+        """
+        self.before_call()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            self.record_cancelled()
+            raise
+        except Exception as exc:
+            if is_failure(exc):
+                self.record_failure(exc)
+            else:
+                self.record_success()
+            raise
+        self.record_success()
+        return result
+
+    def record_success(self) -> None:
+        if self.state != STATE_CLOSED:
+            _LOGGER.info("Circuit %s closed: upstream recovered", self.name)
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.openings = 0
+        self.opened_at = None
+        self.retry_at = None
+
+    def record_cancelled(self) -> None:
+        """Release an abandoned probe so the next caller can probe again."""
+        if self.state == STATE_HALF_OPEN:
+            self.state = STATE_OPEN
+            self.retry_at = self._now()
+
+    def record_failure(self, exc: Optional[BaseException] = None) -> None:
+        self.failures += 1
+        self.last_error = repr(exc) if exc is not None else None
+        if self.state == STATE_HALF_OPEN or self.failures >= self.failure_threshold:
+            self._open()
+
+    def _open(self) -> None:
+        backoff = min(self.base_backoff * (2 ** self.openings), self.max_backoff)
+        backoff *= 1 + random.uniform(-self.jitter, self.jitter)
+        self.openings += 1
+        now = self._now()
+        if self.state != STATE_OPEN:
+            self.opened_at = self.opened_at or now
+        self.state = STATE_OPEN
+        self.retry_at = now + timedelta(seconds=backoff)
+        _LOGGER.warning(
+            "Circuit %s open after %d failures (%s); next probe in %.0fs",
+            self.name,
+            self.failures,
+            self.last_error,
+            backoff,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "openings": self.openings,
+            "opened_at": self.opened_at.isoformat() if self.opened_at else None,
+            "retry_at": self.retry_at.isoformat() if self.retry_at else None,
+            "rejected": self.rejected,
+            "last_error": self.last_error,
+        }
+
+
+class CircuitBreakerRegistry:
+    """One CircuitBreaker per endpoint, created on first use."""
+
+    def __init__(self) -> None:
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._breakers[endpoint] = CircuitBreaker(endpoint)
+        return breaker
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {endpoint: breaker.stats() for endpoint, breaker in self._breakers.items()}
+
+
+BREAKERS = CircuitBreakerRegistry()
@@ -0,0 +1,175 @@
+"""Shared skyfield ephemeris, timescale and observer positions.
+
+EPHEMERIS loads the de421 kernel once in the executor (downloading it when
+missing) and builds the timescale and each location's topos once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+EPHEMERIS_FILE = "de421.bsp"
+EPHEMERIS_URL = "https://naif.jpl.nasa.gov/pub/naif/generic_kernels/spk/planets/de421.bsp"
+
+# Topos are keyed on rounded coordinates (~1 m)
+_TOPOS_DIGITS = 5
+
+
+def _resident_bytes() -> Optional[int]:
+    """Return the resident set size of the process, or None where unavailable."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        pass
+    try:
+        import resource
+
+        # Peak rather than current on platforms without /proc; kilobytes on Linux, bytes on macOS
+        return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss) * 1024
+    except Exception:
+        return None
+
+
+class EphemerisService:
+    """Process-wide owner of the skyfield kernel, timescale and per-location topos."""
+
+    def __init__(self, data_dir: Optional[str] = None) -> None:
+        self.data_dir = data_dir or os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+        self.path = os.path.join(self.data_dir, EPHEMERIS_FILE)
+        self._eph: Any = None
+        self._mtime: Optional[float] = None
+        self._ts: Any = None
+        self._topos: Dict[Tuple[float, float], Any] = {}
+        self._observers: Dict[Tuple[float, float], Any] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self.loads = 0
+        self.downloads = 0
+        self.calls = 0
+        self.call_seconds = 0.0
+        self.last_call_seconds: Optional[float] = None
+        self.load_seconds: Optional[float] = None
+        self.rss_before_load: Optional[int] = None
+        self.rss_after_load: Optional[int] = None
+
+    # -----------------------
+    # Loading
+    # -----------------------
+    def _file_mtime(self) -> Optional[float]:
+        try:
+            return os.path.getmtime(self.path) if os.path.exists(self.path) else None
+        except Exception:
+            return None
+
+    async def async_get(self, hass: HomeAssistant) -> Any:
+        """Return the loaded kernel, loading (or downloading) it in the executor once.
+
+        A kernel file replaced on disk (new mtime) is loaded again.
+        """
+        started = time.perf_counter()
+        try:
+            if self._eph is None or self._mtime != self._file_mtime():
+                if self._lock is None:
+                    self._lock = asyncio.Lock()
+                async with self._lock:
+                    if self._eph is None or self._mtime != self._file_mtime():
+                        await hass.async_add_executor_job(self._load)
+            return self._eph
+        finally:
+            elapsed = time.perf_counter() - started
+            self.calls += 1
+            self.call_seconds += elapsed
+            self.last_call_seconds = elapsed
+
+    def _load(self) -> None:
+        """Load the kernel and timescale (executor only: reads or downloads the file)."""
+        from skyfield.api import load
+
+        os.makedirs(self.data_dir, exist_ok=True)
+        rss_before = _resident_bytes()
+        started = time.perf_counter()
+        if not os.path.exists(self.path):
+            import urllib.request
+
+            _LOGGER.info("Skyfield ephemeris not found — downloading to %s", self.path)
+            urllib.request.urlretrieve(EPHEMERIS_URL, self.path)
+            self.downloads += 1
+        eph = load(self.path)
+        if self._ts is None:
+            self._ts = load.timescale()
+        self.load_seconds = time.perf_counter() - started
+        self.rss_before_load = rss_before
+        self.rss_after_load = _resident_bytes()
+        # A replaced kernel is left to the garbage collector: running jobs may still read it
+        self._eph = eph
+        self._mtime = self._file_mtime()
+        # Observers hold vectors of the old kernel
+        self._observers = {}
+        self.loads += 1
+        _LOGGER.debug("Loaded ephemeris %s in %.3fs", self.path, self.load_seconds)
+
+    # -----------------------
+    # Derived objects
+    # -----------------------
+    def timescale(self) -> Any:
+        """Return the shared timescale (built on first use if no kernel was loaded yet)."""
+        if self._ts is None:
+            from skyfield.api import load
+
+            self._ts = load.timescale()
+        return self._ts
+
+    def topos(self, latitude: float, longitude: float) -> Any:
+        """Return the wgs84 position of a location, built once per location."""
+        key = (round(float(latitude), _TOPOS_DIGITS), round(float(longitude), _TOPOS_DIGITS))
+        topos = self._topos.get(key)
+        if topos is None:
+            from skyfield.api import wgs84
+
+            topos = self._topos[key] = wgs84.latlon(float(latitude), float(longitude))
+        return topos
+
+    def observer(self, latitude: float, longitude: float) -> Any:
+        """Return earth + topos for a location (for altitudes); requires a loaded kernel."""
+        if self._eph is None:
+            raise RuntimeError("Ephemeris not loaded; await EPHEMERIS.async_get(hass) first")
+        key = (round(float(latitude), _TOPOS_DIGITS), round(float(longitude), _TOPOS_DIGITS))
+        observer = self._observers.get(key)
+        if observer is None:
+            observer = self._observers[key] = self._eph["earth"] + self.topos(latitude, longitude)
+        return observer
+
+    def stats(self) -> Dict[str, Any]:
+        try:
+            file_bytes = os.path.getsize(self.path) if os.path.exists(self.path) else None
+        except Exception:
+            file_bytes = None
+        rss_delta = (
+            self.rss_after_load - self.rss_before_load
+            if self.rss_after_load is not None and self.rss_before_load is not None
+            else None
+        )
+        return {
+            "loaded": self._eph is not None,
+            "loads": self.loads,
+            "downloads": self.downloads,
+            "file_bytes": file_bytes,
+            "load_seconds": round(self.load_seconds, 4) if self.load_seconds is not None else None,
+            "calls": self.calls,
+            "call_seconds": round(self.call_seconds, 4),
+            "last_call_seconds": round(self.last_call_seconds, 6) if self.last_call_seconds is not None else None,
+            "resident_bytes": _resident_bytes(),
+            "load_resident_delta_bytes": rss_delta,
+            "locations": len(self._topos),
+        }
+
+
+EPHEMERIS = EphemerisService()
@@ -0,0 +1,124 @@
+"""Grid-cell snapping so nearby locations share upstream forecasts.
+
+Coordinates are snapped to a grid of `tolerance` degrees; entries in the same
+cell share one cache key and request the cell centre upstream.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..const import DEFAULT_GRID_TOLERANCE
+
+MIN_GRID_TOLERANCE = 0.0001
+
+
+def snap_coordinate(value: float, tolerance: float = DEFAULT_GRID_TOLERANCE) -> float:
+    """Snap a coordinate to the centre of its grid cell."""
+    tol = max(float(tolerance or 0.0), MIN_GRID_TOLERANCE)
+    return round(round(float(value) / tol) * tol, 4)
+
+
+def snap_location(
+    latitude: float, longitude: float, tolerance: float = DEFAULT_GRID_TOLERANCE
+) -> Tuple[float, float]:
+    """Return the (lat, lon) cell centre for a location."""
+    return snap_coordinate(latitude, tolerance), snap_coordinate(longitude, tolerance)
+
+
+def grid_cell_key(latitude: float, longitude: float, tolerance: float = DEFAULT_GRID_TOLERANCE) -> str:
+    """Return the cache key for the grid cell containing a location."""
+    lat, lon = snap_location(latitude, longitude, tolerance)
+    return f"{lat}_{lon}"
+
+
+@dataclass
+class GridCell:
+    """A snapped grid cell, its members and the values shared between them."""
+
+    key: str
+    latitude: float
+    longitude: float
+    members: Set[str] = field(default_factory=set)
+    # namespace -> {"hits": n, "misses": n}
+    counters: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    values: Dict[str, Any] = field(default_factory=dict)
+    # member -> values registered by that member (dropped when it is released)
+    member_values: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    _locks: Dict[str, asyncio.Lock] = field(default_factory=dict, repr=False)
+
+    def lock(self, name: str) -> asyncio.Lock:
+        """Return the lock guarding the shared value `name`."""
+        lock = self._locks.get(name)
+        if lock is None:
+            lock = self._locks[name] = asyncio.Lock()
+        return lock
+
+    def record(self, namespace: str, hit: bool) -> None:
+        """Count a cache hit or miss for one cached value of this cell."""
+        counter = self.counters.setdefault(namespace, {"hits": 0, "misses": 0})
+        counter["hits" if hit else "misses"] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        caches: Dict[str, Dict[str, Any]] = {}
+        for namespace, counter in self.counters.items():
+            total = counter["hits"] + counter["misses"]
+            caches[namespace] = {
+                **counter,
+                "hit_ratio": round(counter["hits"] / total, 3) if total else None,
+            }
+        return {
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "members": len(self.members),
+            "caches": caches,
+        }
+
+
+class GridCellRegistry:
+    """Process-wide registry of grid cells keyed by snapped coordinates."""
+
+    def __init__(self) -> None:
+        self._cells: Dict[str, GridCell] = {}
+
+    def cell_for(
+        self,
+        latitude: float,
+        longitude: float,
+        tolerance: float = DEFAULT_GRID_TOLERANCE,
+        member: Optional[str] = None,
+    ) -> GridCell:
+        """Return (creating if needed) the cell containing a location, registering `member`."""
+        lat, lon = snap_location(latitude, longitude, tolerance)
+        key = f"{lat}_{lon}"
+        cell = self._cells.get(key)
+        if cell is None:
+            cell = self._cells[key] = GridCell(key=key, latitude=lat, longitude=lon)
+        if member:
+            cell.members.add(member)
+        return cell
+
+    def get(self, key: str) -> Optional[GridCell]:
+        return self._cells.get(key)
+
+    def release(self, member: str) -> None:
+        """Remove `member` from all cells and drop cells nobody uses anymore."""
+        for key in list(self._cells):
+            cell = self._cells[key]
+            cell.members.discard(member)
+            cell.member_values.pop(member, None)
+            if not cell.members:
+                del self._cells[key]
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-cell hit statistics keyed by cell key."""
+        return {key: cell.as_dict() for key, cell in self._cells.items()}
+
+    def stats_for(self, member: str) -> List[Dict[str, Any]]:
+        """Return hit statistics for the cells `member` belongs to."""
+        return [cell.as_dict() for cell in self._cells.values() if member in cell.members]
+
+
+GRID_CELLS = GridCellRegistry()
@@ -0,0 +1,223 @@
+"""Integration-wide budget and concurrency limit for outbound Open-Meteo requests.
+
+REQUEST_BUDGET limits concurrent requests, spreads them over the minute and hour
+windows in priority order (see request_priority) and raises RequestBudgetExceeded
+once the daily limit, or for hidden entries the BUDGET_VISIBLE_RESERVE, is reached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional, Tuple
+
+from ..const import (
+    BUDGET_VISIBLE_RESERVE,
+    OPEN_METEO_DAY_LIMIT,
+    OPEN_METEO_HOUR_LIMIT,
+    OPEN_METEO_MAX_CONCURRENT,
+    OPEN_METEO_MINUTE_LIMIT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# (hidden: 0 visible / 1 hidden, -staleness seconds); lower sorts first
+Priority = Tuple[int, float]
+
+# Requests not tied to an entry (e.g. model metadata)
+DEFAULT_PRIORITY: Priority = (1, 0.0)
+
+
+def request_priority(visible: bool, staleness_seconds: Optional[float]) -> Priority:
+    """Priority of a request: visible entries first, then the oldest data first (None: no data)."""
+    staleness = 1e12 if staleness_seconds is None else max(float(staleness_seconds), 0.0)
+    return (0 if visible else 1, -staleness)
+
+
+def call_weight(locations: int = 1, variables: int = 1, days: int = 7) -> int:
+    """Return how many API calls Open-Meteo counts for one request."""
+    return max(int(locations), 1) * max(math.ceil(variables / 10), 1) * max(math.ceil(days / 14), 1)
+
+
+class RequestBudgetExceeded(RuntimeError):
+    """Raised instead of sending a request the daily budget cannot cover."""
+
+
+class RequestBudget:
+    """Rolling call counters plus a priority-ordered concurrency limiter."""
+
+    def __init__(
+        self,
+        max_concurrent: int = OPEN_METEO_MAX_CONCURRENT,
+        minute_limit: int = OPEN_METEO_MINUTE_LIMIT,
+        hour_limit: int = OPEN_METEO_HOUR_LIMIT,
+        day_limit: int = OPEN_METEO_DAY_LIMIT,
+        visible_reserve: float = BUDGET_VISIBLE_RESERVE,
+    ) -> None:
+        self.max_concurrent = max(int(max_concurrent), 1)
+        self.minute_limit = int(minute_limit)
+        self.hour_limit = int(hour_limit)
+        self.day_limit = int(day_limit)
+        self.visible_reserve = float(visible_reserve)
+        self._active = 0
+        self._queue: List[Tuple[Priority, int]] = []
+        self._seq = itertools.count()
+        self._changed: Optional[asyncio.Event] = None
+        # (unix time, weight, endpoint) of the calls of the last hour
+        self._calls: Deque[Tuple[float, int, str]] = deque()
+        self._day: Optional[str] = None
+        self._day_calls: Dict[str, int] = {}
+        self.delayed = 0
+        self.rejected = 0
+        self.max_queued = 0
+        self._listeners: List[Callable[[], None]] = []
+
+    # -----------------------
+    # Acquire / release
+    # -----------------------
+    @asynccontextmanager
+    async def slot(self, endpoint: str, weight: int = 1, priority: Priority = DEFAULT_PRIORITY) -> AsyncIterator[None]:
+        """Hold one request slot for `endpoint` while the body runs."""
+        await self._acquire(endpoint, weight, priority)
+        try:
+            yield
+        finally:
+            self._active -= 1
+            self._notify()
+
+    async def _acquire(self, endpoint: str, weight: int, priority: Priority) -> None:
+        weight = min(max(int(weight), 1), self.minute_limit)
+        now = time.time()
+        self._roll(now)
+        day_used = sum(self._day_calls.values())
+        day_cap = self.day_limit if priority[0] == 0 else self.day_limit * (1 - self.visible_reserve)
+        if day_used + weight > day_cap:
+            self.rejected += 1
+            self._call_listeners()
+            raise RequestBudgetExceeded(
+                f"Open-Meteo daily budget used ({day_used}/{self.day_limit} calls); not requesting {endpoint}"
+            )
+
+        ticket = (priority, next(self._seq))
+        heapq.heappush(self._queue, ticket)
+        self.max_queued = max(self.max_queued, len(self._queue))
+        waited = False
+        try:
+            while True:
+                now = time.time()
+                self._roll(now)
+                delay: Optional[float] = None
+                if self._queue[0] == ticket and self._active < self.max_concurrent:
+                    delay = self._window_delay(now, weight)
+                    if delay <= 0:
+                        break
+                waited = True
+                event = self._event()
+                try:
+                    await asyncio.wait_for(event.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            self._queue.remove(ticket)
+            heapq.heapify(self._queue)
+            self._notify()
+            raise
+
+        heapq.heappop(self._queue)
+        self._active += 1
+        self._calls.append((now, weight, endpoint))
+        self._day_calls[endpoint] = self._day_calls.get(endpoint, 0) + weight
+        if waited:
+            self.delayed += 1
+        # The next waiter may be allowed in as well
+        self._notify()
+        self._call_listeners()
+
+    def _event(self) -> asyncio.Event:
+        if self._changed is None:
+            self._changed = asyncio.Event()
+        return self._changed
+
+    def _notify(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+            self._changed = None
+
+    # -----------------------
+    # Listeners
+    # -----------------------
+    def add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call `listener` whenever a call is recorded or rejected; returns a callback that removes it."""
+        self._listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+        return _remove
+
+    def _call_listeners(self) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener()
+            except Exception:
+                _LOGGER.exception("Request budget listener failed")
+
+    # -----------------------
+    # Windows
+    # -----------------------
+    def _roll(self, now: float) -> None:
+        while self._calls and self._calls[0][0] <= now - 3600:
+            self._calls.popleft()
+        day = datetime.fromtimestamp(now, tz=timezone.utc).date().isoformat()
+        if day != self._day:
+            self._day = day
+            self._day_calls = {}
+
+    def _window_delay(self, now: float, weight: int) -> float:
+        """Seconds until the minute and hour windows both have room for `weight` calls."""
+        delay = 0.0
+        for span, limit in ((60.0, self.minute_limit), (3600.0, self.hour_limit)):
+            in_window = [(t, w) for t, w, _ in self._calls if t > now - span]
+            excess = sum(w for _, w in in_window) + weight - limit
+            for t, w in in_window:
+                if excess <= 0:
+                    break
+                excess -= w
+                delay = max(delay, t + span - now)
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        self._roll(now)
+        by_endpoint: Dict[str, Dict[str, int]] = {}
+        for t, w, endpoint in self._calls:
+            counts = by_endpoint.setdefault(endpoint, {"minute": 0, "hour": 0, "day": 0})
+            counts["hour"] += w
+            if t > now - 60:
+                counts["minute"] += w
+        for endpoint, day_count in self._day_calls.items():
+            by_endpoint.setdefault(endpoint, {"minute": 0, "hour": 0, "day": 0})["day"] = day_count
+        return {
+            "day": self._day,
+            "calls_today": sum(self._day_calls.values()),
+            "calls_last_hour": sum(w for _, w, _ in self._calls),
+            "calls_last_minute": sum(w for t, w, _ in self._calls if t > now - 60),
+            "limits": {"minute": self.minute_limit, "hour": self.hour_limit, "day": self.day_limit},
+            "in_flight": self._active,
+            "queued": len(self._queue),
+            "max_queued": self.max_queued,
+            "delayed": self.delayed,
+            "rejected": self.rejected,
+            "endpoints": by_endpoint,
+        }
+
+
+REQUEST_BUDGET = RequestBudget()
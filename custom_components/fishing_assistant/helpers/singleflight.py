@@ -0,0 +1,53 @@
+"""In-flight request coalescing ("single flight") for async fetches.
+
+Concurrent callers for the same key await one task; nothing is cached after it finishes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """Deduplicate concurrent async calls by key."""
+
+    def __init__(self) -> None:
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `fn()` for `key`, or join the call already in flight for it.
+
+        The shared task is shielded: a cancelled waiter does not cancel the fetch
+        for the other waiters.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._on_done(k, t))
+        else:
+            self.coalesced += 1
+            _LOGGER.debug("Joining in-flight fetch for %s", key)
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Return True while a fetch for `key` is running."""
+        return key in self._inflight
+
+    def stats(self) -> Dict[str, int]:
+        """Return started vs coalesced call counts."""
+        return {"calls": self.calls, "coalesced": self.coalesced, "in_flight": len(self._inflight)}
@@ -0,0 +1,517 @@
+"""Columnar hourly series for Open-Meteo data.
+
+HourlySeries keeps one UTC time axis and one float array per variable (NaN for
+missing values); per-hour dicts are only built through row()/rows().
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+NAN = float("nan")
+
+# Canonical column names (and aliases) read by the weather summaries below
+TEMPERATURE_KEYS = ("temperature_2m", "temp", "air_temperature")
+WIND_SPEED_KEYS = ("wind_speed_10m", "windspeed_10m", "wind_speed")
+WIND_GUST_KEYS = ("wind_gust_10m", "wind_gust", "windgusts_10m", "wind_gusts_10m", "wind_gust_kph")
+CLOUD_KEYS = ("cloudcover", "cloud_cover", "clouds")
+PRECIP_KEYS = ("precipitation", "rain", "precip", "rain_sum")
+PRESSURE_KEYS = ("pressure_msl", "pressure")
+
+
+def _to_float(value: Any) -> float:
+    """Coerce a raw Open-Meteo cell to float; None, empty, "nan" and non-numeric become NaN."""
+    if value is None or isinstance(value, bool):
+        return NAN
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            return NAN
+    return NAN
+
+
+def _to_epoch(value: Any) -> Optional[int]:
+    """Parse a time cell to UTC epoch seconds (naive values are treated as UTC)."""
+    if value is None:
+        return None
+    try:
+        parsed = value if isinstance(value, datetime) else dt_util.parse_datetime(str(value))
+        if parsed is None:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return int(parsed.timestamp())
+    except Exception:
+        _LOGGER.debug("Failed to parse time value: %s", value, exc_info=True)
+        return None
+
+
+def _regular_axis(raw_times: List[Any]) -> Optional[Tuple[int, int]]:
+    """Return (start, step) epoch seconds when `raw_times` is a strictly hourly axis, else None.
+
+    Only three timestamps are parsed. The rest are checked as strings: all share the
+    first one's length and its minutes/offset suffix and increase strictly, so n
+    distinct whole-hour stamps spanning exactly n-1 hours must be consecutive hours.
+    """
+    n = len(raw_times)
+    if n < 2 or not all(isinstance(t, str) for t in raw_times):
+        return None
+    start = _to_epoch(raw_times[0])
+    second = _to_epoch(raw_times[1])
+    last = _to_epoch(raw_times[-1])
+    if start is None or second is None or last is None:
+        return None
+    step = second - start
+    if step != 3600 or last - start != step * (n - 1):
+        return None
+
+    first = raw_times[0]
+    length = len(first)
+    suffix = first[13:]  # ":MM" plus any seconds/offset after the hour
+    prev = None
+    for t in raw_times:
+        if len(t) != length or t[13:] != suffix or (prev is not None and t <= prev):
+            return None
+        prev = t
+    return start, step
+
+
+def _iso(epoch: int) -> str:
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class HourlySeries:
+    """Time axis of epoch seconds plus float columns keyed by canonical variable name."""
+
+    __slots__ = ("times", "columns", "axis_start", "axis_step")
+
+    def __init__(
+        self,
+        times: array,
+        columns: Dict[str, array],
+        axis_start: Optional[int] = None,
+        axis_step: Optional[int] = None,
+    ) -> None:
+        self.times = times
+        self.columns = columns
+        self.axis_start = axis_start
+        self.axis_step = axis_step
+        if axis_start is None and len(times) >= 2:
+            step = times[1] - times[0]
+            if step > 0 and all(times[i + 1] - times[i] == step for i in range(len(times) - 1)):
+                self.axis_start, self.axis_step = times[0], step
+
+    @property
+    def is_regular(self) -> bool:
+        return self.axis_step is not None
+
+    # -----------------------
+    # Construction
+    # -----------------------
+    @classmethod
+    def empty(cls) -> "HourlySeries":
+        return cls(array("q"), {})
+
+    @classmethod
+    def from_hourly_arrays(cls, *sources: Mapping[str, List[Any]]) -> "HourlySeries":
+        """Build a series from one or more canonical-keyed `hourly` dicts.
+
+        The first source with a `time` array defines the axis; later sources only
+        fill values that are still missing (weather wins over marine). Rows with an
+        unparseable time are dropped. Without any time axis a single row stamped
+        "now" is built from the first value of each variable.
+        """
+        raw_times: List[Any] = []
+        for src in sources:
+            if src and src.get("time"):
+                raw_times = list(src["time"])
+                break
+
+        keys: List[str] = []
+        for src in sources:
+            for k in src or {}:
+                if k != "time" and k not in keys:
+                    keys.append(k)
+
+        if not raw_times:
+            if not keys:
+                return cls.empty()
+            now = int(datetime.now(timezone.utc).timestamp())
+            columns = {}
+            for k in keys:
+                vals = next((src[k] for src in sources if src and src.get(k) is not None), None)
+                first = vals[0] if isinstance(vals, list) and vals else vals
+                columns[k] = array("d", [_to_float(first)])
+            return cls(array("q", [now]), columns)
+
+        axis = _regular_axis(raw_times)
+        if axis is not None:
+            axis_start, axis_step = axis
+            keep: List[int] = list(range(len(raw_times)))
+            times = array("q", range(axis_start, axis_start + axis_step * len(raw_times), axis_step))
+        else:
+            # Irregular axis: fall back to parsing every timestamp
+            axis_start = axis_step = None
+            keep = []
+            times = array("q")
+            for idx, raw in enumerate(raw_times):
+                epoch = _to_epoch(raw)
+                if epoch is None:
+                    _LOGGER.debug("Unparseable/missing time at index %d raw=%s", idx, raw)
+                    continue
+                keep.append(idx)
+                times.append(epoch)
+
+        expected = len(raw_times)
+        columns: Dict[str, array] = {}
+        for k in keys:
+            col = array("d", [NAN]) * len(keep)
+            for src in sources:
+                vals = (src or {}).get(k)
+                if vals is None:
+                    continue
+                if not isinstance(vals, list):
+                    # Scalar -> broadcast
+                    vals = [vals] * expected
+                elif len(vals) != expected:
+                    _LOGGER.debug(
+                        "Open-Meteo variable '%s' has length %d but expected %d (times length).",
+                        k,
+                        len(vals),
+                        expected,
+                    )
+                n = len(vals)
+                for out_idx, src_idx in enumerate(keep):
+                    if src_idx < n and math.isnan(col[out_idx]):
+                        col[out_idx] = _to_float(vals[src_idx])
+            columns[k] = col
+        return cls(times, columns, axis_start, axis_step)
+
+    @classmethod
+    def from_storage(cls, data: Mapping[str, Any]) -> "HourlySeries":
+        """Rebuild a series from the JSON-safe dict produced by to_storage()."""
+        step = data.get("step")
+        if step:
+            start = int(data["start"])
+            times = array("q", range(start, start + int(step) * int(data["length"]), int(step)))
+        else:
+            times = array("q", (int(t) for t in data.get("times") or []))
+        columns: Dict[str, array] = {}
+        for name, values in (data.get("columns") or {}).items():
+            col = array("d", (_to_float(v) for v in values))
+            if len(col) != len(times):
+                raise ValueError(f"Stored column '{name}' does not match the time axis")
+            columns[name] = col
+        return cls(times, columns)
+
+    def to_storage(self) -> Dict[str, Any]:
+        """Return a JSON-safe dict (NaN as None, regular axes as start/step/length)."""
+        data: Dict[str, Any] = {}
+        if self.is_regular:
+            data.update(start=self.axis_start, step=self.axis_step, length=len(self.times))
+        else:
+            data["times"] = list(self.times)
+        data["columns"] = {
+            name: [None if math.isnan(v) else v for v in col] for name, col in self.columns.items()
+        }
+        return data
+
+    # -----------------------
+    # Access
+    # -----------------------
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __bool__(self) -> bool:
+        return len(self.times) > 0
+
+    def column(self, *names: str) -> Optional[array]:
+        """Return the first existing column among `names` (aliases), or None."""
+        for name in names:
+            col = self.columns.get(name)
+            if col is not None:
+                return col
+        return None
+
+    def has_values(self, name: str) -> bool:
+        """Return True when column `name` holds at least one non-missing value."""
+        col = self.columns.get(name)
+        return col is not None and any(not math.isnan(v) for v in col)
+
+    def value(self, name: str, idx: int) -> Optional[float]:
+        """Return the value of `name` at row `idx` (None when missing)."""
+        col = self.columns.get(name)
+        if col is None or idx < 0 or idx >= len(col):
+            return None
+        v = col[idx]
+        return None if math.isnan(v) else v
+
+    def epoch_at(self, idx: int) -> int:
+        """Return the epoch seconds of row `idx` (negative indexes count from the end)."""
+        if self.axis_step is not None:
+            if idx < 0:
+                idx += len(self.times)
+            return self.axis_start + idx * self.axis_step
+        return self.times[idx]
+
+    def time_at(self, idx: int) -> datetime:
+        return datetime.fromtimestamp(self.epoch_at(idx), tz=timezone.utc)
+
+    @property
+    def start(self) -> Optional[datetime]:
+        return self.time_at(0) if self.times else None
+
+    @property
+    def end(self) -> Optional[datetime]:
+        return self.time_at(len(self.times) - 1) if self.times else None
+
+    def index_at_or_before(self, when: datetime) -> int:
+        """Return the index of the last row at or before `when` (-1 if `when` precedes the series)."""
+        ts = when.timestamp()
+        if self.axis_step is not None:
+            if ts < self.axis_start:
+                return -1
+            return min(int((ts - self.axis_start) // self.axis_step), len(self.times) - 1)
+        return bisect_right(self.times, int(ts)) - 1
+
+    def index_of(self, when: datetime) -> Optional[int]:
+        """Return the index of the row stamped exactly `when`, or None."""
+        idx = self.index_at_or_before(when)
+        if idx >= 0 and self.epoch_at(idx) == when.timestamp():
+            return idx
+        return None
+
+    def nearest_index(self, when: datetime) -> int:
+        """Return the index of the row closest to `when` (-1 for an empty series)."""
+        n = len(self.times)
+        if n == 0:
+            return -1
+        idx = max(self.index_at_or_before(when), 0)
+        if idx + 1 < n and abs(self.epoch_at(idx + 1) - when.timestamp()) < abs(self.epoch_at(idx) - when.timestamp()):
+            return idx + 1
+        return idx
+
+    # -----------------------
+    # Row views (edges only)
+    # -----------------------
+    def row(self, idx: int) -> Dict[str, Any]:
+        """Return row `idx` as a dict in the per-hour normalization contract."""
+        out: Dict[str, Any] = {"time": _iso(self.times[idx])}
+        for k, col in self.columns.items():
+            v = col[idx]
+            out[k] = None if math.isnan(v) else v
+        return out
+
+    def rows(self) -> List[Dict[str, Any]]:
+        return [self.row(i) for i in range(len(self.times))]
+
+    def splice(self, update: "HourlySeries") -> Tuple["HourlySeries", int]:
+        """Return a copy with the rows `update` covers replaced by its values, plus the rows changed.
+
+        The axis of this series is kept: rows of `update` outside it are ignored.
+        Missing (NaN) values in `update` leave the existing value in place, so a
+        short-horizon fetch without marine data keeps the cached marine columns.
+        """
+        rows = [(i, self.index_of(update.time_at(i))) for i in range(len(update))]
+        rows = [(i, j) for i, j in rows if j is not None]
+        n = len(self.times)
+        columns = {name: array("d", col) for name, col in self.columns.items()}
+        changed = set()
+        for name, src in update.columns.items():
+            col = columns.setdefault(name, array("d", [NAN]) * n)
+            for i, j in rows:
+                value = src[i]
+                if math.isnan(value) or value == col[j]:
+                    continue
+                col[j] = value
+                changed.add(j)
+        return HourlySeries(self.times, columns, self.axis_start, self.axis_step), len(changed)
+
+    def with_columns_from(self, other: "HourlySeries", names: Iterable[str]) -> "HourlySeries":
+        """Return a copy whose columns `names` come from `other`, aligned by time (NaN where it has no row)."""
+        rows = [other.index_of(self.time_at(i)) for i in range(len(self.times))]
+        columns = dict(self.columns)
+        for name in names:
+            src = other.columns.get(name)
+            if src is not None:
+                columns[name] = array("d", (NAN if j is None else src[j] for j in rows))
+        return HourlySeries(self.times, columns, self.axis_start, self.axis_step)
+
+    def to_hourly_arrays(self, names: Iterable[str]) -> Dict[str, List[Any]]:
+        """Return Open-Meteo style `hourly` arrays (ISO times, None for missing) for `names`."""
+        out: Dict[str, List[Any]] = {"time": [_iso(t) for t in self.times]}
+        n = len(self.times)
+        for name in names:
+            col = self.columns.get(name)
+            out[name] = [None] * n if col is None else [None if math.isnan(v) else v for v in col]
+        return out
+
+    def interpolate(self, when: datetime) -> Optional[Dict[str, Any]]:
+        """Linearly interpolate every column at `when`.
+
+        Numeric values are interpolated between the two rows bracketing `when`
+        (columns named "*direction*" take the shortest way round the circle); a
+        value missing on one side takes the other side's value. Outside the series
+        range the first/last row is returned unchanged.
+        """
+        n = len(self.times)
+        if n == 0:
+            return None
+        i = self.index_at_or_before(when)
+        if i < 0:
+            return self.row(0)
+        ts = when.timestamp()
+        if i >= n - 1 or self.epoch_at(i) == ts:
+            return self.row(i)
+
+        t_a, t_b = self.epoch_at(i), self.epoch_at(i + 1)
+        span = t_b - t_a
+        frac = (ts - t_a) / span if span > 0 else 0.0
+
+        out: Dict[str, Any] = {"time": when.strftime("%Y-%m-%dT%H:%M:%SZ")}
+        for k, col in self.columns.items():
+            a, b = col[i], col[i + 1]
+            if math.isnan(a) or math.isnan(b):
+                nearer, other = (a, b) if frac < 0.5 else (b, a)
+                v = other if math.isnan(nearer) else nearer
+                out[k] = None if math.isnan(v) else v
+            elif "direction" in k:
+                delta = ((b - a + 180.0) % 360.0) - 180.0
+                out[k] = (a + delta * frac) % 360.0
+            else:
+                out[k] = a + (b - a) * frac
+        return out
+
+    def day_slices(self, tz: timezone = timezone.utc) -> List[Tuple[str, int, int]]:
+        """Return (iso_date, start, stop) index ranges of consecutive rows per calendar day."""
+        n = len(self.times)
+        if tz is timezone.utc and self.axis_step is not None:
+            # Regular UTC axis: each day ends at the first index past the next midnight
+            out_regular: List[Tuple[str, int, int]] = []
+            lo = 0
+            while lo < n:
+                t_lo = self.epoch_at(lo)
+                day_start = t_lo - t_lo % 86400
+                hi = min(lo + -(-(day_start + 86400 - t_lo) // self.axis_step), n)
+                out_regular.append((datetime.fromtimestamp(day_start, tz=tz).date().isoformat(), lo, hi))
+                lo = hi
+            return out_regular
+
+        out: List[Tuple[str, int, int]] = []
+        start = 0
+        current: Optional[str] = None
+        for idx, t in enumerate(self.times):
+            day = datetime.fromtimestamp(t, tz=tz).date().isoformat()
+            if day != current:
+                if current is not None:
+                    out.append((current, start, idx))
+                current, start = day, idx
+        if current is not None:
+            out.append((current, start, len(self.times)))
+        return out
+
+
+# -----------------------
+# Weather summaries shared by the adapter and WeatherFetcher
+# -----------------------
+def current_weather_from_series(series: HourlySeries, when: datetime) -> Optional[Dict[str, Any]]:
+    """Interpolate the series at `when` and return the integration's current-weather shape.
+
+    Wind values are converted from m/s to km/h.
+    """
+    best = series.interpolate(when) if series else None
+    if not best:
+        return None
+    return current_weather_from_values(best)
+
+
+def current_weather_from_values(values: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return the integration's current-weather shape for one set of canonical values.
+
+    Used for an interpolated series row and for Open-Meteo's `current` block alike.
+    Wind values are converted from m/s to km/h.
+    """
+
+    def pick(keys: Tuple[str, ...]) -> Optional[float]:
+        for k in keys:
+            if values.get(k) is not None:
+                return values[k]
+        return None
+
+    temp = pick(TEMPERATURE_KEYS)
+    wind_ms = pick(WIND_SPEED_KEYS)
+    gust_ms = pick(WIND_GUST_KEYS)
+    cloud = pick(CLOUD_KEYS)
+    precip = pick(PRECIP_KEYS)
+    pressure = pick(PRESSURE_KEYS)
+
+    wind_speed = wind_ms * 3.6 if wind_ms is not None else None
+    if gust_ms is not None:
+        wind_gust = gust_ms * 3.6
+    else:
+        wind_gust = wind_speed * 1.2 if wind_speed else None
+
+    return {
+        "temperature": temp,
+        "wind_speed": wind_speed,
+        "wind_gust": wind_gust,
+        "cloud_cover": int(round(cloud)) if cloud is not None else None,
+        "precipitation_probability": 100 if (precip is not None and precip > 0) else 0,
+        "pressure": pressure,
+    }
+
+
+def daily_weather_from_series(series: HourlySeries, days: int) -> Dict[str, Dict[str, Any]]:
+    """Aggregate the series into per-day weather summaries keyed by UTC ISO date.
+
+    temperature/wind/cloud/pressure are means over the day's rows, wind_gust is the
+    maximum gust (or 1.2 x mean wind when the model has no gusts) and
+    precipitation_probability is the share of rows with precipitation. cloud_cover
+    is None when the series was requested without cloud cover.
+    """
+    temp_col = series.column(*TEMPERATURE_KEYS)
+    wind_col = series.column(*WIND_SPEED_KEYS)
+    gust_col = series.column(*WIND_GUST_KEYS)
+    cloud_col = series.column(*CLOUD_KEYS)
+    precip_col = series.column(*PRECIP_KEYS)
+    pressure_col = series.column(*PRESSURE_KEYS)
+
+    def total(col: Optional[array], lo: int, hi: int) -> float:
+        if col is None:
+            return 0.0
+        return sum(v for v in col[lo:hi] if not math.isnan(v))
+
+    final: Dict[str, Dict[str, Any]] = {}
+    for day, lo, hi in series.day_slices()[: max(int(days), 0)]:
+        cnt = hi - lo
+        avg_wind = total(wind_col, lo, hi) * 3.6 / cnt
+        gust = 0.0
+        if gust_col is not None:
+            gust = max((v * 3.6 for v in gust_col[lo:hi] if not math.isnan(v)), default=0.0)
+        if not gust:
+            gust = avg_wind * 1.2
+        precip_hours = 0
+        if precip_col is not None:
+            precip_hours = sum(1 for v in precip_col[lo:hi] if not math.isnan(v) and v > 0)
+
+        final[day] = {
+            "temperature": total(temp_col, lo, hi) / cnt,
+            "wind_speed": avg_wind,
+            "wind_gust": gust,
+            "cloud_cover": int(round(total(cloud_col, lo, hi) / cnt)) if cloud_col is not None else None,
+            "precipitation_probability": int(round(precip_hours / cnt * 100)),
+            "pressure": total(pressure_col, lo, hi) / cnt,
+        }
+    return final
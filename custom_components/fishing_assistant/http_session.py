@@ -0,0 +1,146 @@
+"""Shared, pooled HTTP session for Fishing Assistant.
+
+All Open-Meteo requests go through one keep-alive aiohttp session per Home
+Assistant instance, with per-host connection limits and reuse counters.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+import aiohttp
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# hass.data[DOMAIN] key holding the _SessionHolder
+DATA_HTTP_SESSION = "http_session"
+
+# Connection pool sizing. Open-Meteo is served from a handful of hosts; a small
+# per-host limit keeps bursts polite while keep-alive avoids repeated handshakes.
+LIMIT_TOTAL = 16
+LIMIT_PER_HOST = 4
+KEEPALIVE_TIMEOUT = 90  # seconds an idle connection is kept open
+DNS_CACHE_TTL = 300  # seconds
+
+
+@dataclass
+class HttpSessionStats:
+    """Connection-level counters collected through aiohttp tracing."""
+
+    requests: int = 0
+    request_errors: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    connections_queued: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return counters plus the derived connection reuse ratio."""
+        data: Dict[str, Any] = asdict(self)
+        total = self.connections_created + self.connections_reused
+        data["reuse_ratio"] = round(self.connections_reused / total, 3) if total else None
+        return data
+
+
+@dataclass
+class _SessionHolder:
+    session: aiohttp.ClientSession
+    stats: HttpSessionStats
+
+
+def _build_trace_config(stats: HttpSessionStats) -> aiohttp.TraceConfig:
+    """Create a TraceConfig that updates `stats` in place."""
+    trace = aiohttp.TraceConfig()
+
+    async def _on_request_start(session, ctx, params):
+        stats.requests += 1
+
+    async def _on_request_exception(session, ctx, params):
+        stats.request_errors += 1
+
+    async def _on_connection_create_end(session, ctx, params):
+        stats.connections_created += 1
+
+    async def _on_connection_reuseconn(session, ctx, params):
+        stats.connections_reused += 1
+
+    async def _on_connection_queued_start(session, ctx, params):
+        stats.connections_queued += 1
+
+    async def _on_dns_cache_hit(session, ctx, params):
+        stats.dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(session, ctx, params):
+        stats.dns_cache_misses += 1
+
+    trace.on_request_start.append(_on_request_start)
+    trace.on_request_exception.append(_on_request_exception)
+    trace.on_connection_create_end.append(_on_connection_create_end)
+    trace.on_connection_reuseconn.append(_on_connection_reuseconn)
+    trace.on_connection_queued_start.append(_on_connection_queued_start)
+    trace.on_dns_cache_hit.append(_on_dns_cache_hit)
+    trace.on_dns_cache_miss.append(_on_dns_cache_miss)
+    return trace
+
+
+def _ssl_context() -> Any:
+    """Return Home Assistant's shared client SSL context when available."""
+    try:
+        from homeassistant.util.ssl import client_context
+
+        return client_context()
+    except Exception:
+        _LOGGER.debug("Home Assistant SSL context unavailable; using aiohttp default", exc_info=True)
+        return True
+
+
+@callback
+def async_get_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the integration-wide pooled session, creating it on first use.
+
+    The session is closed when Home Assistant shuts down.
+    """
+    store = hass.data.setdefault(DOMAIN, {})
+    holder: Optional[_SessionHolder] = store.get(DATA_HTTP_SESSION)
+    if holder is not None and not holder.session.closed:
+        return holder.session
+
+    stats = holder.stats if holder is not None else HttpSessionStats()
+    connector = aiohttp.TCPConnector(
+        limit=LIMIT_TOTAL,
+        limit_per_host=LIMIT_PER_HOST,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        ssl=_ssl_context(),
+    )
+    session = aiohttp.ClientSession(connector=connector, trace_configs=[_build_trace_config(stats)])
+    store[DATA_HTTP_SESSION] = _SessionHolder(session=session, stats=stats)
+
+    async def _async_close(_event: Event) -> None:
+        _LOGGER.debug("Closing Fishing Assistant HTTP session; stats=%s", stats.as_dict())
+        await session.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    _LOGGER.debug(
+        "Created pooled HTTP session (limit=%s, limit_per_host=%s, keepalive=%ss)",
+        LIMIT_TOTAL,
+        LIMIT_PER_HOST,
+        KEEPALIVE_TIMEOUT,
+    )
+    return session
+
+
+@callback
+def async_get_session_stats(hass: HomeAssistant) -> Dict[str, Any]:
+    """Return connection reuse metrics for the pooled session (empty before first use)."""
+    holder: Optional[_SessionHolder] = (hass.data.get(DOMAIN) or {}).get(DATA_HTTP_SESSION)
+    if holder is None:
+        return {}
+    return holder.stats.as_dict()
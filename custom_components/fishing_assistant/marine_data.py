@@ -3,219 +3,242 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional
+import math
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
 
 import aiohttp
 from homeassistant.util import dt as dt_util
 
-from .const import OPEN_METEO_MARINE_URL
+from .api import OpenMeteoHTTPError, is_upstream_failure, normalize_hourly_series
+from .const import DEFAULT_GRID_TOLERANCE, OPEN_METEO_MARINE_URL
 from .data_formatter import DataFormatter
+from .helpers.cache import CACHE, NS_MARINE
+from .helpers.circuit_breaker import BREAKERS
+from .helpers.request_budget import REQUEST_BUDGET, call_weight
+from .helpers.grid import GRID_CELLS
+from .helpers.singleflight import SingleFlight
+from .hourly_series import HourlySeries
+from .http_session import async_get_session
+from .persistent_cache import get_persistent_cache
+from .variable_planner import RequestInputs
 
 _LOGGER = logging.getLogger(__name__)
 
-# Default cache TTL (seconds)
+# Default cache TTL (seconds); matches the NS_MARINE policy of helpers.cache
 _DEFAULT_CACHE_TTL = 3600  # 1 hour
 
+# In-flight marine API fetches keyed by location, shared by all fetcher instances
+_INFLIGHT = SingleFlight()
+
+# Hourly columns of the current snapshot (all exposed as sensor attributes)
+_CURRENT_COLUMNS = (
+    "wave_height",
+    "wave_period",
+    "wave_direction",
+    "wind_wave_height",
+    "wind_wave_period",
+    "swell_wave_height",
+    "swell_wave_period",
+)
+# Hourly columns the daily forecast aggregates
+_DAILY_COLUMNS = ("wave_height", "wave_period", "wind_wave_height", "swell_wave_height")
+# Every marine variable the fetcher reads
+_MARINE_COLUMNS = tuple(dict.fromkeys(_CURRENT_COLUMNS + _DAILY_COLUMNS))
+
 
 class MarineDataFetcher:
     """Fetch marine weather data (current + forecast) from Open-Meteo."""
 
-    def __init__(self, hass, latitude: float, longitude: float, cache_ttl: int = _DEFAULT_CACHE_TTL):
+    @classmethod
+    def required_inputs(cls) -> RequestInputs:
+        """Return the marine variables the current snapshot and daily aggregates are built from."""
+        return RequestInputs.of(marine=_MARINE_COLUMNS)
+
+    def __init__(
+        self,
+        hass,
+        latitude: float,
+        longitude: float,
+        cache_ttl: int = _DEFAULT_CACHE_TTL,
+        hourly_source: Optional[Any] = None,
+        grid_tolerance: float = DEFAULT_GRID_TOLERANCE,
+        member: Optional[str] = None,
+    ):
         """Initialize the marine data fetcher."""
         self.hass = hass
         self.latitude = float(latitude or 0.0)
         self.longitude = float(longitude or 0.0)
-        self._last_fetch: Optional[datetime] = None
+        # Last data handed out; backs the synchronous getters below
         self._cache: Optional[Dict[str, Any]] = None
-        self._cache_ttl = int(cache_ttl)
+        self._cache_ttl = timedelta(seconds=int(cache_ttl))
+        self._hourly_source = hourly_source
+        self._source_stamp: Optional[datetime] = None
+        self._member = member
+        self._cell = GRID_CELLS.cell_for(self.latitude, self.longitude, grid_tolerance)
+        self._inflight_key = f"{self._cell.key}_marine"
+        self._persistent = get_persistent_cache(hass) if hourly_source is None else None
+        self._persist_key = f"marine:{self._cell.key}"
+        if self._persistent is not None and CACHE.peek(NS_MARINE, self._cell.key, allow_expired=True) is None:
+            entry = self._persistent.get(self._persist_key)
+            if entry is not None and isinstance(entry.data, dict):
+                CACHE.set(
+                    NS_MARINE,
+                    self._cell.key,
+                    entry.data,
+                    owner=member,
+                    stored_at=entry.fetched_at,
+                    ttl=self._cache_ttl,
+                )
 
     async def get_marine_data(self) -> Dict[str, Any]:
         """Return normalized marine data, using cache when fresh."""
         now = dt_util.now()
-        try:
-            if self._last_fetch and self._cache:
-                age = (now - self._last_fetch).total_seconds()
-                if age < self._cache_ttl:
-                    return self._cache
-        except Exception:
-            # Defensive: if time arithmetic fails, ignore cache
-            _LOGGER.debug("Cache check failed; will fetch new marine data", exc_info=True)
+        if self._hourly_source is not None:
+            # The adapter's merged series already holds required_inputs(); no marine request
+            return await self._get_marine_data_from_source(now)
+
+        # Fetched for the grid-cell centre: fetchers in the same cell share one cache entry
+        cached = CACHE.get(NS_MARINE, self._cell.key)
+        if cached is not None:
+            self._cell.record("marine", hit=True)
+            self._cache = cached
+            return cached
+        self._cell.record("marine", hit=False)
 
         try:
-            raw = await self._fetch_from_api()
+            raw = await _INFLIGHT.do(self._inflight_key, self._guarded_fetch)
             # Normalize into canonical shape using DataFormatter
             normalized = DataFormatter.format_marine_data(raw if isinstance(raw, dict) else {})
             # Attach metadata
             normalized.setdefault("source", "open-meteo")
             normalized.setdefault("last_updated", now.strftime("%Y-%m-%dT%H:%M:%SZ"))
             # Cache normalized form
-            self._cache = normalized
-            self._last_fetch = now
+            self._store(normalized)
+            # Persisted so it is available right after a restart
+            if self._persistent is not None:
+                self._persistent.set(self._persist_key, normalized, now)
             return normalized
         except Exception as exc:
+            last = CACHE.peek(NS_MARINE, self._cell.key, allow_expired=True)
+            if last is not None and last.value.get("source") != "unavailable":
+                # Keep serving the last real data (possibly loaded from disk), marked stale
+                _LOGGER.warning("Error fetching marine data from API; serving data from %s: %s", last.stored_at, exc)
+                stale = dict(last.value)
+                stale.setdefault("stale_since", now.isoformat())
+                self._store(stale)
+                return stale
             _LOGGER.exception("Error fetching marine data from API; returning fallback: %s", exc)
             fallback = self._get_fallback_data()
             # Ensure normalized fallback
             normalized = DataFormatter.format_marine_data(fallback)
             normalized.setdefault("source", fallback.get("source", "unavailable"))
             normalized.setdefault("last_updated", fallback.get("last_updated", dt_util.now().strftime("%Y-%m-%dT%H:%M:%SZ")))
+            self._store(normalized)
+            return normalized
+
+    def _store(self, data: Dict[str, Any]) -> None:
+        """Cache `data` for the whole grid cell for one TTL and remember it locally."""
+        CACHE.set(NS_MARINE, self._cell.key, data, owner=self._member, ttl=self._cache_ttl)
+        self._cache = data
+
+    async def _get_marine_data_from_source(self, now: datetime) -> Dict[str, Any]:
+        """Derive marine data from the shared hourly series; re-parse only when it was refetched."""
+        try:
+            hourly = await self._hourly_source.async_get_hourly_series()
+            stamp = getattr(self._hourly_source, "series_fetched_at", None)
+            if self._cache and stamp is not None and stamp == self._source_stamp:
+                return self._cache
+
+            if not hourly or not hourly.has_values("wave_height"):
+                # e.g. the marine request failed and the series is weather-only
+                raise ValueError("Hourly series contains no marine data")
+            raw = self._parse_marine_series(hourly)
+            normalized = DataFormatter.format_marine_data(raw)
+            normalized.setdefault("source", "open-meteo")
+            normalized.setdefault("last_updated", now.strftime("%Y-%m-%dT%H:%M:%SZ"))
+            self._cache = normalized
+            self._source_stamp = stamp
+            return normalized
+        except Exception as exc:
+            _LOGGER.exception("Error deriving marine data from hourly series; returning fallback: %s", exc)
+            fallback = self._get_fallback_data()
+            normalized = DataFormatter.format_marine_data(fallback)
+            normalized.setdefault("source", fallback.get("source", "unavailable"))
+            normalized.setdefault("last_updated", fallback.get("last_updated"))
+            # Do not pin the fallback to the series stamp so the next call retries
             self._cache = normalized
-            self._last_fetch = dt_util.now()
+            self._source_stamp = None
             return normalized
 
+    async def _guarded_fetch(self) -> Dict[str, Any]:
+        """Run _fetch_from_api through the marine circuit breaker and the request budget."""
+        # While the marine API is down this fails at once and get_marine_data serves the last data
+        breaker = BREAKERS.get(OPEN_METEO_MARINE_URL)
+        breaker.raise_if_open()
+        async with REQUEST_BUDGET.slot(OPEN_METEO_MARINE_URL, weight=call_weight(1, len(_MARINE_COLUMNS), 7)):
+            return await breaker.call(self._fetch_from_api, is_failure=is_upstream_failure)
+
     async def _fetch_from_api(self) -> Dict[str, Any]:
         """Fetch raw data from Open-Meteo Marine API and parse hourly arrays into a dict."""
         params = {
-            "latitude": self.latitude,
-            "longitude": self.longitude,
-            "hourly": ",".join(
-                [
-                    "wave_height",
-                    "wave_direction",
-                    "wave_period",
-                    "wind_wave_height",
-                    "wind_wave_direction",
-                    "wind_wave_period",
-                    "swell_wave_height",
-                    "swell_wave_direction",
-                    "swell_wave_period",
-                ]
-            ),
+            "latitude": self._cell.latitude,
+            "longitude": self._cell.longitude,
+            "hourly": ",".join(_MARINE_COLUMNS),
             "timezone": "UTC",
             "forecast_days": 7,
         }
 
         timeout = aiohttp.ClientTimeout(total=30)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(OPEN_METEO_MARINE_URL, params=params) as resp:
-                if resp.status != 200:
-                    text = await resp.text()[:1000]
-                    raise RuntimeError(f"Open-Meteo returned status {resp.status}: {text}")
-                data = await resp.json()
-                return self._parse_marine_data(data)
+        session = async_get_session(self.hass)
+        async with session.get(OPEN_METEO_MARINE_URL, params=params, timeout=timeout) as resp:
+            if resp.status != 200:
+                text = (await resp.text())[:1000]
+                raise OpenMeteoHTTPError(f"Open-Meteo returned status {resp.status}: {text}", resp.status)
+            data = await resp.json()
+            return self._parse_marine_data(data)
 
     def _parse_marine_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Parse the Open-Meteo response into a simple raw dict suitable for normalization.
+        """Parse a raw Open-Meteo marine response (see _parse_marine_series)."""
+        if not raw_data or not isinstance(raw_data, dict):
+            raise ValueError("Empty or invalid response from marine API")
+        return self._parse_marine_series(normalize_hourly_series(raw_data))
+
+    def _parse_marine_series(self, series: HourlySeries) -> Dict[str, Any]:
+        """Build a simple raw dict suitable for normalization from an hourly marine series.
 
         The returned dict will contain 'current' and 'forecast' keys. Timestamps in 'current'
         will be provided as ISO Z strings; forecast will be aggregated by date.
         """
-        if not raw_data or not isinstance(raw_data, dict):
-            raise ValueError("Empty or invalid response from marine API")
-
-        hourly = raw_data.get("hourly") or {}
-        times = hourly.get("time") or []
-
-        # Parse times into timezone-aware datetimes in UTC
-        parsed_times: List[datetime] = []
-        for t in times:
-            try:
-                dt = dt_util.parse_datetime(str(t))
-                if not dt:
-                    continue
-                if dt.tzinfo is None:
-                    # assume UTC if timezone missing
-                    dt = dt.replace(tzinfo=timezone.utc)
-                dt = dt_util.as_utc(dt)
-                parsed_times.append(dt)
-            except Exception:
-                # skip unparseable entries
-                continue
-
-        if not parsed_times:
+        if not series:
             raise ValueError("No parseable hourly times in marine API response")
 
-        now = dt_util.now()
-        # Find index of the latest time <= now (or 0 if all in future)
-        current_index = 0
-        try:
-            for i, t in enumerate(parsed_times):
-                if t <= now:
-                    current_index = i
-                else:
-                    break
-        except Exception:
-            current_index = 0
+        # Latest hour <= now (or 0 if all in future)
+        current_index = max(series.index_at_or_before(dt_util.now()), 0)
 
-        def _safe_get_list_value(lst: Any, idx: int):
-            if not isinstance(lst, list):
-                return None
-            if idx < 0 or idx >= len(lst):
-                return None
-            return lst[idx]
-
-        # Build current snapshot from hourly arrays (defensive)
-        current = {
-            "wave_height": _safe_get_list_value(hourly.get("wave_height"), current_index),
-            "wave_period": _safe_get_list_value(hourly.get("wave_period"), current_index),
-            "wave_direction": _safe_get_list_value(hourly.get("wave_direction"), current_index),
-            "wind_wave_height": _safe_get_list_value(hourly.get("wind_wave_height"), current_index),
-            "wind_wave_period": _safe_get_list_value(hourly.get("wind_wave_period"), current_index),
-            "swell_wave_height": _safe_get_list_value(hourly.get("swell_wave_height"), current_index),
-            "swell_wave_period": _safe_get_list_value(hourly.get("swell_wave_period"), current_index),
-            "timestamp": parsed_times[current_index].strftime("%Y-%m-%dT%H:%M:%SZ"),
-        }
+        # Build current snapshot from the hourly columns
+        current = {key: series.value(key, current_index) for key in _CURRENT_COLUMNS}
+        current["timestamp"] = series.time_at(current_index).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        # Aggregate daily forecast from hourly arrays
-        daily_buckets: Dict[str, Dict[str, List[float]]] = {}
-        # Keys we care about and their hourly names
-        mapping = {
-            "wave_height": "wave_height",
-            "wave_period": "wave_period",
-            "wind_wave_height": "wind_wave_height",
-            "swell_wave_height": "swell_wave_height",
-        }
+        def _safe_agg(col: Any, lo: int, hi: int) -> Dict[str, Optional[float]]:
+            values = [v for v in col[lo:hi] if not math.isnan(v)] if col is not None else []
+            if not values:
+                return {"min": None, "avg": None, "max": None}
+            return {"min": min(values), "avg": sum(values) / len(values), "max": max(values)}
 
-        # Iterate positions defensively
-        for idx, dt in enumerate(parsed_times):
-            date_key = dt.date().isoformat()
-            bucket = daily_buckets.setdefault(
-                date_key,
-                {"wave_height": [], "wave_period": [], "wind_wave_height": [], "swell_wave_height": []},
-            )
-
-            for out_key, hourly_key in mapping.items():
-                try:
-                    val = _safe_get_list_value(hourly.get(hourly_key), idx)
-                    if val is None:
-                        continue
-                    # Attempt numeric coercion
-                    try:
-                        fval = float(val)
-                    except Exception:
-                        continue
-                    bucket[out_key].append(fval)
-                except Exception:
-                    # Keep robust: ignore any errors parsing values
-                    continue
-
-        # Compute daily statistics
-        forecast: Dict[str, Any] = {}
-        for date_key, values in daily_buckets.items():
-            def _safe_agg(lst: List[float]) -> Dict[str, Optional[float]]:
-                if not lst:
-                    return {"min": None, "avg": None, "max": None}
-                try:
-                    mn = min(lst)
-                    mx = max(lst)
-                    avg = sum(lst) / len(lst)
-                    return {"min": mn, "avg": avg, "max": mx}
-                except Exception:
-                    return {"min": None, "avg": None, "max": None}
-
-            wave_h = _safe_agg(values.get("wave_height", []))
-            wave_p = _safe_agg(values.get("wave_period", []))
-            wind_wave_h = _safe_agg(values.get("wind_wave_height", []))
-            swell_h = _safe_agg(values.get("swell_wave_height", []))
+        # Aggregate daily forecast from the hourly columns
+        wave_h_col, wave_p_col, wind_wave_h_col, swell_h_col = (series.column(key) for key in _DAILY_COLUMNS)
 
+        forecast: Dict[str, Any] = {}
+        for date_key, lo, hi in series.day_slices():
+            wave_h = _safe_agg(wave_h_col, lo, hi)
             forecast[date_key] = {
                 "wave_height_max": wave_h["max"],
                 "wave_height_avg": wave_h["avg"],
                 "wave_height_min": wave_h["min"],
-                "wave_period_avg": wave_p["avg"],
-                "wind_wave_height_max": wind_wave_h["max"],
-                "swell_wave_height_max": swell_h["max"],
+                "wave_period_avg": _safe_agg(wave_p_col, lo, hi)["avg"],
+                "wind_wave_height_max": _safe_agg(wind_wave_h_col, lo, hi)["max"],
+                "swell_wave_height_max": _safe_agg(swell_h_col, lo, hi)["max"],
             }
 
         return {
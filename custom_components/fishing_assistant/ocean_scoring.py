@@ -33,8 +33,10 @@ from .const import (
     TIDE_MODE_PROXY,
 )
 from .species_loader import SpeciesLoader
-from .helpers.astro import calculate_astronomy_forecast
+from .helpers.astro import calculate_astronomy_forecast, sun_times_at
+from .helpers.cache import CACHE, NS_ASTRO
 from .data_formatter import DataFormatter
+from .variable_planner import RequestInputs
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,6 +44,17 @@ _LOGGER = logging.getLogger(__name__)
 class OceanFishingScorer(BaseScorer):
     """Calculate ocean fishing scores based on conditions and species."""
 
+    # Scored: temperature, wind, pressure and waves; precipitation feeds the safety check
+    WEATHER_INPUTS = ("temperature_2m", "precipitation", "wind_speed_10m", "pressure_msl")
+    MARINE_INPUTS = ("wave_height", "swell_wave_height")
+
+    @classmethod
+    def required_inputs(cls, config: Optional[Dict[str, Any]] = None) -> RequestInputs:
+        inputs = super().required_inputs(config)
+        if not (config or {}).get(CONF_MARINE_ENABLED, True):
+            return inputs.without_marine()
+        return inputs
+
     def __init__(
         self,
         latitude: float,
@@ -50,6 +63,7 @@ class OceanFishingScorer(BaseScorer):
         species_profiles: Dict[str, Any],
         hass: Any = None,
         config: Optional[Dict[str, Any]] = None,
+        cache_owner: Optional[str] = None,
     ) -> None:
         """Initialize the scorer."""
         super().__init__(latitude, longitude, species, species_profiles)
@@ -60,11 +74,21 @@ class OceanFishingScorer(BaseScorer):
         self.species_profile: Dict[str, Any] = {}
         self._initialized = False
 
-        # astro cache may be either:
-        #  - dict keyed by ISO date strings -> astro dict (preferred), or
-        #  - list of astro dicts with a 'date' key (legacy)
-        self._astro_forecast_cache: Optional[Any] = None
-        self._astro_cache_time: Optional[datetime] = None
+        # The astro forecast lives in the shared cache manager (NS_ASTRO) keyed by location,
+        # owned by the config entry so it is dropped when the entry unloads
+        self._astro_key = f"{latitude}_{longitude}"
+        self._cache_owner = cache_owner
+
+    @property
+    def _astro_forecast_cache(self) -> Optional[Any]:
+        """Return the cached astro forecast, also once expired (it is refreshed separately).
+
+        The cache may be either:
+         - dict keyed by ISO date strings -> astro dict (preferred), or
+         - list of astro dicts with a 'date' key (legacy)
+        """
+        entry = CACHE.peek(NS_ASTRO, self._astro_key, allow_expired=True)
+        return entry.value if entry is not None else None
 
     async def async_initialize(self) -> None:
         """Initialize the scorer asynchronously (load profiles, prefetch astro).
@@ -120,20 +144,26 @@ class OceanFishingScorer(BaseScorer):
         try:
             if self.latitude is None or self.longitude is None or not self.hass:
                 _LOGGER.debug("No coordinates or hass unavailable; cannot refresh astro cache")
-                self._astro_forecast_cache = None
-                self._astro_cache_time = None
+                CACHE.invalidate(NS_ASTRO, self._astro_key)
                 return
 
             _LOGGER.debug("Refreshing astronomical forecast cache for lat=%s lon=%s", self.latitude, self.longitude)
             cache = await calculate_astronomy_forecast(self.hass, self.latitude, self.longitude, days=7)
-            self._astro_forecast_cache = cache
-            self._astro_cache_time = dt_util.now()
+            CACHE.set(NS_ASTRO, self._astro_key, cache, owner=self._cache_owner)
             size = len(cache) if cache is not None and hasattr(cache, "__len__") else 0
             _LOGGER.debug("Astronomical cache refreshed with %d entries", size)
         except Exception:
             _LOGGER.exception("Error refreshing astro cache")
-            self._astro_forecast_cache = None
-            self._astro_cache_time = None
+            CACHE.invalidate(NS_ASTRO, self._astro_key)
+
+    def set_astro_forecast(self, forecast: Optional[Dict[str, Any]], fetched_at: Optional[datetime] = None) -> None:
+        """Seed the astro cache with a forecast computed elsewhere (e.g. the entry coordinator).
+
+        Empty forecasts are ignored so the scorer keeps its previous cache (or refreshes itself).
+        """
+        if not forecast:
+            return
+        CACHE.set(NS_ASTRO, self._astro_key, forecast, owner=self._cache_owner, stored_at=fetched_at)
 
     def calculate_score(
         self,
@@ -537,12 +567,11 @@ class OceanFishingScorer(BaseScorer):
         was missing or something went wrong.
         """
         forecast_scores: List[Dict[str, Any]] = []
+        self._begin_forecast()
 
-        # Ensure astro cache is fresh (1 hour TTL)
+        # Ensure astro cache is fresh (NS_ASTRO policy: 1 hour TTL)
         try:
-            if self._astro_forecast_cache is None or (
-                self._astro_cache_time and (dt_util.now() - self._astro_cache_time).total_seconds() > 3600
-            ):
+            if CACHE.get(NS_ASTRO, self._astro_key) is None:
                 await self._refresh_astro_cache()
         except Exception:
             _LOGGER.debug("Error checking/refreshing astro cache", exc_info=True)
@@ -559,12 +588,8 @@ class OceanFishingScorer(BaseScorer):
                 tide_data_item = self._find_tide_for_time(tide_forecast, forecast_time) if tide_forecast else None
                 marine_data_item = self._find_marine_for_time(marine_forecast, forecast_time) if marine_forecast else None
 
-                score_result = self.calculate_score(
-                    weather_data=weather_data,
-                    astro_data=astro_data,
-                    tide_data=tide_data_item,
-                    marine_data=marine_data_item,
-                    current_time=forecast_time,
+                score_result = self._score_forecast_step(
+                    weather_data, astro_data, tide_data_item, marine_data_item, forecast_time
                 )
 
                 score_result["datetime"] = dt_util.as_utc(forecast_time).isoformat()
@@ -587,6 +612,7 @@ class OceanFishingScorer(BaseScorer):
                     # if even that fails, append a minimal placeholder
                     forecast_scores.append({"datetime": None, "score": None, "error": "Unhandled exception while scoring"})
 
+        self._end_forecast()
         return forecast_scores
 
     def _find_astro_for_time(self, target_time: Any) -> Dict[str, Any]:
@@ -1032,7 +1058,11 @@ class OceanFishingScorer(BaseScorer):
             return 2.0
 
     def _determine_light_condition(self, astro_data: Dict[str, Any], current_time: Any = None) -> str:
-        """Determine light condition for a specific time with fallbacks."""
+        """Determine light condition for a specific time with fallbacks.
+
+        Sunrise/sunset come from the sampled sun altitude of helpers.astro; those in
+        `astro_data` are parsed only for days without samples.
+        """
         try:
             if not current_time:
                 current_time = dt_util.now()
@@ -1043,11 +1073,15 @@ class OceanFishingScorer(BaseScorer):
             # Ensure current_time is timezone-aware UTC for comparisons
             current_utc = dt_util.as_utc(current_time)
 
-            if not astro_data:
+            sun_times = None
+            if self.latitude is not None and self.longitude is not None:
+                sun_times = sun_times_at(self.latitude, self.longitude, current_utc)
+
+            if not astro_data and sun_times is None:
                 return self._fallback_light_condition(dt_util.as_local(current_utc))
 
-            sunrise = astro_data.get("sunrise")
-            sunset = astro_data.get("sunset")
+            sunrise = (astro_data or {}).get("sunrise")
+            sunset = (astro_data or {}).get("sunset")
 
             def _ensure_dt(v):
                 if v is None:
@@ -1074,8 +1108,11 @@ class OceanFishingScorer(BaseScorer):
                     pass
                 return None
 
-            sunrise_dt = _ensure_dt(sunrise)
-            sunset_dt = _ensure_dt(sunset)
+            if sun_times is not None:
+                sunrise_dt, sunset_dt = sun_times
+            else:
+                sunrise_dt = _ensure_dt(sunrise)
+                sunset_dt = _ensure_dt(sunset)
 
             if not sunrise_dt or not sunset_dt:
                 return self._fallback_light_condition(dt_util.as_local(current_utc))
@@ -0,0 +1,554 @@
+"""Open-Meteo source shared by the entries of one grid cell.
+
+OpenMeteoAdapter keeps one hourly series per grid cell and slot and answers the
+WeatherFetcher and MarineDataFetcher queries from it; the small classes below
+hold its state, its persistence, the cell's request plan and the live values.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+from .api import DEFAULT_HOURLY_VARIABLES, MARINE_HOURLY_VARIABLES, OpenMeteoClient
+from .const import (
+    DEFAULT_GRID_TOLERANCE,
+    LIVE_UPDATE_MINUTES,
+    OPEN_METEO_MARINE_META_URL,
+    OPEN_METEO_WEATHER_META_URL,
+)
+from .helpers.grid import GRID_CELLS, GridCell
+from .helpers.request_budget import Priority, request_priority
+from .helpers.singleflight import SingleFlight
+from .hourly_series import (
+    HourlySeries,
+    current_weather_from_series,
+    current_weather_from_values,
+    daily_weather_from_series,
+)
+from .persistent_cache import PersistentCache
+from .refresh_planner import ModelRun, RefreshPlanner, async_get_model_runs, strictest_limits, volatility_reason
+from .variable_planner import RequestInputs, plan_variables
+
+_LOGGER = logging.getLogger(__name__)
+
+# In-flight `current` block fetches, keyed by grid cell slot
+_LIVE_INFLIGHT = SingleFlight()
+
+
+def _has_marine(series: HourlySeries) -> bool:
+    return any(series.has_values(name) for name in MARINE_HOURLY_VARIABLES)
+
+
+def _starts_before_today(series: HourlySeries, now: datetime) -> bool:
+    """Return True when the series still holds hours of a past UTC day."""
+    return series.start < now.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class SeriesState:
+    """Hourly series shared by every adapter in one grid cell slot."""
+
+    def __init__(self) -> None:
+        self.series: Optional[HourlySeries] = None
+        self.days = 0
+        self.fetched: Optional[datetime] = None
+        # Last fetch of the whole series (later refreshes may only splice in the near hours)
+        self.full_fetched: Optional[datetime] = None
+        # Canonical variables the series was requested with
+        self.variables: FrozenSet[str] = frozenset()
+        # Model runs the series was built from (meta URL -> ModelRun) and when to check again
+        self.runs: Dict[str, ModelRun] = {}
+        self.expires_at: Optional[datetime] = None
+        # Why the last new run looked volatile near a safety limit (None when calm)
+        self.volatile: Optional[str] = None
+        # True while the series is the copy loaded from disk at startup
+        self.restored = False
+        # First failed refresh while this series kept being served
+        self.stale_since: Optional[datetime] = None
+        self.last_read: Optional[datetime] = None
+        self.refresh_task: Optional[asyncio.Future] = None
+        self.refresh_handle: Optional[asyncio.TimerHandle] = None
+
+
+class SeriesStore:
+    """Load and save the series of one cell slot in the persistent cache."""
+
+    def __init__(self, persistent: Optional[PersistentCache], key: str) -> None:
+        self._persistent = persistent
+        self.key = key
+
+    def restore(self) -> SeriesState:
+        """Return the persisted state, or an empty one."""
+        state = SeriesState()
+        entry = self._persistent.get(self.key) if self._persistent else None
+        if entry is None:
+            return state
+        try:
+            series = HourlySeries.from_storage(entry.data["series"])
+            days = int(entry.data.get("days") or 0)
+            runs = {url: ModelRun.from_storage(raw) for url, raw in (entry.data.get("runs") or {}).items()}
+            full_fetched = entry.data.get("full_fetched")
+            full_fetched = datetime.fromisoformat(full_fetched) if full_fetched else entry.fetched_at
+            # Series persisted before variable planning carried every default variable
+            variables = entry.data.get("variables") or DEFAULT_HOURLY_VARIABLES + MARINE_HOURLY_VARIABLES
+        except Exception:
+            _LOGGER.debug("Discarding unreadable persisted series %s", self.key, exc_info=True)
+            return state
+        if series:
+            state.series = series
+            state.days = days
+            state.fetched = entry.fetched_at
+            state.full_fetched = full_fetched
+            state.variables = frozenset(variables)
+            state.runs = {url: run for url, run in runs.items() if run is not None}
+            state.restored = True
+        return state
+
+    def save(self, state: SeriesState) -> None:
+        if self._persistent is None or not state.series:
+            return
+        self._persistent.set(
+            self.key,
+            {
+                "days": state.days,
+                "series": state.series.to_storage(),
+                "runs": {url: run.to_storage() for url, run in state.runs.items()},
+                "full_fetched": state.full_fetched.isoformat() if state.full_fetched else None,
+                "variables": sorted(state.variables),
+            },
+            state.fetched,
+            generated_at=max((run.initialised for run in state.runs.values()), default=None),
+        )
+
+
+class CellPlan:
+    """What the entries of one cell slot need: variables, visibility and safety limits."""
+
+    def __init__(self, cell: GridCell, slot: str, inputs: RequestInputs, include_marine: bool) -> None:
+        self._cell = cell
+        self._slot = slot
+        self._inputs = inputs
+        self._include_marine = include_marine
+
+    def register(
+        self,
+        member: str,
+        safety_limits: Optional[Dict[str, float]],
+        on_volatile: Optional[Callable[[str], None]],
+    ) -> None:
+        self._cell.member_values[member] = {
+            "safety_limits": safety_limits or {},
+            "on_volatile": on_volatile,
+            "inputs": self._inputs,
+            "slot": self._slot,
+        }
+
+    def set_entity_visible(self, member: str, entity_id: str, visible: Optional[bool]) -> None:
+        entities = self._cell.member_values.setdefault(member, {}).setdefault("entities", {})
+        if visible is None:
+            entities.pop(entity_id, None)
+        else:
+            entities[entity_id] = visible
+
+    def variables(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Return the (weather, marine) variables covering every entry of the slot."""
+        inputs = [v.get("inputs") for v in self._cell.member_values.values() if v.get("slot") == self._slot]
+        weather, marine = plan_variables(inputs + [self._inputs])
+        return weather, marine if self._include_marine else ()
+
+    def covers(self, state: SeriesState) -> bool:
+        """Return True when `state` was requested with every variable the entries need."""
+        weather, marine = self.variables()
+        return state.variables.issuperset(weather + marine)
+
+    def visible(self) -> bool:
+        # Members without registered sensors (yet) count as visible
+        return not self._cell.member_values or any(
+            not values.get("entities") or any(values["entities"].values())
+            for values in self._cell.member_values.values()
+        )
+
+    def priority(self, state: SeriesState, now: datetime) -> Priority:
+        staleness = (now - state.fetched).total_seconds() if state.fetched is not None else None
+        return request_priority(self.visible(), staleness)
+
+    def safety_limits(self) -> Dict[str, float]:
+        return strictest_limits(v.get("safety_limits") for v in self._cell.member_values.values())
+
+    def notify_volatile(self, reason: str) -> None:
+        for values in list(self._cell.member_values.values()):
+            callback = values.get("on_volatile")
+            if callback is None:
+                continue
+            try:
+                callback(reason)
+            except Exception:
+                _LOGGER.debug("Volatility callback failed for cell %s", self._cell.key, exc_info=True)
+
+
+class LiveConditions:
+    """Open-Meteo `current` values of one cell slot, kept for LIVE_TTL next to the series."""
+
+    # Just under the live update interval, so every live update fetches once per cell
+    LIVE_TTL = timedelta(minutes=LIVE_UPDATE_MINUTES) - timedelta(seconds=30)
+
+    def __init__(self, client: OpenMeteoClient, cell: GridCell, slot: str, plan: CellPlan, include_marine: bool):
+        self._client = client
+        self._cell = cell
+        self._slot = f"{slot}_live"
+        self._plan = plan
+        self._include_marine = include_marine
+
+    def fresh(self, now: datetime) -> Optional[Dict[str, Any]]:
+        live = self._cell.values.get(self._slot)
+        if live is None or now - live[0] >= self.LIVE_TTL:
+            return None
+        return live[1]
+
+    async def async_get(self) -> Optional[Dict[str, Any]]:
+        """Return the live values, fetching when older than LIVE_TTL.
+
+        Returns None when no sensor of the cell is visible or the request failed
+        (circuit open, budget refused, ...); callers keep their previous values.
+        """
+        values = self.fresh(datetime.now(timezone.utc))
+        if values is not None:
+            return values
+        if not self._plan.visible():
+            return None
+        try:
+            return await _LIVE_INFLIGHT.do((self._cell.key, self._slot), self._async_fetch)
+        except Exception as exc:
+            _LOGGER.debug("Live conditions for cell %s unavailable: %s", self._cell.key, exc)
+            return None
+
+    async def _async_fetch(self) -> Dict[str, Any]:
+        now = datetime.now(timezone.utc)
+        live = self._cell.values.get(self._slot)
+        staleness = (now - live[0]).total_seconds() if live is not None else None
+        weather_vars, marine_vars = self._plan.variables()
+        values = await self._client.fetch_current(
+            self._cell.latitude,
+            self._cell.longitude,
+            weather_vars,
+            include_marine=self._include_marine,
+            marine_vars=marine_vars,
+            priority=request_priority(True, staleness),
+        )
+        # (fetched at, values)
+        self._cell.values[self._slot] = (now, values)
+        return values
+
+
+class OpenMeteoAdapter:
+    """Per-grid-cell Open-Meteo series source for WeatherFetcher/MarineDataFetcher."""
+
+    SERIES_DAYS = 7
+    SERIES_TTL = timedelta(minutes=30)
+    # The background fetch for the next series starts this long before expiry
+    REFRESH_AHEAD = timedelta(minutes=5)
+    # Refresh-ahead stops for series nobody read for this long
+    REFRESH_AHEAD_IDLE = timedelta(hours=12)
+    # Short-horizon refreshes cover this many hours; the tail is refetched this often
+    NEAR_HOURS = 48
+    FULL_REFRESH_INTERVAL = timedelta(hours=12)
+
+    def __init__(
+        self,
+        client: OpenMeteoClient,
+        latitude: float,
+        longitude: float,
+        include_marine: bool = False,
+        grid_tolerance: float = DEFAULT_GRID_TOLERANCE,
+        member: Optional[str] = None,
+        persistent_cache: Optional[PersistentCache] = None,
+        safety_limits: Optional[Dict[str, float]] = None,
+        on_volatile: Optional[Callable[[str], None]] = None,
+        inputs: Optional[RequestInputs] = None,
+    ):
+        self._client = client
+        self._include_marine = include_marine
+        if inputs is None:
+            inputs = RequestInputs.of(DEFAULT_HOURLY_VARIABLES, MARINE_HOURLY_VARIABLES)
+        inputs = inputs if include_marine else inputs.without_marine()
+        self._cell = GRID_CELLS.cell_for(latitude, longitude, grid_tolerance, member=member)
+        self._lat = self._cell.latitude
+        self._lon = self._cell.longitude
+        self._slot = "hourly_marine" if include_marine else "hourly"
+        self._store = SeriesStore(persistent_cache, f"series:{self._cell.key}:{self._slot}")
+        self._plan = CellPlan(self._cell, self._slot, inputs, include_marine)
+        self._live = LiveConditions(client, self._cell, self._slot, self._plan, include_marine)
+        self._planner = RefreshPlanner(self.SERIES_TTL)
+        self._meta_urls = [OPEN_METEO_WEATHER_META_URL]
+        if include_marine:
+            self._meta_urls.append(OPEN_METEO_MARINE_META_URL)
+        if member:
+            self._plan.register(member, safety_limits, on_volatile)
+        if self._slot not in self._cell.values:
+            self._cell.values[self._slot] = self._store.restore()
+        self._series_lock = self._cell.lock(self._slot)
+
+    @property
+    def _series_state(self) -> SeriesState:
+        return self._cell.values[self._slot]
+
+    def set_entity_visible(self, member: str, entity_id: str, visible: Optional[bool]) -> None:
+        """Record whether a sensor of `member` is visible (None: the sensor was removed)."""
+        self._plan.set_entity_visible(member, entity_id, visible)
+
+    def _expires_at(self, state: SeriesState) -> Optional[datetime]:
+        if state.expires_at is not None:
+            return state.expires_at
+        return state.fetched + self.SERIES_TTL if state.fetched is not None else None
+
+    def _needs_full_fetch(self, state: SeriesState, days: int, now: datetime) -> bool:
+        """Return True unless a short-horizon fetch spliced into `state` would do."""
+        if not state.series or state.full_fetched is None or days > state.days:
+            return True
+        if not self._plan.covers(state):
+            return True
+        if state.stale_since is not None or now - state.full_fetched >= self.FULL_REFRESH_INTERVAL:
+            return True
+        if _starts_before_today(state.series, now):
+            # A splice keeps the old axis; only a full fetch drops the past day
+            return True
+        return state.series.end < now + timedelta(hours=self.NEAR_HOURS)
+
+    def _series_is_fresh(self, days: int, now: datetime) -> bool:
+        """Return True when the cached series is young enough and covers `days` and `now`."""
+        state = self._series_state
+        if not state.series or state.fetched is None:
+            return False
+        if days > state.days or not self._plan.covers(state):
+            return False
+        if now >= self._expires_at(state) or _starts_before_today(state.series, now):
+            return False
+        return state.series.end >= now
+
+    def _series_is_usable(self, days: int, now: datetime) -> bool:
+        """Return True when the cached series, however old, still covers `days` and `now`."""
+        state = self._series_state
+        return bool(state.series) and days <= state.days and state.series.end >= now
+
+    @property
+    def series_slot(self) -> str:
+        """Cell slot of the series ("hourly", or "hourly_marine" with marine variables)."""
+        return self._slot
+
+    @property
+    def series_fetched_at(self) -> Optional[datetime]:
+        """UTC time the cached hourly series was fetched (None before the first fetch)."""
+        return self._series_state.fetched
+
+    @property
+    def series_volatile(self) -> Optional[str]:
+        """Reason the latest model run looked volatile near a safety limit (None when calm)."""
+        return self._series_state.volatile
+
+    @property
+    def series_stale_since(self) -> Optional[datetime]:
+        """UTC time since which an outdated series is being served (None while current)."""
+        state = self._series_state
+        if state.stale_since is not None:
+            return state.stale_since
+        if state.restored and state.fetched is not None:
+            expired = self._expires_at(state)
+            if expired <= datetime.now(timezone.utc):
+                return expired
+        return None
+
+    async def async_get_hourly_series(self, days: int = SERIES_DAYS) -> Optional[HourlySeries]:
+        """Return the cell's cached hourly series; only fetch inline when none is usable.
+
+        When marine is enabled the series carries the marine variables the cell's
+        entries declared, so MarineDataFetcher can use it as its source.
+        """
+        days = max(int(days or 1), self.SERIES_DAYS)
+        now = datetime.now(timezone.utc)
+        state = self._series_state
+        state.last_read = now
+        if self._series_is_fresh(days, now):
+            self._cell.record(self._slot, hit=True)
+            if state.refresh_handle is None and state.refresh_task is None:
+                self._schedule_refresh_ahead(state, days)
+            return state.series
+
+        if state.restored and self._series_is_usable(days, now):
+            # Started from disk: answer now and refresh upstream in the background
+            self._cell.record(self._slot, hit=True)
+            self._start_background_refresh(state, days)
+            return state.series
+
+        async with self._series_lock:
+            state = self._series_state
+            task = state.refresh_task
+            if task is not None and not task.done():
+                # A background fetch is already running: wait for it instead of fetching again
+                await asyncio.shield(task)
+                now = datetime.now(timezone.utc)
+                if self._series_is_usable(days, now):
+                    self._cell.record(self._slot, hit=True)
+                    return self._series_state.series
+
+            now = datetime.now(timezone.utc)
+            if self._series_is_fresh(days, now):
+                self._cell.record(self._slot, hit=True)
+                return self._series_state.series
+            self._cell.record(self._slot, hit=False)
+            return await self._async_refresh(days, now)
+
+    def _schedule_refresh_ahead(self, state: SeriesState, days: int) -> None:
+        """Arm the timer that fetches the successor of `state` shortly before it expires."""
+        expires_at = self._expires_at(state)
+        if expires_at is None:
+            return
+        delay = (expires_at - self.REFRESH_AHEAD - datetime.now(timezone.utc)).total_seconds()
+        state.refresh_handle = asyncio.get_running_loop().call_later(
+            max(delay, 0.0), self._on_refresh_ahead, state, days
+        )
+
+    def _on_refresh_ahead(self, state: SeriesState, days: int) -> None:
+        if self._series_state is not state or GRID_CELLS.get(self._cell.key) is not self._cell:
+            # Already replaced by a newer series, or every entry of the cell unloaded
+            return
+        if state.last_read is None or datetime.now(timezone.utc) - state.last_read > self.REFRESH_AHEAD_IDLE:
+            _LOGGER.debug("Cell %s not read recently; refresh-ahead paused", self._cell.key)
+            return
+        self._start_background_refresh(state, days)
+
+    def _start_background_refresh(self, state: SeriesState, days: int) -> None:
+        if state.refresh_task is None or state.refresh_task.done():
+            state.refresh_task = asyncio.ensure_future(self._async_background_refresh(days))
+
+    async def _async_background_refresh(self, days: int) -> None:
+        try:
+            await self._async_refresh(days, datetime.now(timezone.utc))
+        except Exception:
+            _LOGGER.debug("Background refresh of cell %s failed", self._cell.key, exc_info=True)
+
+    async def _async_refresh(self, days: int, now: datetime) -> Optional[HourlySeries]:
+        """Fetch the series upstream and swap it in; keep serving the old one on failure.
+
+        The fetch is skipped when the model metadata shows no run newer than the one
+        the current series was built from.
+        """
+        state = self._series_state
+        runs = await async_get_model_runs(self._client, self._meta_urls)
+        if (
+            state.stale_since is None
+            and self._series_is_usable(days, now)
+            and self._plan.covers(state)
+            and not _starts_before_today(state.series, now)
+            and not self._planner.has_new_run(state.runs, runs)
+        ):
+            # Upstream has nothing newer: keep the series and check again at the next run
+            state.expires_at = self._planner.expiry(now, runs, volatile=state.volatile is not None)
+            state.restored = False
+            if state.refresh_handle is not None:
+                state.refresh_handle.cancel()
+            self._schedule_refresh_ahead(state, days)
+            _LOGGER.debug("No new model run for cell %s; next check at %s", self._cell.key, state.expires_at)
+            return state.series
+
+        full = self._needs_full_fetch(state, days, now)
+        weather_vars, marine_vars = self._plan.variables()
+        error: Optional[Exception] = None
+        try:
+            piece = await self._client.fetch_hourly_series(
+                self._lat,
+                self._lon,
+                include_marine=self._include_marine,
+                forecast_days=days,
+                hourly_vars=weather_vars,
+                marine_vars=marine_vars,
+                priority=self._plan.priority(state, now),
+                forecast_hours=None if full else self.NEAR_HOURS,
+            )
+        except Exception as exc:
+            piece = None
+            error = exc
+
+        series = piece
+        if piece and not full:
+            series, changed = state.series.splice(piece)
+            _LOGGER.debug(
+                "Spliced %d-hour refresh into cell %s (%d hours changed)", len(piece), self._cell.key, changed
+            )
+
+        if not series:
+            if self._series_is_usable(days, now):
+                # Network down or upstream failing: keep the last series, marked stale
+                if state.stale_since is None:
+                    _LOGGER.warning(
+                        "Open-Meteo refresh for cell %s failed (%s); serving data fetched at %s",
+                        self._cell.key,
+                        error or "empty response",
+                        state.fetched,
+                    )
+                    state.stale_since = min(now, state.fetched + self.SERIES_TTL) if state.fetched else now
+                state.restored = False
+                return state.series
+            if error is not None:
+                raise error
+            return None
+
+        stale_since: Optional[datetime] = None
+        if self._include_marine and not _has_marine(piece) and state.series and _has_marine(state.series):
+            # Weather refreshed but marine failed: keep the last marine columns, marked stale
+            # (a splice already kept them)
+            stale_since = state.stale_since or min(now, self._expires_at(state) or now)
+            if state.stale_since is None:
+                _LOGGER.warning(
+                    "Open-Meteo marine refresh for cell %s failed; serving marine data fetched at %s",
+                    self._cell.key,
+                    state.fetched,
+                )
+            if full:
+                series = series.with_columns_from(state.series, marine_vars)
+
+        volatile = volatility_reason(state.series, series, self._plan.safety_limits(), now)
+
+        # Swap in a fresh state object so readers never see a half-updated state
+        fresh = SeriesState()
+        fresh.series = series
+        fresh.days = days if full else state.days
+        fresh.fetched = now
+        fresh.full_fetched = now if full else state.full_fetched
+        fresh.variables = frozenset(weather_vars + marine_vars)
+        fresh.runs = runs
+        fresh.volatile = volatile
+        fresh.stale_since = stale_since
+        # A partial (stale) series is retried on the fixed TTL rather than at the next model run
+        fresh.expires_at = self._planner.expiry(now, {} if stale_since else runs, volatile=volatile is not None)
+        fresh.last_read = state.last_read
+        self._cell.values[self._slot] = fresh
+        if state.refresh_handle is not None:
+            state.refresh_handle.cancel()
+        self._schedule_refresh_ahead(fresh, days)
+        self._store.save(fresh)
+        if volatile is not None:
+            _LOGGER.info("Volatile forecast for cell %s (%s); requesting score updates", self._cell.key, volatile)
+            self._plan.notify_volatile(volatile)
+        return series
+
+    async def get_forecast(self, days: int = 7) -> Optional[Dict[str, Dict]]:
+        series = await self.async_get_hourly_series(days)
+        if not series:
+            return None
+        return daily_weather_from_series(series, days) or None
+
+    async def async_get_live_current(self) -> Optional[Dict[str, Any]]:
+        """Return the cell's values from Open-Meteo's `current` block (see LiveConditions)."""
+        return await self._live.async_get()
+
+    async def get_current(self) -> Optional[Dict]:
+        now = datetime.now(timezone.utc)
+        live = self._live.fresh(now)
+        if live is not None:
+            return current_weather_from_values(live)
+        series = await self.async_get_hourly_series()
+        if not series:
+            return None
+        return current_weather_from_series(series, now)
@@ -0,0 +1,155 @@
+"""Disk-backed cache so fetched data survives Home Assistant restarts.
+
+Series, marine, tide and astronomy data are kept in one storage file with the
+time they were fetched. The file is loaded once during setup; get_persistent_cache()
+returns None until then.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# hass.data[DOMAIN] key holding the PersistentCache
+DATA_PERSISTENT_CACHE = "persistent_cache"
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.cache"
+# Writes are coalesced; Home Assistant flushes pending saves on shutdown
+SAVE_DELAY = 60  # seconds
+# Entries older than this are dropped when the file is loaded
+MAX_ENTRY_AGE = timedelta(days=7)
+
+
+@dataclass(frozen=True)
+class PersistedEntry:
+    """One stored value with its fetch time and (optional) upstream generation time."""
+
+    data: Any
+    fetched_at: datetime
+    generated_at: Optional[datetime] = None
+
+    def age(self, now: Optional[datetime] = None) -> timedelta:
+        return (now or dt_util.utcnow()) - self.fetched_at
+
+
+def _parse_time(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        parsed = dt_util.parse_datetime(str(value))
+    except Exception:
+        return None
+    if parsed is not None and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.UTC)
+    return parsed
+
+
+class PersistentCache:
+    """Keyed JSON store of fetched data backed by homeassistant.helpers.storage."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    async def async_load(self) -> None:
+        """Load the storage file once; later calls return immediately."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            try:
+                raw = await self._store.async_load()
+            except Exception:
+                _LOGGER.warning("Could not read the Fishing Assistant cache file; starting empty", exc_info=True)
+                raw = None
+
+            entries = raw.get("entries") if isinstance(raw, dict) else None
+            cutoff = dt_util.utcnow() - MAX_ENTRY_AGE
+            for key, item in (entries or {}).items():
+                fetched = _parse_time(item.get("fetched_at")) if isinstance(item, dict) else None
+                if fetched is None or fetched < cutoff:
+                    continue
+                self._entries[key] = item
+            self._loaded = True
+            _LOGGER.debug("Loaded %d persisted cache entries", len(self._entries))
+
+    def get(self, key: str) -> Optional[PersistedEntry]:
+        """Return the stored entry for `key` (None when missing or unreadable)."""
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        fetched = _parse_time(item.get("fetched_at"))
+        if fetched is None:
+            return None
+        return PersistedEntry(
+            data=item.get("data"),
+            fetched_at=fetched,
+            generated_at=_parse_time(item.get("generated_at")),
+        )
+
+    @callback
+    def set(
+        self,
+        key: str,
+        data: Any,
+        fetched_at: datetime,
+        generated_at: Optional[datetime] = None,
+    ) -> None:
+        """Store JSON-serializable `data` under `key` and schedule a delayed write."""
+        self._entries[key] = {
+            "data": data,
+            "fetched_at": fetched_at.isoformat(),
+            "generated_at": generated_at.isoformat() if generated_at else None,
+        }
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def discard(self, key: str) -> None:
+        if self._entries.pop(key, None) is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return entry counts per key namespace for diagnostics."""
+        namespaces: Dict[str, int] = {}
+        for key in self._entries:
+            namespace = key.split(":", 1)[0]
+            namespaces[namespace] = namespaces.get(namespace, 0) + 1
+        return {"loaded": self._loaded, "entries": len(self._entries), "namespaces": namespaces}
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        return {"entries": self._entries}
+
+
+async def async_get_persistent_cache(hass: HomeAssistant) -> PersistentCache:
+    """Return the integration-wide persistent cache, loading it on first use."""
+    store = hass.data.setdefault(DOMAIN, {})
+    cache: Optional[PersistentCache] = store.get(DATA_PERSISTENT_CACHE)
+    if cache is None:
+        cache = store[DATA_PERSISTENT_CACHE] = PersistentCache(hass)
+    await cache.async_load()
+    return cache
+
+
+@callback
+def get_persistent_cache(hass: HomeAssistant) -> Optional[PersistentCache]:
+    """Return the loaded persistent cache, or None before setup has loaded it."""
+    cache: Optional[PersistentCache] = (hass.data.get(DOMAIN) or {}).get(DATA_PERSISTENT_CACHE)
+    return cache if cache is not None and cache.loaded else None
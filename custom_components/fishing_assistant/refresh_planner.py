@@ -0,0 +1,232 @@
+"""Upstream-model-aware refresh planning for Open-Meteo series.
+
+A series is checked again when the next model run should be published, and kept
+when no newer run exists. A large near-limit change between runs marks it
+volatile (see volatility_reason).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from .const import DEFAULT_OCEAN_THRESHOLDS, HABITAT_PRESETS
+from .helpers.cache import CACHE, NS_MODEL_RUN
+from .helpers.singleflight import SingleFlight
+from .hourly_series import WIND_SPEED_KEYS, HourlySeries
+
+_LOGGER = logging.getLogger(__name__)
+
+# Bounds for the time until the next check of a series
+MIN_INTERVAL = timedelta(minutes=15)
+MAX_INTERVAL = timedelta(hours=6)
+VOLATILE_INTERVAL = timedelta(minutes=15)
+# Slack after the expected availability of the next run
+RUN_MARGIN = timedelta(minutes=10)
+# A series is checked again at most this long after the UTC date changes, so the
+# day it starts on is dropped from the daily forecast
+DATE_MARGIN = timedelta(minutes=10)
+# Metadata of a model that could not be read is retried after this long
+META_RETRY = timedelta(minutes=5)
+
+# Volatility: a step between runs at least this large (km/h, m) with either
+# value above NEAR_LIMIT_FRACTION of the safety limit, within the next HORIZON
+VOLATILITY_DELTAS: Dict[str, float] = {
+    "max_wind_speed": 10.0,
+    "max_wave_height": 0.5,
+}
+NEAR_LIMIT_FRACTION = 0.75
+HORIZON_HOURS = 24
+
+# limit key -> (series column aliases, factor to the limit's unit); wind columns get
+# the same m/s -> km/h conversion as the weather summaries in hourly_series
+_LIMIT_COLUMNS = {
+    "max_wind_speed": (WIND_SPEED_KEYS, 3.6),
+    "max_wave_height": (("wave_height",), 1.0),
+}
+
+# Metadata fetches in flight, keyed by URL
+_INFLIGHT = SingleFlight()
+
+
+@dataclass(frozen=True)
+class ModelRun:
+    """The latest published run of one upstream model."""
+
+    initialised: datetime
+    available: datetime
+    update_interval: timedelta
+
+    @property
+    def next_available(self) -> datetime:
+        """When the following run is expected to be published."""
+        return self.available + self.update_interval
+
+    def to_storage(self) -> List[float]:
+        return [self.initialised.timestamp(), self.available.timestamp(), self.update_interval.total_seconds()]
+
+    @classmethod
+    def from_storage(cls, data: Any) -> Optional["ModelRun"]:
+        try:
+            initialised, available, interval = (float(v) for v in data)
+        except (TypeError, ValueError):
+            return None
+        return cls(
+            initialised=datetime.fromtimestamp(initialised, tz=timezone.utc),
+            available=datetime.fromtimestamp(available, tz=timezone.utc),
+            update_interval=timedelta(seconds=interval),
+        )
+
+    @classmethod
+    def from_meta(cls, meta: Mapping[str, Any]) -> Optional["ModelRun"]:
+        """Build from an Open-Meteo meta.json document (unix-second fields)."""
+        try:
+            initialised = datetime.fromtimestamp(float(meta["last_run_initialisation_time"]), tz=timezone.utc)
+            available = datetime.fromtimestamp(
+                float(meta.get("last_run_availability_time") or meta["last_run_initialisation_time"]),
+                tz=timezone.utc,
+            )
+            interval = float(meta.get("update_interval_seconds") or 3600)
+        except (KeyError, TypeError, ValueError):
+            return None
+        if interval <= 0 or math.isnan(interval):
+            return None
+        return cls(initialised=initialised, available=available, update_interval=timedelta(seconds=interval))
+
+
+async def async_get_model_run(client: Any, meta_url: str) -> Optional[ModelRun]:
+    """Return the latest run for `meta_url` (cached for the NS_MODEL_RUN TTL)."""
+    cached = CACHE.get(NS_MODEL_RUN, meta_url)
+    if cached is not None:
+        return cached["run"]
+    try:
+        meta = await _INFLIGHT.do(meta_url, lambda: client.fetch_model_meta(meta_url))
+        run = ModelRun.from_meta(meta)
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        _LOGGER.debug("Model metadata unavailable from %s: %s", meta_url, exc)
+        run = None
+    CACHE.set(NS_MODEL_RUN, meta_url, {"run": run}, ttl=None if run is not None else META_RETRY)
+    return run
+
+
+async def async_get_model_runs(client: Any, meta_urls: Iterable[str]) -> Dict[str, ModelRun]:
+    """Return the latest run of every model whose metadata could be read."""
+    urls = list(meta_urls)
+    runs = await asyncio.gather(*(async_get_model_run(client, url) for url in urls))
+    return {url: run for url, run in zip(urls, runs) if run is not None}
+
+
+class RefreshPlanner:
+    """Decide when a series needs checking and whether upstream has anything new."""
+
+    def __init__(
+        self,
+        fallback_ttl: timedelta,
+        min_interval: timedelta = MIN_INTERVAL,
+        max_interval: timedelta = MAX_INTERVAL,
+        volatile_interval: timedelta = VOLATILE_INTERVAL,
+    ) -> None:
+        self.fallback_ttl = fallback_ttl
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.volatile_interval = volatile_interval
+
+    def expiry(self, now: datetime, runs: Mapping[str, ModelRun], volatile: bool = False) -> datetime:
+        """Return when the series fetched (or confirmed current) at `now` should be checked again.
+
+        Never later than DATE_MARGIN past the next UTC midnight, when the series' first day ends.
+        """
+        if runs:
+            interval = min(run.next_available for run in runs.values()) + RUN_MARGIN - now
+        else:
+            interval = self.fallback_ttl
+        if volatile:
+            interval = min(interval, self.volatile_interval)
+        expires_at = now + min(max(interval, self.min_interval), self.max_interval)
+        return min(expires_at, next_utc_midnight(now) + DATE_MARGIN)
+
+    @staticmethod
+    def has_new_run(known: Mapping[str, ModelRun], latest: Mapping[str, ModelRun]) -> bool:
+        """Return True when any model published a run newer than the series was built from.
+
+        Without metadata (or for a series of unknown origin) a newer run cannot be
+        ruled out, so this returns True.
+        """
+        if not latest or not known:
+            return True
+        for url, run in latest.items():
+            old = known.get(url)
+            if old is None or run.initialised > old.initialised:
+                return True
+        return False
+
+
+def next_utc_midnight(now: datetime) -> datetime:
+    """Return the start of the UTC day after `now`."""
+    return datetime.combine(now.astimezone(timezone.utc).date() + timedelta(days=1), time.min, tzinfo=timezone.utc)
+
+
+def safety_limits(habitat: Optional[str] = None, thresholds: Optional[Mapping[str, Any]] = None) -> Dict[str, float]:
+    """Return the wind/wave limits of a habitat preset, overridden by explicit thresholds.
+
+    Keys the preset does not define fall back to DEFAULT_OCEAN_THRESHOLDS.
+    """
+    preset = HABITAT_PRESETS.get(habitat or "") or {}
+    limits: Dict[str, float] = {}
+    for key in VOLATILITY_DELTAS:
+        raw = (thresholds or {}).get(key, preset.get(key, DEFAULT_OCEAN_THRESHOLDS.get(key)))
+        try:
+            if raw is not None:
+                limits[key] = float(raw)
+        except (TypeError, ValueError):
+            continue
+    return limits
+
+
+def strictest_limits(all_limits: Iterable[Mapping[str, float]]) -> Dict[str, float]:
+    """Combine the limits of several entries, keeping the lowest value per key."""
+    combined: Dict[str, float] = {}
+    for limits in all_limits:
+        for key, value in (limits or {}).items():
+            combined[key] = min(value, combined.get(key, value))
+    return combined
+
+
+def volatility_reason(
+    old: Optional[HourlySeries],
+    new: HourlySeries,
+    limits: Mapping[str, float],
+    now: datetime,
+    horizon_hours: int = HORIZON_HOURS,
+) -> Optional[str]:
+    """Describe the first large near-limit change between two runs, or return None."""
+    if not old or not new or not limits:
+        return None
+    lo = max(new.index_at_or_before(now), 0)
+    hi = min(lo + horizon_hours, len(new))
+    for limit_key, (names, factor) in _LIMIT_COLUMNS.items():
+        limit = limits.get(limit_key)
+        old_col, new_col = old.column(*names), new.column(*names)
+        if not limit or old_col is None or new_col is None:
+            continue
+        near = limit * NEAR_LIMIT_FRACTION
+        delta = VOLATILITY_DELTAS[limit_key]
+        for i in range(lo, hi):
+            j = old.index_of(new.time_at(i))
+            if j is None:
+                continue
+            before, after = old_col[j] * factor, new_col[i] * factor
+            if math.isnan(before) or math.isnan(after):
+                continue
+            if abs(after - before) >= delta and max(before, after) >= near:
+                return (
+                    f"{limit_key[4:]} {before:.1f} -> {after:.1f} at "
+                    f"{new.time_at(i).strftime('%Y-%m-%dT%H:%MZ')} (limit {limit:g})"
+                )
+    return None
@@ -0,0 +1,204 @@
+"""Integration-wide update scheduler for Fishing Assistant.
+
+One hourly timer runs each entry's update actions every CONF_UPDATE_INTERVAL
+hours, after a per-entry jitter. async_request_run() queues an extra run and
+async_register_live() adds actions run every LIVE_UPDATE_MINUTES.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_change, async_track_time_interval
+
+from .const import DEFAULT_UPDATE_INTERVAL, DOMAIN, LIVE_UPDATE_MINUTES, UPDATE_JITTER_SECONDS
+
+_LOGGER = logging.getLogger(__name__)
+
+# hass.data[DOMAIN] key holding the UpdateScheduler
+DATA_SCHEDULER = "scheduler"
+
+UpdateAction = Callable[[], Awaitable[Any]]
+
+
+def entry_jitter(entry_id: str, spread: int = UPDATE_JITTER_SECONDS) -> int:
+    """Return a stable delay in [0, spread] seconds for an entry."""
+    if spread <= 0:
+        return 0
+    digest = hashlib.sha1(entry_id.encode()).digest()
+    return int.from_bytes(digest[:4], "big") % (spread + 1)
+
+
+@dataclass
+class _EntrySchedule:
+    interval_hours: int
+    jitter: int
+    actions: List[UpdateAction] = field(default_factory=list)
+    pending: Optional[CALLBACK_TYPE] = None
+    runs: int = 0
+    requested: int = 0
+    last_run: Optional[datetime] = None
+
+
+class UpdateScheduler:
+    """Drive the scheduled updates of every entry from a single hourly timer."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._entries: Dict[str, _EntrySchedule] = {}
+        self._unsub_tick: Optional[CALLBACK_TYPE] = None
+        self.ticks = 0
+        self._live: Dict[str, List[UpdateAction]] = {}
+        self._live_busy: Set[str] = set()
+        self._unsub_live: Optional[CALLBACK_TYPE] = None
+        self.live_ticks = 0
+        self.live_runs = 0
+
+    @callback
+    def async_register(self, entry_id: str, interval_hours: int, action: UpdateAction) -> CALLBACK_TYPE:
+        """Run `action` on the entry's schedule; returns a callback that unregisters it."""
+        schedule = self._entries.get(entry_id)
+        if schedule is None:
+            schedule = self._entries[entry_id] = _EntrySchedule(
+                interval_hours=_clamp_interval(interval_hours), jitter=entry_jitter(entry_id)
+            )
+        schedule.actions.append(action)
+        if self._unsub_tick is None:
+            self._unsub_tick = async_track_time_change(self.hass, self._async_on_tick, minute=0, second=0)
+
+        @callback
+        def _unregister() -> None:
+            if action in schedule.actions:
+                schedule.actions.remove(action)
+            if not schedule.actions and self._entries.get(entry_id) is schedule:
+                if schedule.pending is not None:
+                    schedule.pending()
+                del self._entries[entry_id]
+            if not self._entries and self._unsub_tick is not None:
+                self._unsub_tick()
+                self._unsub_tick = None
+
+        return _unregister
+
+    @callback
+    def async_register_live(self, entry_id: str, action: UpdateAction) -> CALLBACK_TYPE:
+        """Run `action` every LIVE_UPDATE_MINUTES; returns a callback that unregisters it."""
+        self._live.setdefault(entry_id, []).append(action)
+        if self._unsub_live is None:
+            self._unsub_live = async_track_time_interval(
+                self.hass, self._async_on_live_tick, timedelta(minutes=LIVE_UPDATE_MINUTES)
+            )
+
+        @callback
+        def _unregister() -> None:
+            actions = self._live.get(entry_id)
+            if actions and action in actions:
+                actions.remove(action)
+            if not actions:
+                self._live.pop(entry_id, None)
+            if not self._live and self._unsub_live is not None:
+                self._unsub_live()
+                self._unsub_live = None
+
+        return _unregister
+
+    @callback
+    def _async_on_live_tick(self, now: datetime) -> None:
+        self.live_ticks += 1
+        for entry_id, actions in self._live.items():
+            schedule = self._entries.get(entry_id)
+            if entry_id in self._live_busy or (schedule is not None and schedule.pending is not None):
+                continue
+            self._live_busy.add(entry_id)
+            self.hass.async_create_task(self._async_run_live(entry_id, list(actions)))
+
+    async def _async_run_live(self, entry_id: str, actions: List[UpdateAction]) -> None:
+        self.live_runs += 1
+        try:
+            for action in actions:
+                try:
+                    await action()
+                except Exception:
+                    _LOGGER.exception("Live update failed for entry %s", entry_id)
+        finally:
+            self._live_busy.discard(entry_id)
+
+    @callback
+    def _async_on_tick(self, now: datetime) -> None:
+        self.ticks += 1
+        for entry_id, schedule in self._entries.items():
+            if now.hour % schedule.interval_hours:
+                continue
+            if schedule.pending is not None:
+                schedule.pending()
+            schedule.pending = async_call_later(
+                self.hass, schedule.jitter, self._make_runner(entry_id, schedule)
+            )
+
+    @callback
+    def async_request_run(self, entry_id: str) -> bool:
+        """Run the entry's actions outside its schedule; returns False for unknown entries."""
+        schedule = self._entries.get(entry_id)
+        if schedule is None:
+            return False
+        schedule.requested += 1
+        if schedule.pending is None:
+            schedule.pending = async_call_later(
+                self.hass, schedule.jitter, self._make_runner(entry_id, schedule)
+            )
+        return True
+
+    def _make_runner(self, entry_id: str, schedule: _EntrySchedule) -> Callable[[datetime], Awaitable[None]]:
+        async def _async_run(now: datetime) -> None:
+            schedule.pending = None
+            schedule.runs += 1
+            schedule.last_run = now
+            for action in list(schedule.actions):
+                try:
+                    await action()
+                except Exception:
+                    _LOGGER.exception("Scheduled update failed for entry %s", entry_id)
+
+        return _async_run
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ticks": self.ticks,
+            "live_ticks": self.live_ticks,
+            "live_runs": self.live_runs,
+            "entries": {
+                entry_id: {
+                    "interval_hours": s.interval_hours,
+                    "jitter_seconds": s.jitter,
+                    "actions": len(s.actions),
+                    "live_actions": len(self._live.get(entry_id, ())),
+                    "runs": s.runs,
+                    "requested_runs": s.requested,
+                    "last_run": s.last_run.isoformat() if s.last_run else None,
+                }
+                for entry_id, s in self._entries.items()
+            },
+        }
+
+
+def _clamp_interval(value: Any) -> int:
+    try:
+        hours = int(float(value))
+    except (TypeError, ValueError):
+        return DEFAULT_UPDATE_INTERVAL
+    return min(max(hours, 1), 24)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> UpdateScheduler:
+    """Return the integration-wide scheduler, creating it on first use."""
+    store = hass.data.setdefault(DOMAIN, {})
+    scheduler: Optional[UpdateScheduler] = store.get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = store[DATA_SCHEDULER] = UpdateScheduler(hass)
+    return scheduler
@@ -23,6 +23,9 @@ _LOGGER = logging.getLogger(__name__)
 class FreshwaterFishingScorer(BaseScorer):
     """Freshwater fishing scoring implementation that fails loudly on missing data."""
 
+    # Scored: temperature, wind, pressure, cloud cover; precipitation feeds the forecast
+    WEATHER_INPUTS = ("temperature_2m", "cloudcover", "precipitation", "wind_speed_10m", "pressure_msl")
+
     def __init__(
         self,
         latitude: float,
@@ -296,6 +299,7 @@ class FreshwaterFishingScorer(BaseScorer):
             raise TypeError("weather_forecast must be a list")
 
         forecast_scores: List[Dict[str, Any]] = []
+        self._begin_forecast()
 
         for weather_data in weather_forecast:
             if not isinstance(weather_data, dict):
@@ -311,13 +315,7 @@ class FreshwaterFishingScorer(BaseScorer):
             if not isinstance(astro_data, dict):
                 raise TypeError("Forecast item's astro must be a dict if provided")
 
-            score_result = self.calculate_score(
-                weather_data=weather_data,
-                astro_data=astro_data,
-                tide_data=None,
-                marine_data=None,
-                current_time=forecast_time,
-            )
+            score_result = self._score_forecast_step(weather_data, astro_data, None, None, forecast_time)
 
             if not isinstance(score_result, dict):
                 raise TypeError("calculate_score returned non-dict in forecast calculation")
@@ -325,6 +323,7 @@ class FreshwaterFishingScorer(BaseScorer):
             score_result["datetime"] = forecast_time.strftime("%Y-%m-%dT%H:%M:%SZ")
             forecast_scores.append(score_result)
 
+        self._end_forecast()
         return forecast_scores
 
     def _score_temperature(self, temperature: float) -> float:
@@ -1,12 +1,12 @@
 """Sensor platform for Fishing Assistant."""
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.sensor import SensorEntity
+from homeassistant.const import EntityCategory
 from homeassistant.util import dt as dt_util
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from datetime import datetime, timezone, date, time
 import logging
-from typing import Any, Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List
 
 from .const import (
     DOMAIN,
@@ -21,243 +21,34 @@ from .const import (
     CONF_SPECIES_ID,
     CONF_HABITAT_PRESET,
     CONF_USE_OPEN_METEO,
+    CONF_GRID_TOLERANCE,
+    DEFAULT_GRID_TOLERANCE,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_UPDATE_INTERVAL,
+    CONF_THRESHOLDS,
 )
 from .score import FreshwaterFishingScorer
 from .ocean_scoring import OceanFishingScorer
 from .species_loader import SpeciesLoader
 from .tide_proxy import TideProxy
 from .marine_data import MarineDataFetcher
+from .http_session import async_get_session
+from .helpers.request_budget import REQUEST_BUDGET
 from .weather_fetcher import WeatherFetcher
 from .data_formatter import DataFormatter
-from .api import OpenMeteoClient
+from .api import BATCH_WINDOW, OpenMeteoClient
+from .open_meteo_adapter import OpenMeteoAdapter
+from .coordinator import FishingDataCoordinator
+from .persistent_cache import get_persistent_cache
+from .scheduler import async_get_scheduler
+from .refresh_planner import safety_limits
 
 _LOGGER = logging.getLogger(__name__)
 
-
-def _try_get(src: Dict[str, Any], *keys: str) -> Any:
-    """Return the first non-None value for a list of possible keys from a mapping."""
-    for k in keys:
-        if not isinstance(k, str):
-            continue
-        # use get to avoid KeyError; return even falsy values (0) as long as not None
-        if k in src:
-            return src.get(k)
-    return None
-
-
-class OpenMeteoAdapter:
-    """
-    Adapter to expose a small, defensive interface compatible with the WeatherFetcher expectations.
-    """
-
-    def __init__(
-        self, client: OpenMeteoClient, latitude: float, longitude: float, include_marine: bool = False
-    ):
-        self._client = client
-        self._lat = latitude
-        self._lon = longitude
-        self._include_marine = include_marine
-
-    async def get_forecast(self, days: int = 7) -> Optional[Dict[str, Dict]]:
-        hourly = await self._client.fetch_hourly_forecast(
-            self._lat, self._lon, include_marine=self._include_marine, forecast_days=days
-        )
-        if not hourly or not isinstance(hourly, list):
-            return None
-
-        per_day: Dict[str, Dict[str, Any]] = {}
-        counts: Dict[str, int] = {}
-
-        for item in hourly:
-            t = item.get("time")
-            try:
-                dt = dt_util.parse_datetime(t) if t else None
-            except Exception:
-                dt = None
-            if dt is None:
-                # skip items we can't parse
-                continue
-            date_key = dt.astimezone(timezone.utc).date().isoformat()
-
-            temp = _try_get(item, "temperature_2m", "temp", "air_temperature")
-            wind_ms = _try_get(item, "wind_speed_10m", "windspeed_10m", "wind_speed")
-            gust_ms = _try_get(
-                item,
-                "wind_gust_10m",
-                "wind_gust",
-                "windgusts_10m",
-                "wind_gusts_10m",
-                "wind_gust_kph",
-            )
-            cloud = _try_get(item, "cloudcover", "cloud_cover", "clouds")
-            precip = _try_get(item, "precipitation", "rain", "precip", "rain_sum")
-            pressure = _try_get(item, "pressure_msl", "pressure")
-
-            if date_key not in per_day:
-                per_day[date_key] = {
-                    "temperature": 0.0,
-                    "wind_speed": 0.0,
-                    "wind_gust": 0.0,
-                    "cloud_cover": 0.0,
-                    "precip_hours": 0,
-                    "pressure": 0.0,
-                }
-                counts[date_key] = 0
-
-            counts[date_key] += 1
-            entry = per_day[date_key]
-
-            if temp is not None:
-                try:
-                    entry["temperature"] += float(temp)
-                except Exception:
-                    _LOGGER.debug("Skipping non-numeric temperature value: %s", temp)
-
-            if wind_ms is not None:
-                try:
-                    # Open-Meteo returns m/s; convert to km/h for integration display/consistency
-                    entry["wind_speed"] += float(wind_ms) * 3.6
-                except Exception:
-                    _LOGGER.debug("Skipping non-numeric wind value: %s", wind_ms)
-
-            if gust_ms is not None:
-                try:
-                    # gust might already be in m/s; convert to km/h when numeric
-                    gust_val = float(gust_ms) * 3.6
-                    if gust_val > entry["wind_gust"]:
-                        entry["wind_gust"] = gust_val
-                except Exception:
-                    _LOGGER.debug("Skipping non-numeric gust value: %s", gust_ms)
-
-            if cloud is not None:
-                try:
-                    entry["cloud_cover"] += float(cloud)
-                except Exception:
-                    _LOGGER.debug("Skipping non-numeric cloud value: %s", cloud)
-
-            if precip is not None:
-                try:
-                    if float(precip) > 0:
-                        entry["precip_hours"] += 1
-                except Exception:
-                    _LOGGER.debug("Skipping non-numeric precip value: %s", precip)
-
-            if pressure is not None:
-                try:
-                    entry["pressure"] += float(pressure)
-                except Exception:
-                    _LOGGER.debug("Skipping non-numeric pressure value: %s", pressure)
-
-        final: Dict[str, Dict] = {}
-        sorted_dates = sorted(per_day.keys())[:days]
-        for d in sorted_dates:
-            cnt = counts.get(d, 1) or 1
-            e = per_day[d]
-
-            avg_temp = e["temperature"] / cnt if cnt else None
-            avg_wind = e["wind_speed"] / cnt if cnt else None
-            gust = e["wind_gust"] or None
-            if not gust and avg_wind is not None:
-                gust = avg_wind * 1.2
-
-            avg_cloud = e["cloud_cover"] / cnt if cnt else None
-            precip_pct = int(round((e["precip_hours"] / cnt) * 100)) if cnt else 0
-            avg_pressure = e["pressure"] / cnt if cnt else None
-
-            final[d] = {
-                "temperature": float(avg_temp) if avg_temp is not None else None,
-                "wind_speed": float(avg_wind) if avg_wind is not None else None,
-                "wind_gust": float(gust) if gust is not None else None,
-                "cloud_cover": int(round(avg_cloud)) if avg_cloud is not None else None,
-                "precipitation_probability": int(precip_pct),
-                "pressure": float(avg_pressure) if avg_pressure is not None else None,
-            }
-
-        return final or None
-
-    async def get_current(self) -> Optional[Dict]:
-        hourly = await self._client.fetch_hourly_forecast(
-            self._lat, self._lon, include_marine=self._include_marine, forecast_days=1
-        )
-        if not hourly or not isinstance(hourly, list):
-            return None
-
-        now = datetime.now(timezone.utc)
-        best = None
-        best_delta = None
-        for item in hourly:
-            t = item.get("time")
-            try:
-                dt = dt_util.parse_datetime(t) if t else None
-            except Exception:
-                dt = None
-            if dt is None:
-                continue
-            dt = dt.astimezone(timezone.utc)
-            delta = abs((dt - now).total_seconds())
-            if best is None or delta < best_delta:
-                best = item
-                best_delta = delta
-
-        if not best:
-            return None
-
-        temp = _try_get(best, "temperature_2m", "temp", "air_temperature")
-        wind_ms = _try_get(best, "wind_speed_10m", "windspeed_10m", "wind_speed")
-        gust_ms = _try_get(
-            best,
-            "wind_gust_10m",
-            "wind_gust",
-            "windgusts_10m",
-            "wind_gusts_10m",
-            "wind_gust_kph",
-        )
-        cloud = _try_get(best, "cloudcover", "cloud_cover", "clouds")
-        precip = _try_get(best, "precipitation", "rain", "precip", "rain_sum")
-        pressure = _try_get(best, "pressure_msl", "pressure")
-
-        try:
-            temperature = float(temp) if temp is not None else None
-        except Exception:
-            temperature = None
-
-        try:
-            wind_speed = float(wind_ms) * 3.6 if wind_ms is not None else None
-        except Exception:
-            wind_speed = None
-
-        try:
-            wind_gust = (
-                float(gust_ms) * 3.6
-                if gust_ms is not None
-                else (wind_speed * 1.2 if wind_speed else None)
-            )
-        except Exception:
-            wind_gust = wind_speed * 1.2 if wind_speed else None
-
-        try:
-            cloud_cover = int(round(float(cloud))) if cloud is not None else None
-        except Exception:
-            cloud_cover = None
-
-        try:
-            precipitation_probability = 100 if (precip is not None and float(precip) > 0) else 0
-        except Exception:
-            precipitation_probability = 0
-
-        try:
-            pressure_val = float(pressure) if pressure is not None else None
-        except Exception:
-            pressure_val = None
-
-        return {
-            "temperature": temperature,
-            "wind_speed": wind_speed,
-            "wind_gust": wind_gust,
-            "cloud_cover": cloud_cover,
-            "precipitation_probability": precipitation_probability,
-            "pressure": pressure_val,
-        }
+# hass.data[DOMAIN] key holding the OpenMeteoClient shared by all entries
+DATA_OPEN_METEO_CLIENT = "open_meteo_client"
+# hass.data[DOMAIN] key holding the entry that provides the integration's budget sensor
+DATA_BUDGET_SENSOR = "open_meteo_budget_sensor"
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities):
@@ -285,6 +76,62 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
         await _setup_freshwater_sensors(hass, config_entry, async_add_entities)
 
 
+def _get_shared_client(hass: HomeAssistant) -> OpenMeteoClient:
+    """Return the OpenMeteoClient shared by all entries, so their fetches can be batched."""
+    store = hass.data.setdefault(DOMAIN, {})
+    client = store.get(DATA_OPEN_METEO_CLIENT)
+    if client is None:
+        client = OpenMeteoClient(session=async_get_session(hass), batch_window=BATCH_WINDOW)
+        store[DATA_OPEN_METEO_CLIENT] = client
+    return client
+
+
+def _budget_sensors(hass: HomeAssistant, config_entry: ConfigEntry) -> List[SensorEntity]:
+    """Return the integration's single budget sensor if no other entry provides it yet."""
+    store = hass.data.setdefault(DOMAIN, {})
+    owner = store.get(DATA_BUDGET_SENSOR)
+    if owner is not None and owner != config_entry.entry_id:
+        return []
+    store[DATA_BUDGET_SENSOR] = config_entry.entry_id
+    return [OpenMeteoBudgetSensor(config_entry.entry_id)]
+
+
+def _grid_tolerance(config_entry: ConfigEntry) -> float:
+    """Return the configured grid-cell size in degrees (options override data)."""
+    raw = config_entry.options.get(
+        CONF_GRID_TOLERANCE, config_entry.data.get(CONF_GRID_TOLERANCE, DEFAULT_GRID_TOLERANCE)
+    )
+    try:
+        value = float(raw)
+    except (TypeError, ValueError):
+        _LOGGER.warning("Invalid grid tolerance %r; using %s", raw, DEFAULT_GRID_TOLERANCE)
+        return DEFAULT_GRID_TOLERANCE
+    return value if value > 0 else DEFAULT_GRID_TOLERANCE
+
+
+def _update_interval(config_entry: ConfigEntry) -> int:
+    """Return the configured hours between scheduled updates (options override data)."""
+    raw = config_entry.options.get(
+        CONF_UPDATE_INTERVAL, config_entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+    )
+    try:
+        value = int(float(raw))
+    except (TypeError, ValueError):
+        _LOGGER.warning("Invalid update interval %r; using %s", raw, DEFAULT_UPDATE_INTERVAL)
+        return DEFAULT_UPDATE_INTERVAL
+    return min(max(value, 1), 24)
+
+
+def _volatile_callback(hass: HomeAssistant, entry_id: str) -> Callable[[str], None]:
+    """Return the callback that runs an out-of-cycle update when the forecast turns volatile."""
+
+    def _on_volatile(reason: str) -> None:
+        _LOGGER.debug("Out-of-cycle update for entry %s: %s", entry_id, reason)
+        async_get_scheduler(hass).async_request_run(entry_id)
+
+    return _on_volatile
+
+
 async def _setup_freshwater_sensors(hass, config_entry, async_add_entities):
     """Set up freshwater fishing sensors."""
     data = config_entry.data
@@ -313,9 +160,20 @@ async def _setup_freshwater_sensors(hass, config_entry, async_add_entities):
         _LOGGER.error("Only Open-Meteo is supported; config must enable use_open_meteo")
         raise RuntimeError("Open-Meteo must be enabled (no HA weather entity fallback)")
 
-    session = async_get_clientsession(hass)
-    client = OpenMeteoClient(session=session)
-    open_meteo_adapter = OpenMeteoAdapter(client, lat, lon, include_marine=False)
+    client = _get_shared_client(hass)
+    grid_tolerance = _grid_tolerance(config_entry)
+    open_meteo_adapter = OpenMeteoAdapter(
+        client,
+        lat,
+        lon,
+        include_marine=False,
+        grid_tolerance=grid_tolerance,
+        member=config_entry.entry_id,
+        persistent_cache=get_persistent_cache(hass),
+        safety_limits=safety_limits(body_type, data.get(CONF_THRESHOLDS)),
+        on_volatile=_volatile_callback(hass, config_entry.entry_id),
+        inputs=FreshwaterFishingScorer.required_inputs(data),
+    )
 
     species_loader = SpeciesLoader(hass)
     await species_loader.async_load_profiles()
@@ -327,7 +185,24 @@ async def _setup_freshwater_sensors(hass, config_entry, async_add_entities):
             raise RuntimeError(f"Missing species profile for: {fish}")
 
     weather_fetcher = WeatherFetcher(
-        hass, lat, lon, use_open_meteo=use_open_meteo, open_meteo_client=open_meteo_adapter
+        hass,
+        lat,
+        lon,
+        use_open_meteo=use_open_meteo,
+        open_meteo_client=open_meteo_adapter,
+        grid_tolerance=grid_tolerance,
+        member=config_entry.entry_id,
+    )
+
+    # One coordinator per entry: weather, forecast and astro are fetched once per
+    # cycle and shared by every species sensor of this location.
+    coordinator = FishingDataCoordinator(
+        hass,
+        config_entry.entry_id,
+        lat,
+        lon,
+        weather_fetcher=weather_fetcher,
+        astro_days=2,
     )
 
     for fish in fish_list:
@@ -342,12 +217,14 @@ async def _setup_freshwater_sensors(hass, config_entry, async_add_entities):
                 timezone=tz,
                 elevation=elevation,
                 period_type=period_type,
-                weather_fetcher=weather_fetcher,
+                coordinator=coordinator,
                 species_loader=species_loader,
                 config_entry_id=config_entry.entry_id,
+                update_interval=_update_interval(config_entry),
             )
         )
 
+    sensors.extend(_budget_sensors(hass, config_entry))
     async_add_entities(sensors)
 
 
@@ -374,10 +251,22 @@ async def _setup_ocean_sensors(hass, config_entry, async_add_entities):
         _LOGGER.error("Only Open-Meteo is supported; config must enable use_open_meteo")
         raise RuntimeError("Open-Meteo must be enabled (no HA weather entity fallback)")
 
-    session = async_get_clientsession(hass)
-    client = OpenMeteoClient(session=session)
+    client = _get_shared_client(hass)
+    grid_tolerance = _grid_tolerance(config_entry)
+    inputs = OceanFishingScorer.required_inputs(data)
+    if data.get(CONF_MARINE_ENABLED, True):
+        inputs = inputs.union(MarineDataFetcher.required_inputs())
     open_meteo_adapter = OpenMeteoAdapter(
-        client, lat, lon, include_marine=data.get(CONF_MARINE_ENABLED, True)
+        client,
+        lat,
+        lon,
+        include_marine=data.get(CONF_MARINE_ENABLED, True),
+        grid_tolerance=grid_tolerance,
+        member=config_entry.entry_id,
+        persistent_cache=get_persistent_cache(hass),
+        safety_limits=safety_limits(data.get(CONF_HABITAT_PRESET), data.get(CONF_THRESHOLDS)),
+        on_volatile=_volatile_callback(hass, config_entry.entry_id),
+        inputs=inputs,
     )
 
     location_key = f"{name.lower().replace(' ', '_')}"
@@ -386,29 +275,66 @@ async def _setup_ocean_sensors(hass, config_entry, async_add_entities):
     marine_fetcher = None
 
     weather_fetcher = WeatherFetcher(
-        hass, lat, lon, use_open_meteo=use_open_meteo, open_meteo_client=open_meteo_adapter
+        hass,
+        lat,
+        lon,
+        use_open_meteo=use_open_meteo,
+        open_meteo_client=open_meteo_adapter,
+        grid_tolerance=grid_tolerance,
+        member=config_entry.entry_id,
     )
 
     if data.get(CONF_TIDE_MODE) == TIDE_MODE_PROXY:
-        tide_proxy = TideProxy(hass, lat, lon)
+        tide_proxy = TideProxy(hass, lat, lon, member=config_entry.entry_id)
 
     if data.get(CONF_MARINE_ENABLED, True):
-        marine_fetcher = MarineDataFetcher(hass, lat, lon)
+        # Marine data is derived from the adapter's merged hourly series: one marine request per cycle
+        marine_fetcher = MarineDataFetcher(
+            hass,
+            lat,
+            lon,
+            hourly_source=open_meteo_adapter,
+            grid_tolerance=grid_tolerance,
+            member=config_entry.entry_id,
+        )
+
+    # Ocean scoring uses the 7-day astro forecast for its forecast steps as well
+    coordinator = FishingDataCoordinator(
+        hass,
+        config_entry.entry_id,
+        lat,
+        lon,
+        weather_fetcher=weather_fetcher,
+        tide_proxy=tide_proxy,
+        marine_fetcher=marine_fetcher,
+        astro_days=7,
+    )
 
     sensors.append(
         OceanFishingScoreSensor(
             hass=hass,
             config_entry=config_entry,
-            tide_proxy=tide_proxy,
-            marine_fetcher=marine_fetcher,
-            weather_fetcher=weather_fetcher,
+            coordinator=coordinator,
             location_key=location_key,
+            update_interval=_update_interval(config_entry),
         )
     )
+    sensors.extend(_budget_sensors(hass, config_entry))
 
     async_add_entities(sensors)
 
 
+def _track_visibility(entity: SensorEntity, coordinator: FishingDataCoordinator, member: str) -> None:
+    """Tell the entry's Open-Meteo adapter whether `entity` is visible, until it is removed."""
+    source = getattr(coordinator.weather_fetcher, "open_meteo_client", None)
+    if not isinstance(source, OpenMeteoAdapter):
+        return
+    registry_entry = entity.registry_entry
+    visible = registry_entry is None or (registry_entry.hidden_by is None and registry_entry.disabled_by is None)
+    source.set_entity_visible(member, entity.entity_id, visible)
+    entity.async_on_remove(lambda: source.set_entity_visible(member, entity.entity_id, None))
+
+
 # ====#
 # FRESHWATER SENSOR CLASS
 # ====#
@@ -417,7 +343,8 @@ async def _setup_ocean_sensors(hass, config_entry, async_add_entities):
 class FishScoreSensor(SensorEntity):
     """Sensor for freshwater fishing score."""
 
-    should_poll = True
+    # Updates are driven by the integration-wide scheduler (see scheduler.py)
+    should_poll = False
 
     def __init__(
         self,
@@ -430,19 +357,20 @@ class FishScoreSensor(SensorEntity):
         timezone,
         elevation,
         period_type,
-        weather_fetcher,
+        coordinator,
         species_loader,
         config_entry_id,
+        update_interval: int = DEFAULT_UPDATE_INTERVAL,
     ):
         self.hass = hass
-        self._last_update_hour: Optional[int] = None
         self._config_entry_id = config_entry_id
+        self._update_interval = update_interval
         self._device_identifier = f"{name}_{lat}_{lon}"
         self._name = f"{name.lower().replace(' ', '_')}_{fish}_score"
         self._friendly_name = f"{name} ({fish.title()}) Fishing Score"
         self._state = None
         self._species_loader = species_loader
-        self._weather_fetcher = weather_fetcher
+        self._coordinator = coordinator
 
         species_profile = species_loader.get_species(fish)
         species_profiles = {fish: species_profile} if species_profile else {}
@@ -506,22 +434,55 @@ class FishScoreSensor(SensorEntity):
             "via_device": None,
         }
 
-    async def async_update(self):
-        """Fetch the current score and forecast."""
-        now = dt_util.now()
-        update_hours = [0, 6, 12, 18]
+    async def async_added_to_hass(self):
+        """Register with the update scheduler and compute the first score."""
+        _track_visibility(self, self._coordinator, self._config_entry_id)
+        scheduler = async_get_scheduler(self.hass)
+        self.async_on_remove(
+            scheduler.async_register(self._config_entry_id, self._update_interval, self._async_scheduled_update)
+        )
+        self.async_on_remove(scheduler.async_register_live(self._config_entry_id, self._async_live_update))
+        self.async_schedule_update_ha_state(True)
 
-        if self._last_update_hour is not None and now.hour not in update_hours:
-            _LOGGER.debug("Skipping update for %s; not in update hours: %s", self._name, now.hour)
-            return
+    async def _async_scheduled_update(self):
+        await self.async_update_ha_state(force_refresh=True)
 
-        if self._last_update_hour == now.hour:
-            _LOGGER.debug("Already updated this hour for %s", self._name)
+    async def _async_live_update(self):
+        """Rescore from the live current conditions between scheduled updates (forecast untouched)."""
+        if self._state is None:
+            return
+        snapshot = await self._coordinator.async_refresh_current()
+        if snapshot is None:
             return
+        now = dt_util.now()
+        try:
+            result = self._scorer.calculate_score(
+                weather_data=snapshot.weather, astro_data=self._get_astro_data(snapshot), current_time=now
+            )
+        except Exception:
+            _LOGGER.debug("Live rescoring failed for %s", self._name, exc_info=True)
+            return
+        if not isinstance(result, dict):
+            return
+        self._state = result.get("score")
+        self._attrs.update(
+            {
+                "component_scores": result.get("component_scores", {}),
+                "score_breakdown": result.get("component_scores", {}),
+                "weather_snapshot_raw": snapshot.weather,
+                "live_updated": snapshot.live_at.isoformat() if snapshot.live_at else None,
+            }
+        )
+        self.async_write_ha_state()
+
+    async def async_update(self):
+        """Fetch the current score and forecast."""
+        now = dt_util.now()
 
         try:
-            weather_data_raw = await self._weather_fetcher.get_weather_data()
-            astro_data = await self._get_astro_data()
+            snapshot = await self._coordinator.async_get_snapshot(now)
+            weather_data_raw = snapshot.weather
+            astro_data = self._get_astro_data(snapshot)
 
             result = self._scorer.calculate_score(
                 weather_data=weather_data_raw, astro_data=astro_data, current_time=now
@@ -539,13 +500,15 @@ class FishScoreSensor(SensorEntity):
                     "component_scores": result.get("component_scores", {}),
                     "score_breakdown": result.get("score_breakdown", {}) or result.get("component_scores", {}),
                     "last_updated": now.isoformat(),
+                    "data_stale_since": snapshot.stale_since.isoformat() if snapshot.stale_since else None,
+                    "live_updated": snapshot.live_at.isoformat() if snapshot.live_at else None,
                     "weather_snapshot_raw": weather_data_raw or {},
                     "astro_snapshot_raw": astro_data or {},
                 }
             )
 
-            # Forecast: let errors surface
-            forecast_raw = await self._weather_fetcher.get_forecast(days=7)
+            # Forecast comes from the shared snapshot
+            forecast_raw = snapshot.forecast
             if forecast_raw and isinstance(forecast_raw, dict):
                 forecast_list = []
                 for date_str, data in forecast_raw.items():
@@ -577,8 +540,6 @@ class FishScoreSensor(SensorEntity):
                     # Keep a compact per-step summary
                     self._attrs["score_breakdown"] = result.get("component_scores", {})
 
-            self._last_update_hour = now.hour
-
             _LOGGER.debug(
                 "Updated %s: score=%s, component_scores=%s", self._name, self._state, self._attrs.get("component_scores")
             )
@@ -587,54 +548,19 @@ class FishScoreSensor(SensorEntity):
             _LOGGER.exception("Error updating freshwater sensor %s - bubbling up", self._name)
             raise
 
-    async def _get_astro_data(self):
-        """Compute astronomical data using the integration's internal calculator.
+    def _get_astro_data(self, snapshot):
+        """Return today's astronomical data from the coordinator snapshot.
 
-        This function does NOT read any Home Assistant moon sensor. Instead it calls
-        helpers.astro.calculate_astronomy_forecast(...) and returns a dict with
-        parsed datetime objects for sunrise/sunset/moonrise/moonset/moon_transit/moon_underfoot
-        where available, and a numeric `moon_phase` in 0..1 when computable.
+        The astro forecast is computed once per cycle by the entry coordinator via
+        helpers.astro.calculate_astronomy_forecast (no Home Assistant moon sensor is
+        read). Returns parsed datetimes for sunrise/sunset/moonrise/moonset/moon_transit/
+        moon_underfoot where available, and a numeric `moon_phase` in 0..1 when computable.
         """
-        astro: Dict[str, Any] = {}
         try:
-            from .helpers.astro import calculate_astronomy_forecast
-
-            lat = self._attrs.get("lat") if isinstance(self._attrs, dict) else None
-            lon = self._attrs.get("lon") if isinstance(self._attrs, dict) else None
-            if lat is None or lon is None:
-                # fallback to scorer attributes if present
-                lat = getattr(self._scorer, "latitude", None)
-                lon = getattr(self._scorer, "longitude", None)
-
-            try:
-                forecast = await calculate_astronomy_forecast(self.hass, float(lat), float(lon), days=2)
-            except Exception:
-                forecast = {}
-
-            today_iso = dt_util.as_local(dt_util.now()).date().isoformat()
-            today_entry = (forecast or {}).get(today_iso) if isinstance(forecast, dict) else {}
-
-            if isinstance(today_entry, dict):
-                # moon phase
-                mp = today_entry.get("moon_phase")
-                try:
-                    if mp is not None:
-                        astro["moon_phase"] = float(mp)
-                except Exception:
-                    astro["moon_phase"] = None
-
-                # times: parse ISO strings into datetimes
-                for k in ("sunrise", "sunset", "moonrise", "moonset", "moon_transit", "moon_underfoot"):
-                    v = today_entry.get(k)
-                    if v:
-                        try:
-                            astro[k] = dt_util.parse_datetime(str(v))
-                        except Exception:
-                            astro[k] = None
+            return snapshot.astro_for_today()
         except Exception:
-            _LOGGER.debug("Failed to compute astro data via internal calculator", exc_info=True)
-
-        return astro
+            _LOGGER.debug("Failed to read astro data from coordinator snapshot", exc_info=True)
+            return {}
 
 
 # ====#
@@ -645,15 +571,15 @@ class FishScoreSensor(SensorEntity):
 class OceanFishingScoreSensor(SensorEntity):
     """Main ocean fishing score sensor."""
 
-    should_poll = True
+    # Updates are driven by the integration-wide scheduler (see scheduler.py)
+    should_poll = False
 
-    def __init__(self, hass, config_entry, tide_proxy, marine_fetcher, weather_fetcher, location_key):
+    def __init__(self, hass, config_entry, coordinator, location_key, update_interval: int = DEFAULT_UPDATE_INTERVAL):
         """Initialize the ocean fishing score sensor."""
         self.hass = hass
         self._config_entry = config_entry
-        self._tide_proxy = tide_proxy
-        self._marine_fetcher = marine_fetcher
-        self._weather_fetcher = weather_fetcher
+        self._update_interval = update_interval
+        self._coordinator = coordinator
 
         data = config_entry.data
         name = data["name"]
@@ -664,14 +590,19 @@ class OceanFishingScoreSensor(SensorEntity):
         species_loader = SpeciesLoader(hass)
 
         self._scorer = OceanFishingScorer(
-            latitude=lat, longitude=lon, species=[species_id], species_profiles={}, hass=hass, config=data
+            latitude=lat,
+            longitude=lon,
+            species=[species_id],
+            species_profiles={},
+            hass=hass,
+            config=data,
+            cache_owner=config_entry.entry_id,
         )
 
         self._device_identifier = f"{name}_{lat}_{lon}_ocean"
         self._name = f"{name.lower().replace(' ', '_')}_ocean_fishing_score"
         self._friendly_name = f"{name} Ocean Fishing Score"
         self._state = None
-        self._last_update_hour: Optional[int] = None
 
         # Minimal attributes initially; full canonical attributes will be produced on update
         self._attrs: Dict[str, Any] = {
@@ -731,24 +662,17 @@ class OceanFishingScoreSensor(SensorEntity):
     async def async_update(self):
         """Update the fishing score and package all telemetry into the main sensor attributes."""
         now = dt_util.now()
-        update_hours = [0, 6, 12, 18]
-
-        if self._last_update_hour is not None and now.hour not in update_hours:
-            _LOGGER.debug(
-                "Skipping update for ocean sensor %s; not in update hours: %s", self._name, now.hour
-            )
-            return
-
-        if self._last_update_hour == now.hour:
-            _LOGGER.debug("Already updated this hour for ocean sensor %s", self._name)
-            return
 
         try:
-            # Gather raw data (WeatherFetcher now raises on failure)
-            weather_data_raw = await self._weather_fetcher.get_weather_data()
-            tide_data_raw = await self._tide_proxy.get_tide_data() if self._tide_proxy else None
-            marine_data_raw = await self._marine_fetcher.get_marine_data() if self._marine_fetcher else None
-            astro_data = await self._get_astro_data()
+            # Gather raw data from the entry coordinator (raises when the weather fetch failed)
+            snapshot = await self._coordinator.async_get_snapshot(now)
+            weather_data_raw = snapshot.weather
+            tide_data_raw = snapshot.tide
+            marine_data_raw = snapshot.marine
+            astro_data = self._get_astro_data(snapshot)
+
+            # Reuse the coordinator's 7-day astro forecast for per-step forecast scoring
+            self._scorer.set_astro_forecast(snapshot.astro_forecast, snapshot.fetched_at)
 
             # Always populate raw snapshot attributes for inspectability (even on errors)
             self._attrs.update(
@@ -816,8 +740,8 @@ class OceanFishingScoreSensor(SensorEntity):
             # Update numeric state
             self._state = result.get("score")
 
-            # Forecast (may raise) — let failures bubble up
-            forecast_raw = await self._weather_fetcher.get_forecast(days=7)
+            # Forecast from the shared snapshot
+            forecast_raw = snapshot.forecast
 
             # Convert tide/marine forecast shapes into lists usable by scorer.calculate_forecast
             def _to_list_forecast(f_obj: Any) -> List[Dict[str, Any]]:
@@ -940,21 +864,17 @@ class OceanFishingScoreSensor(SensorEntity):
                     "weather_snapshot_raw": self._attrs.get("weather_snapshot_raw", {}),
                     "astro_snapshot_raw": self._attrs.get("astro_snapshot_raw", {}),
                     "score_breakdown": self._attrs.get("score_breakdown", {}),
+                    "data_stale_since": snapshot.stale_since.isoformat() if snapshot.stale_since else None,
+                    "live_updated": snapshot.live_at.isoformat() if snapshot.live_at else None,
                 }
             )
 
             self._attrs = merged
 
             # Add a compact 'safety' summary (scorer.check_safety returns status + reasons)
-            try:
-                weather_formatted = DataFormatter.format_weather_data(weather_data_raw)
-                marine_formatted = DataFormatter.format_marine_data(marine_data_raw) if marine_data_raw else {"current": {}, "forecast": {}}
-                safety_status, safety_reasons = self._scorer.check_safety(weather_formatted, marine_formatted)
-                self._attrs["safety"] = {"status": safety_status, "reasons": safety_reasons}
-            except Exception:
-                _LOGGER.debug("Safety check failed while updating ocean sensor attributes", exc_info=True)
-
-            self._last_update_hour = now.hour
+            safety = self._safety_summary(weather_data_raw, marine_data_raw)
+            if safety is not None:
+                self._attrs["safety"] = safety
 
             _LOGGER.debug(
                 "Updated %s: score=%s, component_scores=%s", self._name, self._state, self._attrs.get("score_breakdown")
@@ -964,11 +884,22 @@ class OceanFishingScoreSensor(SensorEntity):
             _LOGGER.exception("Error updating ocean fishing score for %s - bubbling up", self._name)
             raise
 
-    async def _get_astro_data(self):
-        """Compute astronomical data using the integration's internal calculator.
+    def _safety_summary(self, weather_data_raw, marine_data_raw) -> Optional[Dict[str, Any]]:
+        """Return {"status", "reasons"} from scorer.check_safety, or None when the check fails."""
+        try:
+            weather_formatted = DataFormatter.format_weather_data(weather_data_raw)
+            marine_formatted = DataFormatter.format_marine_data(marine_data_raw) if marine_data_raw else {"current": {}, "forecast": {}}
+            safety_status, safety_reasons = self._scorer.check_safety(weather_formatted, marine_formatted)
+        except Exception:
+            _LOGGER.debug("Safety check failed while updating ocean sensor attributes", exc_info=True)
+            return None
+        return {"status": safety_status, "reasons": safety_reasons}
+
+    def _get_astro_data(self, snapshot):
+        """Return today's astronomical data from the coordinator snapshot.
 
-        Uses our helpers/astro.calculate_astronomy_forecast (Skyfield + de421.bsp).
-        Does NOT read Home Assistant sun/moon entities.
+        The coordinator computes the astro forecast with helpers/astro.calculate_astronomy_forecast
+        (Skyfield + de421.bsp); Home Assistant sun/moon entities are not read.
         Returns dict with keys:
           - moon_phase: float or None
           - moonrise, moonset, moon_transit, moon_underfoot: datetime or None
@@ -976,50 +907,9 @@ class OceanFishingScoreSensor(SensorEntity):
         """
         astro: Dict[str, Any] = {}
         try:
-            from .helpers.astro import calculate_astronomy_forecast
-
-            # Ocean sensor stores lat/lon under "latitude"/"longitude" in _attrs
-            lat = self._attrs.get("latitude") if isinstance(self._attrs, dict) else None
-            lon = self._attrs.get("longitude") if isinstance(self._attrs, dict) else None
-
-            # Fallback to scorer attributes if not present
-            if lat is None or lon is None:
-                lat = getattr(self._scorer, "latitude", None)
-                lon = getattr(self._scorer, "longitude", None)
-
-            if lat is None or lon is None:
-                # Ensure explicit keys so UI shows nulls rather than missing keys
-                for k in ("moon_phase", "moonrise", "moonset", "moon_transit", "moon_underfoot", "sunrise", "sunset"):
-                    astro.setdefault(k, None)
-                return astro
-
-            try:
-                forecast = await calculate_astronomy_forecast(self.hass, float(lat), float(lon), days=2)
-            except Exception:
-                forecast = {}
-
-            today_iso = dt_util.as_local(dt_util.now()).date().isoformat()
-            today_entry = (forecast or {}).get(today_iso) if isinstance(forecast, dict) else {}
-
-            if isinstance(today_entry, dict):
-                # moon phase
-                mp = today_entry.get("moon_phase")
-                try:
-                    if mp is not None:
-                        astro["moon_phase"] = float(mp)
-                except Exception:
-                    astro["moon_phase"] = None
-
-                # times: parse ISO strings into datetimes
-                for k in ("sunrise", "sunset", "moonrise", "moonset", "moon_transit", "moon_underfoot"):
-                    v = today_entry.get(k)
-                    if v:
-                        try:
-                            astro[k] = dt_util.parse_datetime(str(v))
-                        except Exception:
-                            astro[k] = None
+            astro = snapshot.astro_for_today()
         except Exception:
-            _LOGGER.debug("Failed to compute astro data via internal calculator (ocean)", exc_info=True)
+            _LOGGER.debug("Failed to read astro data from coordinator snapshot (ocean)", exc_info=True)
 
         # Ensure keys exist (None if missing) for consistent attributes
         for k in ("moon_phase", "moonrise", "moonset", "moon_transit", "moon_underfoot", "sunrise", "sunset"):
@@ -1042,5 +932,141 @@ class OceanFishingScoreSensor(SensorEntity):
         except Exception:
             _LOGGER.debug("Error reading species_profile for %s", self._name, exc_info=True)
 
+        _track_visibility(self, self._coordinator, self._config_entry.entry_id)
+        scheduler = async_get_scheduler(self.hass)
+        self.async_on_remove(
+            scheduler.async_register(self._config_entry.entry_id, self._update_interval, self._async_scheduled_update)
+        )
+        self.async_on_remove(scheduler.async_register_live(self._config_entry.entry_id, self._async_live_update))
+
         # Run initial update - allow errors to surface
-        await self.async_update()
\ No newline at end of file
+        await self.async_update()
+
+    async def _async_scheduled_update(self):
+        await self.async_update_ha_state(force_refresh=True)
+
+    async def _async_live_update(self):
+        """Rescore and recheck safety from the live current conditions (forecast untouched)."""
+        if self._state is None:
+            return
+        snapshot = await self._coordinator.async_refresh_current()
+        if snapshot is None:
+            return
+        now = dt_util.now()
+        try:
+            result = self._scorer.calculate_score(
+                weather_data=snapshot.weather,
+                astro_data=self._get_astro_data(snapshot),
+                tide_data=snapshot.tide,
+                marine_data=snapshot.marine,
+                current_time=now,
+            )
+        except Exception:
+            _LOGGER.debug("Live rescoring failed for %s", self._name, exc_info=True)
+            return
+        if not isinstance(result, dict):
+            return
+        self._state = result.get("score")
+        self._attrs.update(
+            {
+                "score": self._state,
+                "conditions": str(result.get("conditions_summary") or result.get("conditions") or ""),
+                "component_scores": DataFormatter.format_component_scores(result.get("component_scores") or {}),
+                "score_breakdown": result.get("component_scores", {}),
+                "weather": DataFormatter.format_weather_data(snapshot.weather),
+                "weather_snapshot_raw": snapshot.weather,
+                "live_updated": snapshot.live_at.isoformat() if snapshot.live_at else None,
+            }
+        )
+        if snapshot.marine:
+            self._attrs["marine"] = DataFormatter.format_marine_data(snapshot.marine)
+            self._attrs["marine_snapshot_raw"] = snapshot.marine
+        safety = self._safety_summary(snapshot.weather, snapshot.marine)
+        if safety is not None:
+            self._attrs["safety"] = safety
+        self.async_write_ha_state()
+
+# ====#
+# DIAGNOSTIC SENSORS
+# ====#
+
+
+class OpenMeteoBudgetSensor(SensorEntity):
+    """Open-Meteo calls made today by the whole integration (see helpers/request_budget.py).
+
+    One sensor exists per integration, on the entry that was set up first; it is
+    updated by REQUEST_BUDGET whenever a call is recorded instead of polling.
+    """
+
+    should_poll = False
+
+    def __init__(self, config_entry_id: str):
+        self._config_entry_id = config_entry_id
+        self._unique_id = f"{DOMAIN}_open_meteo_budget"
+        self._stats: Dict[str, Any] = REQUEST_BUDGET.stats()
+
+    @property
+    def name(self):
+        return "Open-Meteo Requests Today"
+
+    @property
+    def unique_id(self):
+        return self._unique_id
+
+    @property
+    def entity_category(self):
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def icon(self):
+        return "mdi:counter"
+
+    @property
+    def native_unit_of_measurement(self):
+        return "calls"
+
+    @property
+    def native_value(self):
+        return self._stats.get("calls_today")
+
+    @property
+    def extra_state_attributes(self):
+        limits = self._stats.get("limits") or {}
+        day_limit = limits.get("day")
+        used = self._stats.get("calls_today") or 0
+        return {
+            "daily_limit": day_limit,
+            "daily_used_percent": round(100.0 * used / day_limit, 1) if day_limit else None,
+            "calls_last_hour": self._stats.get("calls_last_hour"),
+            "calls_last_minute": self._stats.get("calls_last_minute"),
+            "in_flight": self._stats.get("in_flight"),
+            "queued": self._stats.get("queued"),
+            "delayed": self._stats.get("delayed"),
+            "rejected": self._stats.get("rejected"),
+            "endpoints": self._stats.get("endpoints", {}),
+        }
+
+    @property
+    def device_info(self):
+        return {
+            "identifiers": {(DOMAIN, "open_meteo")},
+            "name": "Open-Meteo",
+            "manufacturer": "Fishing Assistant",
+            "entry_type": "service",
+        }
+
+    async def async_added_to_hass(self):
+        """Follow REQUEST_BUDGET; once removed, the next entry set up provides the sensor."""
+        self.async_on_remove(REQUEST_BUDGET.add_listener(self._async_budget_changed))
+        self.async_on_remove(self._release_owner)
+
+    @callback
+    def _async_budget_changed(self) -> None:
+        self._stats = REQUEST_BUDGET.stats()
+        self.async_write_ha_state()
+
+    @callback
+    def _release_owner(self) -> None:
+        store = self.hass.data.get(DOMAIN, {})
+        if store.get(DATA_BUDGET_SENSOR) == self._config_entry_id:
+            store.pop(DATA_BUDGET_SENSOR, None)
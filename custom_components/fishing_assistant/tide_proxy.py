@@ -10,6 +10,9 @@ from typing import Any, Dict, Optional, Tuple
 from homeassistant.util import dt as dt_util
 
 from .data_formatter import DataFormatter
+from .helpers.cache import CACHE, NS_TIDE
+from .helpers.ephemeris import EPHEMERIS
+from .persistent_cache import get_persistent_cache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,27 +23,39 @@ _DEFAULT_TTL = 15 * 60  # 15 minutes
 class TideProxy:
     """Calculate tide state using simplified astronomical proxies (sun/moon)."""
 
-    def __init__(self, hass, latitude: float, longitude: float, ttl: int = _DEFAULT_TTL):
+    def __init__(
+        self,
+        hass,
+        latitude: float,
+        longitude: float,
+        ttl: int = _DEFAULT_TTL,
+        member: Optional[str] = None,
+    ):
         """Initialize the tide proxy."""
         self.hass = hass
         self.latitude = float(latitude or 0.0)
         self.longitude = float(longitude or 0.0)
-        self._last_calculation: Optional[datetime] = None
-        self._cache: Optional[Dict[str, Any]] = None
-        self._ttl = int(ttl)
+        self._ttl = timedelta(seconds=int(ttl))
+        self._member = member
+        self._cache_key = f"{self.latitude:.4f}_{self.longitude:.4f}"
+        # The last result is persisted so a restart within the TTL skips the skyfield work
+        self._persistent = get_persistent_cache(hass)
+        self._persist_key = f"tide:{self._cache_key}"
+        entry = self._persistent.get(self._persist_key) if self._persistent else None
+        if entry is not None and isinstance(entry.data, dict) and CACHE.peek(NS_TIDE, self._cache_key) is None:
+            self._store(entry.data, entry.fetched_at)
+
+    def _store(self, data: Dict[str, Any], when: datetime) -> None:
+        CACHE.set(NS_TIDE, self._cache_key, data, owner=self._member, stored_at=when, ttl=self._ttl)
 
     async def get_tide_data(self) -> Dict[str, Any]:
         """Get current tide state and predictions (normalized)."""
         now = dt_util.now()
 
         # Return cached result if fresh
-        try:
-            if self._last_calculation and self._cache:
-                age = (now - self._last_calculation).total_seconds()
-                if age < self._ttl:
-                    return self._cache
-        except Exception:
-            _LOGGER.debug("Cache age check failed; recalculating tide proxy", exc_info=True)
+        cached = CACHE.get(NS_TIDE, self._cache_key)
+        if cached is not None:
+            return cached
 
         try:
             moon_data = await self._get_moon_data()
@@ -68,7 +83,7 @@ class TideProxy:
             # Build a simple per-day tide forecast using astronomical sampling (moon phase at local solar noon)
             try:
                 # Import here to avoid skyfield dependency at module import time
-                from .helpers.astro import calculate_astronomy_forecast  # local import for optional feature
+                from .helpers.astro import astro_state_at, calculate_astronomy_forecast  # local import for optional feature
 
                 try:
                     astro_forecast = await calculate_astronomy_forecast(self.hass, self.latitude, self.longitude, days=7)
@@ -96,7 +111,10 @@ class TideProxy:
                             except Exception:
                                 dt_sample = datetime.now(timezone.utc)
 
-                        moon_data_day = {"phase": moon_phase, "altitude": None}
+                        # Moon altitude at the sampling time from the sampled astro state
+                        state = astro_state_at(self.latitude, self.longitude, dt_sample)
+                        moon_altitude = state.get("moon_altitude") if state else None
+                        moon_data_day = {"phase": moon_phase, "altitude": moon_altitude}
                         state_day = self._calculate_tide_state(moon_data_day, {"elevation": None}, dt_sample)
                         strength_day = self._calculate_tide_strength(moon_data_day)
 
@@ -119,8 +137,9 @@ class TideProxy:
             normalized = DataFormatter.format_tide_data(raw_tide)
 
             # Cache a copy
-            self._cache = normalized
-            self._last_calculation = now
+            self._store(normalized, now)
+            if self._persistent is not None:
+                self._persistent.set(self._persist_key, normalized, now)
 
             return normalized
 
@@ -130,8 +149,7 @@ class TideProxy:
             # add meta for source
             fallback["source"] = "astronomical_calculation"
             fallback["confidence"] = "proxy"
-            self._cache = fallback
-            self._last_calculation = now
+            self._store(fallback, now)
             return fallback
 
     async def _get_moon_data(self) -> Dict[str, Optional[float]]:
@@ -162,44 +180,13 @@ class TideProxy:
                 if isinstance(today_entry, dict):
                     phase_val = today_entry.get("moon_phase")
 
-            # Attempt to compute instantaneous moon altitude using Skyfield (optional import)
+            # Moon altitude from the sampled astro state of today (computed above), else
+            # observed now from the shared ephemeris; None if skyfield is unavailable
             try:
-                # Local import to avoid hard dependency at module import time
-                from skyfield.api import load, wgs84  # type: ignore
-                import os
-
-                # Reuse same ephemeris path as helpers.astro (data/de421.bsp)
-                data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
-                eph_path = os.path.join(data_dir, "de421.bsp")
-
-                def _load_eph():
-                    return load(eph_path)
-
-                # Load ephemeris in executor to avoid blocking the event loop
-                eph = await self.hass.async_add_executor_job(_load_eph)
-                ts = load.timescale()
-
-                now = dt_util.now()
-                # Build skyfield Time from current UTC components
-                t = ts.utc(now.year, now.month, now.day, now.hour, now.minute, now.second)
-
-                earth = eph["earth"]
-                moon = eph["moon"]
-                location = wgs84.latlon(self.latitude, self.longitude)
-
-                # Compute apparent position of the moon from the location (altitude)
-                astrom = earth.at(t).observe(moon).apparent()
-                alt, az, distance = astrom.altaz()
-                try:
-                    altitude = float(getattr(alt, "degrees", None))
-                except Exception:
-                    # alt may be an Angle-like object; attempt conversion
-                    try:
-                        altitude = float(alt.degrees)
-                    except Exception:
-                        altitude = None
+                altitude = await self._async_altitude_now("moon")
             except Exception:
-                # Do not fallback to heuristics 	6 keep altitude None if calculation fails
+                # Do not fallback to heuristics; keep altitude None if calculation fails
+                _LOGGER.debug("Skyfield moon altitude calculation failed", exc_info=True)
                 altitude = None
 
             return {"phase": phase_val, "altitude": altitude}
@@ -214,47 +201,35 @@ class TideProxy:
         If Skyfield or the ephemeris is unavailable, return {"elevation": None}.
         """
         try:
-            # Local import to avoid hard dependency at module import time
-            from skyfield.api import load, wgs84  # type: ignore
-            import os
-
-            # Reuse same ephemeris path as used elsewhere (data/de421.bsp)
-            data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
-            eph_path = os.path.join(data_dir, "de421.bsp")
-
-            def _load_eph():
-                return load(eph_path)
-
-            # Load ephemeris in executor to avoid blocking the event loop
-            eph = await self.hass.async_add_executor_job(_load_eph)
-            ts = load.timescale()
-
-            now = dt_util.now()
-            # Build skyfield Time from current UTC components
-            t = ts.utc(now.year, now.month, now.day, now.hour, now.minute, now.second)
-
-            earth = eph["earth"]
-            sun_obj = eph["sun"]
-            location = wgs84.latlon(self.latitude, self.longitude)
-
-            # Compute apparent position of the sun from the location (altitude)
-            astrom = earth.at(t).observe(sun_obj).apparent()
-            alt, az, distance = astrom.altaz()
-            try:
-                elevation = float(getattr(alt, "degrees", None))
-            except Exception:
-                # alt may be Angle-like; attempt to access .degrees
-                try:
-                    elevation = float(alt.degrees)
-                except Exception:
-                    elevation = None
-
+            elevation = await self._async_altitude_now("sun")
             return {"elevation": elevation}
         except Exception:
             # Do not fallback to reading HA entity; if Skyfield fails, return None
             _LOGGER.debug("Skyfield sun elevation calculation failed; returning None", exc_info=True)
             return {"elevation": None}
 
+    async def _async_altitude_now(self, body: str) -> float:
+        """Return the current apparent altitude (degrees) of "sun" or "moon" seen from this location.
+
+        Read from the sampled astro state (helpers.astro) when today's samples exist;
+        otherwise observed from the shared ephemeris in the executor.
+        """
+        from .helpers.astro import astro_state_at
+
+        now = dt_util.utcnow()
+        state = astro_state_at(self.latitude, self.longitude, now)
+        if state and state.get(f"{body}_altitude") is not None:
+            return float(state[f"{body}_altitude"])
+        eph = await EPHEMERIS.async_get(self.hass)
+        return await self.hass.async_add_executor_job(self._observe_altitude, eph, body, now)
+
+    def _observe_altitude(self, eph: Any, body: str, when: datetime) -> float:
+        """Observe the topocentric altitude of `body` at `when` (executor only)."""
+        t = EPHEMERIS.timescale().utc(when.year, when.month, when.day, when.hour, when.minute, when.second)
+        astrom = EPHEMERIS.observer(self.latitude, self.longitude).at(t).observe(eph[body]).apparent()
+        alt, _az, _distance = astrom.altaz()
+        return float(alt.degrees)
+
     def _calculate_tide_state(self, moon_data: Dict[str, Optional[float]], sun_data: Dict[str, Optional[float]], now: datetime) -> str:
         """Determine tide state (rising/falling/slack_high/slack_low) using a simple heuristic."""
         try:
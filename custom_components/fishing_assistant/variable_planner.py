@@ -0,0 +1,60 @@
+"""Planning of the Open-Meteo variables each grid cell requests.
+
+Scorers and other series consumers declare their inputs (required_inputs);
+plan_variables() returns the union for the entries of one cell.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import FrozenSet, Iterable, Optional, Sequence, Tuple
+
+from .api import DEFAULT_HOURLY_VARIABLES, MARINE_HOURLY_VARIABLES
+
+
+@dataclass(frozen=True)
+class RequestInputs:
+    """Canonical weather and marine hourly variables one consumer needs."""
+
+    weather: FrozenSet[str] = frozenset()
+    marine: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def of(cls, weather: Iterable[str] = (), marine: Iterable[str] = ()) -> "RequestInputs":
+        return cls(frozenset(weather), frozenset(marine))
+
+    def union(self, other: Optional["RequestInputs"]) -> "RequestInputs":
+        if other is None:
+            return self
+        return RequestInputs(self.weather | other.weather, self.marine | other.marine)
+
+    def without_marine(self) -> "RequestInputs":
+        return RequestInputs(self.weather, frozenset())
+
+    @property
+    def names(self) -> FrozenSet[str]:
+        return self.weather | self.marine
+
+
+def _ordered(names: Iterable[str], catalogue: Sequence[str]) -> Tuple[str, ...]:
+    """Sort `names` in catalogue order (unknown names last, alphabetically).
+
+    A stable order keeps equal plans equal, so cells requesting the same variables
+    still share a batched request.
+    """
+    wanted = set(names)
+    known = [name for name in catalogue if name in wanted]
+    return tuple(known + sorted(wanted.difference(catalogue)))
+
+
+def plan_variables(all_inputs: Iterable[Optional[RequestInputs]]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Return the (weather, marine) variables covering every input set.
+
+    Weather is always requested (it carries the time axis), so an empty plan
+    falls back to DEFAULT_HOURLY_VARIABLES.
+    """
+    combined = RequestInputs()
+    for inputs in all_inputs:
+        combined = combined.union(inputs)
+    weather = _ordered(combined.weather, DEFAULT_HOURLY_VARIABLES) or tuple(DEFAULT_HOURLY_VARIABLES)
+    return weather, _ordered(combined.marine, MARINE_HOURLY_VARIABLES)
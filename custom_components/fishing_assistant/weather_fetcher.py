@@ -4,19 +4,25 @@ This version:
 - Uses the injected Open-Meteo client when use_open_meteo is True.
 - Does not attempt to read Home Assistant weather entities for current or forecast.
 - Normalizes client returns (dicts, lists, objects) and converts units where explicit.
-- Caches results and treats missing/incomplete data as errors (fail loudly).
+- Caches results in the shared cache manager (helpers.cache) and treats missing/incomplete data as errors (fail loudly).
 """
 
 from __future__ import annotations
 
 import inspect
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 import asyncio
 from homeassistant.util import dt as dt_util
 
+from .const import DEFAULT_GRID_TOLERANCE
+from .helpers.cache import CACHE, NS_FORECAST, NS_WEATHER
+from .helpers.grid import GRID_CELLS
+from .helpers.singleflight import SingleFlight
+from .hourly_series import HourlySeries, current_weather_from_series, daily_weather_from_series
+
 _LOGGER = logging.getLogger(__name__)
 
 # Default weather values are retained only for reference/logging; we no longer use them as silent fallbacks.
@@ -29,8 +35,8 @@ DEFAULT_WEATHER_VALUES = {
     "pressure": 1013.0,  # hPa
 }
 
-# Global cache to share weather/forecast data across sensors
-_GLOBAL_CACHE: Dict[str, Dict[str, Any]] = {}
+# In-flight fetches keyed like the weather/forecast cache entries, so simultaneous misses coalesce
+_INFLIGHT = SingleFlight()
 
 
 def _safe_float(v: Any, default: float) -> float:
@@ -59,9 +65,10 @@ class WeatherFetcher:
 
     Parameters:
     - hass: Home Assistant core instance (kept for compatibility, not used for weather lookups).
-    - latitude/longitude: location (rounded to 4 decimals used in cache keys).
+    - latitude/longitude: location; cache keys use the grid cell it snaps to (see helpers.grid).
     - use_open_meteo: if True and an open_meteo_client is provided, the fetcher will use it.
     - open_meteo_client: optional client object. The fetcher will attempt several common method names.
+    - member: config entry id owning the cache entries (released when the entry unloads).
     """
 
     def __init__(
@@ -71,6 +78,8 @@ class WeatherFetcher:
         longitude: float,
         use_open_meteo: bool = True,
         open_meteo_client: Optional[Any] = None,
+        grid_tolerance: float = DEFAULT_GRID_TOLERANCE,
+        member: Optional[str] = None,
     ) -> None:
         self.hass = hass
         self.latitude = round(latitude, 4)
@@ -78,24 +87,47 @@ class WeatherFetcher:
         # weather_entity removed intentionally
         self.use_open_meteo = use_open_meteo
         self.open_meteo_client = open_meteo_client
-        self._cache_key = f"{self.latitude}_{self.longitude}_{'om' if use_open_meteo else 'none'}"
-        self._cache_duration = timedelta(minutes=30)
+        # Entries in the same grid cell share one cache entry (and one upstream request)
+        self._cell = GRID_CELLS.cell_for(self.latitude, self.longitude, grid_tolerance)
+        self._cell_key = f"{self._cell.key}_{'om' if use_open_meteo else 'none'}"
+        self._member = member
+
+    @property
+    def _cache_key(self) -> str:
+        """Cache key of the cell; sources serving several series per cell add their slot."""
+        slot = getattr(self.open_meteo_client, "series_slot", None)
+        return f"{self._cell_key}_{slot}" if isinstance(slot, str) else self._cell_key
+
+    def _cached(self, namespace: str, key: str) -> Optional[Any]:
+        """Return a fresh cached value unless the client has since fetched a newer series."""
+        entry = CACHE.get_entry(namespace, key)
+        if entry is None:
+            return None
+        source_fetched = getattr(self.open_meteo_client, "series_fetched_at", None)
+        if isinstance(source_fetched, datetime) and entry.stored_at < source_fetched:
+            # Derived from a series that a newer model run has replaced
+            return None
+        return entry.value
 
     # -----------------------
     # Public: current weather
     # -----------------------
     async def get_weather_data(self) -> Dict[str, Any]:
         """Get current weather data (normalized). Uses cache -> Open-Meteo -> raise on failure."""
-        now = dt_util.now()
-
         # Use cached if present and fresh
-        cache_entry = _GLOBAL_CACHE.get(self._cache_key)
-        if cache_entry:
-            cached_time = cache_entry.get("time")
-            if isinstance(cached_time, datetime) and (now - cached_time) < self._cache_duration:
-                _LOGGER.debug("Using cached weather data for %s", self._cache_key)
-                return cache_entry["data"]
-
+        cache_key = self._cache_key
+        cached = self._cached(NS_WEATHER, cache_key)
+        if cached is not None:
+            _LOGGER.debug("Using cached weather data for %s", cache_key)
+            self._cell.record("weather", hit=True)
+            return cached
+        self._cell.record("weather", hit=False)
+
+        # Concurrent misses for the same key share one upstream request
+        return await _INFLIGHT.do(cache_key, lambda: self._fetch_weather_data(cache_key))
+
+    async def _fetch_weather_data(self, cache_key: str) -> Dict[str, Any]:
+        """Fetch, validate and cache current weather (runs once per in-flight key)."""
         # Only use Open-Meteo client (no HA weather entity fallback)
         if self.use_open_meteo and self.open_meteo_client:
             try:
@@ -106,7 +138,7 @@ class WeatherFetcher:
                         _LOGGER.error("Open-Meteo returned incomplete current-weather data: %s", result)
                         raise RuntimeError("Incomplete weather data from Open-Meteo")
                     _LOGGER.info("Fetched current weather from Open-Meteo client")
-                    _GLOBAL_CACHE[self._cache_key] = {"data": result, "time": now}
+                    CACHE.set(NS_WEATHER, cache_key, result, owner=self._member)
                     return result
                 else:
                     _LOGGER.error("Open-Meteo client returned no usable current-weather data")
@@ -114,7 +146,7 @@ class WeatherFetcher:
                 _LOGGER.exception("Open-Meteo client current fetch failed: %s", exc)
 
         # Fail loudly instead of using defaults
-        _LOGGER.error("Unable to fetch current weather data from Open-Meteo for %s; aborting", self._cache_key)
+        _LOGGER.error("Unable to fetch current weather data from Open-Meteo for %s; aborting", cache_key)
         raise RuntimeError("Unable to fetch current weather data from Open-Meteo")
 
     async def _call_open_meteo_current(self) -> Optional[Dict[str, Any]]:
@@ -164,6 +196,10 @@ class WeatherFetcher:
             if not result:
                 return None
 
+            # Columnar series -> interpolate at now without building rows
+            if isinstance(result, HourlySeries):
+                return current_weather_from_series(result, dt_util.now())
+
             # If result is a list of hourly entries -> pick nearest hour entry
             if isinstance(result, list):
                 now = dt_util.now()
@@ -196,25 +232,15 @@ class WeatherFetcher:
                     hourly = result.get("hourly")
                     times = hourly.get("time") or []
                     if isinstance(times, list) and len(times) > 0:
-                        idx = 0
-                        try:
-                            now = dt_util.now()
-                            for i, t_raw in enumerate(times):
-                                t = dt_util.parse_datetime(str(t_raw)) if t_raw is not None else None
-                                if t and t.tzinfo is None:
-                                    t = t.replace(tzinfo=timezone.utc)
-                                if t and abs((t - now).total_seconds()) < 3600:
-                                    idx = i
-                                    break
-                        except Exception:
+                        # Columnar view: a regular axis gives the current hour arithmetically
+                        series = HourlySeries.from_hourly_arrays(hourly)
+                        if not series:
+                            return None
+                        now = dt_util.now()
+                        idx = series.nearest_index(now)
+                        if abs(series.epoch_at(idx) - now.timestamp()) >= 3600:
                             idx = 0
-                        candidate = {}
-                        for k, arr in hourly.items():
-                            if isinstance(arr, list) and len(arr) > idx:
-                                candidate[k] = arr[idx]
-                            else:
-                                candidate[k] = None
-                        mapped = self._map_to_current_shape(candidate)
+                        mapped = self._map_to_current_shape(series.row(idx))
                         return mapped
                 mapped = self._map_to_current_shape(result)
                 return mapped
@@ -310,23 +336,27 @@ class WeatherFetcher:
         - Open-Meteo client (if enabled)
         - Otherwise raise (no synthesize fallback)
         """
-        now = dt_util.now()
         forecast_cache_key = f"{self._cache_key}_forecast_{days}"
 
-        cache_entry = _GLOBAL_CACHE.get(forecast_cache_key)
-        if cache_entry:
-            cached_time = cache_entry.get("time")
-            if isinstance(cached_time, datetime) and (now - cached_time) < self._cache_duration:
-                _LOGGER.debug("Using cached forecast data for %s", forecast_cache_key)
-                return cache_entry["data"]
+        cached = self._cached(NS_FORECAST, forecast_cache_key)
+        if cached is not None:
+            _LOGGER.debug("Using cached forecast data for %s", forecast_cache_key)
+            self._cell.record("forecast", hit=True)
+            return cached
+        self._cell.record("forecast", hit=False)
+
+        # Concurrent misses for the same key share one upstream request
+        return await _INFLIGHT.do(forecast_cache_key, lambda: self._fetch_forecast(days, forecast_cache_key))
 
+    async def _fetch_forecast(self, days: int, forecast_cache_key: str) -> Dict[str, Dict[str, Any]]:
+        """Fetch and cache the forecast (runs once per in-flight key)."""
         # Only use Open-Meteo client (no HA forecast fallback)
         if self.use_open_meteo and self.open_meteo_client:
             try:
                 result = await self._call_open_meteo_forecast(days)
                 if result:
                     _LOGGER.info("Fetched forecast from Open-Meteo client")
-                    _GLOBAL_CACHE[forecast_cache_key] = {"data": result, "time": now}
+                    CACHE.set(NS_FORECAST, forecast_cache_key, result, owner=self._member)
                     return result
                 else:
                     _LOGGER.error("Open-Meteo client returned no usable forecast data")
@@ -334,7 +364,7 @@ class WeatherFetcher:
                 _LOGGER.exception("Open-Meteo client forecast fetch failed: %s", exc)
 
         # Fail loudly instead of synthesizing from current
-        _LOGGER.error("Unable to fetch forecast from Open-Meteo for %s; aborting", self._cache_key)
+        _LOGGER.error("Unable to fetch forecast from Open-Meteo for %s; aborting", forecast_cache_key)
         raise RuntimeError("Unable to fetch forecast from Open-Meteo")
 
     async def _call_open_meteo_forecast(self, days: int) -> Optional[Dict[str, Dict[str, Any]]]:
@@ -380,6 +410,10 @@ class WeatherFetcher:
             if not result:
                 return None
 
+            # Columnar series -> aggregate per day directly
+            if isinstance(result, HourlySeries):
+                return daily_weather_from_series(result, days) or None
+
             # If dict keyed by dates
             if isinstance(result, dict):
                 # If it's an Open-Meteo full response (contains 'hourly'), handle specially
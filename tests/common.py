@@ -0,0 +1,107 @@
+"""Builders and fakes shared by the tests."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from custom_components.fishing_assistant.hourly_series import HourlySeries
+
+
+class FakeBus:
+    def __init__(self) -> None:
+        self.listeners = []
+
+    def async_listen_once(self, event_type, listener):
+        self.listeners.append((event_type, listener))
+        return lambda: None
+
+
+class FakeHass:
+    """The parts of HomeAssistant the integration touches outside of entities."""
+
+    def __init__(self, time_zone: str = "UTC") -> None:
+        self.data = {}
+        self.bus = FakeBus()
+        self.config = SimpleNamespace(time_zone=time_zone, path=lambda *parts: str(Path("/tmp", *parts)))
+
+    async def async_add_executor_job(self, target, *args):
+        return await asyncio.get_running_loop().run_in_executor(None, target, *args)
+
+
+def hour_floor(when: Optional[datetime] = None) -> datetime:
+    return (when or datetime.now(timezone.utc)).replace(minute=0, second=0, microsecond=0)
+
+
+def hourly_arrays(start: datetime, hours: int, **columns: Any) -> Dict[str, List[Any]]:
+    """Open-Meteo style `hourly` arrays; a scalar column value is repeated for every hour."""
+    out: Dict[str, List[Any]] = {
+        "time": [(start + timedelta(hours=i)).strftime("%Y-%m-%dT%H:%M") for i in range(hours)]
+    }
+    for name, values in columns.items():
+        out[name] = list(values) if isinstance(values, (list, tuple)) else [values] * hours
+    return out
+
+
+def make_series(start: datetime, hours: int, **columns: Any) -> HourlySeries:
+    return HourlySeries.from_hourly_arrays(hourly_arrays(start, hours, **columns))
+
+
+WEATHER = {
+    "temperature_2m": 15.0,
+    "cloudcover": 40.0,
+    "precipitation": 0.0,
+    "wind_speed_10m": 5.0,
+    "pressure_msl": 1013.0,
+}
+
+
+class FakeOpenMeteoClient:
+    """Stands in for OpenMeteoClient: records calls and serves synthetic series."""
+
+    def __init__(self, start: Optional[datetime] = None, meta: Optional[Dict[str, Any]] = None) -> None:
+        self.start = start
+        self.meta = meta
+        self.series_calls: List[Dict[str, Any]] = []
+        self.current_calls: List[Dict[str, Any]] = []
+        self.fail = False
+
+    async def fetch_hourly_series(self, latitude, longitude, include_marine=False, forecast_days=7,
+                                  hourly_vars=None, marine_vars=None, priority=None, forecast_hours=None):
+        self.series_calls.append(
+            {
+                "latitude": latitude,
+                "longitude": longitude,
+                "include_marine": include_marine,
+                "forecast_days": forecast_days,
+                "forecast_hours": forecast_hours,
+                "hourly_vars": tuple(hourly_vars or ()),
+                "marine_vars": tuple(marine_vars or ()),
+            }
+        )
+        if self.fail:
+            raise RuntimeError("upstream down")
+        if forecast_hours:
+            start, hours = hour_floor(), forecast_hours
+        else:
+            start = self.start or hour_floor().replace(hour=0)
+            hours = forecast_days * 24
+        columns = {name: WEATHER.get(name, 1.0) for name in hourly_vars or ()}
+        if include_marine:
+            columns.update({name: 0.5 for name in marine_vars or ()})
+        return make_series(start, hours, **columns)
+
+    async def fetch_current(self, latitude, longitude, variables=None, include_marine=False,
+                            marine_vars=None, priority=None):
+        self.current_calls.append({"variables": tuple(variables or ()), "marine_vars": tuple(marine_vars or ())})
+        values: Dict[str, Any] = {name: WEATHER.get(name, 1.0) for name in variables or ()}
+        values["time"] = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+        return values
+
+    async def fetch_model_meta(self, meta_url):
+        if self.meta is None:
+            raise RuntimeError("no metadata")
+        return self.meta
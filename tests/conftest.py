@@ -0,0 +1,83 @@
+"""Shared fixtures for the Fishing Assistant tests."""
+
+from __future__ import annotations
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from common import FakeHass  # noqa: E402
+from custom_components.fishing_assistant import persistent_cache  # noqa: E402
+from custom_components.fishing_assistant.helpers import astro  # noqa: E402
+from custom_components.fishing_assistant.helpers.cache import CACHE  # noqa: E402
+from custom_components.fishing_assistant.helpers.circuit_breaker import BREAKERS  # noqa: E402
+from custom_components.fishing_assistant.helpers.ephemeris import EPHEMERIS  # noqa: E402
+from custom_components.fishing_assistant.helpers.grid import GRID_CELLS  # noqa: E402
+from custom_components.fishing_assistant.helpers.request_budget import REQUEST_BUDGET  # noqa: E402
+
+
+class FakeStore:
+    """In-memory stand-in for homeassistant.helpers.storage.Store."""
+
+    saved = None
+    stored = None
+
+    def __init__(self, hass, version, key) -> None:
+        self.key = key
+
+    async def async_load(self):
+        return FakeStore.stored
+
+    def async_delay_save(self, data_func, delay) -> None:
+        FakeStore.saved = data_func()
+
+
+@pytest.fixture
+def fake_store(monkeypatch):
+    """Back PersistentCache with FakeStore (`stored` is what the next load reads)."""
+    monkeypatch.setattr(persistent_cache, "Store", FakeStore)
+    FakeStore.saved = FakeStore.stored = None
+    return FakeStore
+
+
+@pytest.fixture
+def hass() -> FakeHass:
+    return FakeHass()
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_state():
+    """Start every test with empty process-wide caches, registries and counters."""
+    for registry in (CACHE, GRID_CELLS, BREAKERS, REQUEST_BUDGET, EPHEMERIS, astro.ASTRO_JOBS):
+        registry.__init__()
+    yield
+
+
+# skyfield's bundled test kernel covers 2015-02-26 .. 2015-03-06
+ASTRO_NOW = datetime(2015, 2, 28, 10, 0, tzinfo=timezone.utc)
+
+
+class _AnyDatetime(type):
+    # isinstance(x, astro.datetime) must still hold for the datetimes skyfield returns
+    def __instancecheck__(cls, obj) -> bool:
+        return isinstance(obj, datetime)
+
+
+class _AstroClock(datetime, metaclass=_AnyDatetime):
+    @classmethod
+    def now(cls, tz=None):
+        return ASTRO_NOW.astimezone(tz) if tz is not None else ASTRO_NOW.replace(tzinfo=None)
+
+
+@pytest.fixture
+def test_kernel(monkeypatch):
+    """Load skyfield's test kernel instead of de421 and freeze helpers.astro's clock inside its range."""
+    skyfield = pytest.importorskip("skyfield")
+    kernel = Path(skyfield.__file__).parent / "tests" / "data" / "de430-2015-03-02.bsp"
+    monkeypatch.setattr(EPHEMERIS, "path", str(kernel))
+    monkeypatch.setattr(astro, "datetime", _AstroClock)
+    return ASTRO_NOW
@@ -0,0 +1,109 @@
+"""Tests for the Open-Meteo client."""
+
+import asyncio
+from datetime import datetime, timezone
+
+from custom_components.fishing_assistant.api import (
+    OPEN_METEO_MARINE_URL,
+    OPEN_METEO_URL,
+    OpenMeteoClient,
+    normalize_current_response,
+)
+
+from common import hourly_arrays
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class _Server:
+    """Replaces OpenMeteoClient._get_json, answering every location of a request."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_json(self, base_url, params, timeout):
+        self.requests.append((base_url, dict(params)))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        hours = int(params.get("forecast_days", 1)) * 24
+        names = params["hourly"].split(",")
+        lats = str(params["latitude"]).split(",")
+        bodies = [
+            {"latitude": float(lat), "hourly": hourly_arrays(START, hours, **{n: float(lat) for n in names})}
+            for lat in lats
+        ]
+        return bodies if len(bodies) > 1 else bodies[0]
+
+
+def _client(server, **kwargs):
+    client = OpenMeteoClient(session=object(), **kwargs)
+    client._get_json = server.get_json
+    return client
+
+
+def test_weather_and_marine_are_requested_concurrently():
+    server = _Server(delay=0.05)
+
+    async def run():
+        return await _client(server).fetch_hourly_series(
+            52.0, 5.0, include_marine=True, forecast_days=1,
+            hourly_vars=("temperature_2m",), marine_vars=("wave_height",),
+        )
+
+    series = asyncio.run(run())
+
+    assert {url for url, _ in server.requests} == {OPEN_METEO_URL, OPEN_METEO_MARINE_URL}
+    assert server.max_in_flight == 2
+    assert series.has_values("temperature_2m") and series.has_values("wave_height")
+
+
+def test_batched_locations_are_demultiplexed():
+    server = _Server()
+    locations = [(52.0, 5.0), (53.0, 6.0), (52.0, 5.0), (54.0, 7.0)]
+
+    async def run():
+        client = _client(server, batch_window=0.01)
+        return await asyncio.gather(
+            *(
+                client.fetch_hourly_series(lat, lon, forecast_days=1, hourly_vars=("temperature_2m",))
+                for lat, lon in locations
+            )
+        )
+
+    results = asyncio.run(run())
+
+    # One request; duplicate coordinates share a slot in it
+    assert len(server.requests) == 1
+    assert server.requests[0][1]["latitude"] == "52.0,53.0,54.0"
+    assert [series.value("temperature_2m", 0) for series in results] == [lat for lat, _ in locations]
+
+
+def test_current_block_is_normalized_to_canonical_keys():
+    raw = {
+        "current": {
+            "time": "2026-01-01T12:15",
+            "interval": 900,
+            "temperature_2m": 11.5,
+            "windspeed_10m": "4.2",
+            "cloudcover": None,
+            "wave_height": "n/a",
+        }
+    }
+
+    current = normalize_current_response(raw)
+
+    assert current == {
+        "time": datetime(2026, 1, 1, 12, 15, tzinfo=timezone.utc),
+        "temperature_2m": 11.5,
+        "wind_speed_10m": 4.2,
+        "cloudcover": None,
+        "wave_height": None,
+    }
+    assert normalize_current_response({"hourly": {}}) == {}
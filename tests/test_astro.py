@@ -0,0 +1,120 @@
+"""Tests for the astronomy forecast in helpers.astro."""
+
+import asyncio
+import math
+import threading
+from datetime import timezone
+
+import pytest
+
+from custom_components.fishing_assistant.const import ASTRO_LOCATION_TOLERANCE
+from custom_components.fishing_assistant.helpers import astro
+from custom_components.fishing_assistant.helpers.cache import CACHE
+from custom_components.fishing_assistant.helpers.ephemeris import EPHEMERIS
+from custom_components.fishing_assistant.persistent_cache import async_get_persistent_cache
+
+from common import FakeHass
+
+almanac = pytest.importorskip("skyfield.almanac")
+
+LAT, LON = 52.0, 5.0
+
+
+def test_computed_days_are_read_back_after_a_restart(hass, fake_store, test_kernel):
+    async def run(instance):
+        await async_get_persistent_cache(instance)
+        return await astro.calculate_astronomy_forecast(instance, LAT, LON, days=2)
+
+    first = asyncio.run(run(hass))
+    assert astro.ASTRO_JOBS.jobs == 1
+    assert set(first) == {"2015-02-28", "2015-03-01"}
+    assert first["2015-02-28"]["sunrise"] is not None
+
+    # Restart: empty memory, the storage file holds what was saved
+    CACHE.__init__()
+    fake_store.stored = fake_store.saved
+    second = asyncio.run(run(FakeHass()))
+
+    assert astro.ASTRO_JOBS.jobs == 1
+    assert second == first
+    state = astro.astro_state_at(LAT, LON, test_kernel)
+    assert state is not None and -90.0 <= state["sun_altitude"] <= 90.0
+
+
+def test_last_cancelled_waiter_cancels_the_job():
+    async def run():
+        started = asyncio.Event()
+        job_cancelled = []
+
+        async def job():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                job_cancelled.append(True)
+                raise
+
+        key = ("cell", "2015-02-28", 2)
+        waiters = [asyncio.ensure_future(astro._async_join_job(key, job)) for _ in range(2)]
+        await started.wait()
+        waiters[0].cancel()
+        await asyncio.sleep(0)
+        running_after_first = key in astro._RUNNING and not job_cancelled
+        waiters[1].cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0)
+        return running_after_first, job_cancelled, key in astro._RUNNING
+
+    running_after_first, job_cancelled, still_registered = asyncio.run(run())
+
+    assert running_after_first
+    assert job_cancelled == [True]
+    assert not still_registered
+
+
+def test_cancelled_job_stops_before_the_almanac_searches(hass, test_kernel):
+    eph = asyncio.run(EPHEMERIS.async_get(hass))
+    cancel = threading.Event()
+    cancel.set()
+
+    with pytest.raises(astro.AstroJobCancelled):
+        astro._timed_compute(eph, LAT, LON, test_kernel.date(), 2, timezone.utc, cancel)
+
+
+def test_days_already_computed_are_reused(hass, test_kernel):
+    async def run():
+        await astro.calculate_astronomy_forecast(hass, LAT, LON, days=2)
+        longer = await astro.calculate_astronomy_forecast(hass, LAT, LON, days=3)
+        shorter = await astro.calculate_astronomy_forecast(hass, LAT, LON, days=1)
+        return longer, shorter
+
+    longer, shorter = asyncio.run(run())
+
+    assert astro.ASTRO_JOBS.jobs == 2
+    assert astro.ASTRO_JOBS.days_computed == 3
+    assert astro.ASTRO_JOBS.days_reused == 3
+    assert shorter["2015-02-28"] == longer["2015-02-28"]
+
+
+def test_vectorized_moon_phase_matches_the_per_day_evaluation(hass, test_kernel):
+    forecast = asyncio.run(astro.calculate_astronomy_forecast(hass, LAT, LON, days=3))
+    eph = EPHEMERIS._eph
+    ts = EPHEMERIS.timescale()
+    start = test_kernel.date()
+    # The memo computes for the centre of the location's cell
+    lat, lon = astro._location_key(LAT, LON, ASTRO_LOCATION_TOLERANCE)[:2]
+    times, kinds = almanac.find_discrete(
+        ts.utc(start.year, start.month, start.day),
+        ts.utc(start.year, start.month, start.day + 3),
+        almanac.meridian_transits(eph, eph["Sun"], EPHEMERIS.topos(lat, lon)),
+    )
+
+    noons = [t for t, kind in zip(times, kinds) if kind == 1]
+    assert len(noons) == 3
+    for noon in noons:
+        # One scalar evaluation per day at solar noon, as before vectorizing
+        observer = eph["earth"].at(noon)
+        sep = observer.observe(eph["sun"]).apparent().separation_from(observer.observe(eph["moon"]).apparent())
+        expected = (1.0 + math.cos(sep.radians)) / 2.0
+        day = forecast[noon.utc_datetime().date().isoformat()]
+        assert day["moon_phase"] == pytest.approx(expected, abs=1e-5)
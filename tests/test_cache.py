@@ -0,0 +1,41 @@
+"""Tests for the namespaced CacheManager."""
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.fishing_assistant.helpers.cache import NS_FORECAST, NS_WEATHER, CacheManager
+
+
+def test_expired_entries_miss_but_can_still_be_peeked():
+    cache = CacheManager(ttls={NS_WEATHER: timedelta(minutes=30)})
+    past = datetime.now(timezone.utc) - timedelta(hours=1)
+    cache.set(NS_WEATHER, "cell", {"temperature": 1.0}, stored_at=past)
+
+    assert cache.get(NS_WEATHER, "cell") is None
+    assert cache.peek(NS_WEATHER, "cell", allow_expired=True).value == {"temperature": 1.0}
+    assert cache.stats()["namespaces"][NS_WEATHER]["expired"] == 1
+
+
+def test_least_recently_used_entries_are_evicted_over_budget():
+    cache = CacheManager(budget_bytes=300, ttls={})
+    cache.set(NS_FORECAST, "a", 1, size=100)
+    cache.set(NS_FORECAST, "b", 2, size=100)
+    cache.set(NS_FORECAST, "c", 3, size=100)
+    assert cache.get(NS_FORECAST, "a") == 1
+
+    cache.set(NS_FORECAST, "d", 4, size=100)
+
+    assert cache.peek(NS_FORECAST, "b") is None
+    assert [cache.get(NS_FORECAST, k) for k in ("a", "c", "d")] == [1, 3, 4]
+    assert cache.stats()["namespaces"][NS_FORECAST]["evictions"] == 1
+
+
+def test_entries_are_dropped_with_their_last_owner():
+    cache = CacheManager()
+    cache.set(NS_WEATHER, "shared", 1, owner="a")
+    cache.set(NS_WEATHER, "shared", 2, owner="b")
+    cache.set(NS_WEATHER, "own", 3, owner="a")
+
+    assert cache.release("a") == 1
+    assert cache.get(NS_WEATHER, "shared") == 2
+    assert cache.release("b") == 1
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,116 @@
+"""Tests for the endpoint circuit breaker."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.fishing_assistant.helpers.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+async def _fail() -> None:
+    raise OSError("down")
+
+
+async def _ok() -> str:
+    return "ok"
+
+
+def _breaker(clock: _Clock) -> CircuitBreaker:
+    breaker = CircuitBreaker("https://api.example", failure_threshold=2, base_backoff=60, max_backoff=600, jitter=0)
+    breaker._now = clock
+    return breaker
+
+
+def test_circuit_opens_probes_and_closes():
+    async def run() -> None:
+        clock = _Clock()
+        breaker = _breaker(clock)
+        for _ in range(2):
+            with pytest.raises(OSError):
+                await breaker.call(_fail)
+        assert breaker.state == STATE_OPEN
+        assert breaker.retry_at == clock.now + timedelta(seconds=60)
+
+        calls = []
+
+        async def counted() -> str:
+            calls.append(1)
+            return "ok"
+
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(counted)
+        assert not calls and breaker.rejected == 1
+
+        clock.now += timedelta(seconds=61)
+        breaker.before_call()
+        assert breaker.state == STATE_HALF_OPEN
+        # Only the probe goes through
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_success()
+        assert breaker.state == STATE_CLOSED
+        assert await breaker.call(_ok) == "ok"
+
+    asyncio.run(run())
+
+
+def test_failed_probe_reopens_with_doubled_backoff():
+    async def run() -> None:
+        clock = _Clock()
+        breaker = _breaker(clock)
+        for _ in range(2):
+            with pytest.raises(OSError):
+                await breaker.call(_fail)
+
+        clock.now += timedelta(seconds=61)
+        with pytest.raises(OSError):
+            await breaker.call(_fail)
+        assert breaker.state == STATE_OPEN
+        assert breaker.retry_at == clock.now + timedelta(seconds=120)
+
+    asyncio.run(run())
+
+
+def test_non_failures_and_cancelled_probes_do_not_hold_the_circuit_open():
+    async def run() -> None:
+        clock = _Clock()
+        breaker = _breaker(clock)
+
+        async def bad_request() -> None:
+            raise ValueError("400")
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                await breaker.call(bad_request, is_failure=lambda exc: not isinstance(exc, ValueError))
+        assert breaker.state == STATE_CLOSED
+
+        for _ in range(2):
+            with pytest.raises(OSError):
+                await breaker.call(_fail)
+        clock.now += timedelta(seconds=61)
+
+        async def cancelled() -> None:
+            raise asyncio.CancelledError
+
+        with pytest.raises(asyncio.CancelledError):
+            await breaker.call(cancelled)
+        # The next caller may probe at once
+        assert await breaker.call(_ok) == "ok"
+        assert breaker.state == STATE_CLOSED
+
+    asyncio.run(run())
@@ -0,0 +1,90 @@
+"""Tests for the per-entry FishingDataCoordinator."""
+
+import asyncio
+from datetime import datetime, timezone
+
+from custom_components.fishing_assistant.coordinator import FishingDataCoordinator
+from custom_components.fishing_assistant.helpers import astro
+
+
+class _WeatherFetcher:
+    def __init__(self):
+        self.weather_calls = 0
+        self.forecast_calls = 0
+
+    async def get_weather_data(self):
+        self.weather_calls += 1
+        await asyncio.sleep(0)
+        return {"temperature": 12.0}
+
+    async def get_forecast(self, days=7):
+        self.forecast_calls += 1
+        return {"2026-01-01": {"temperature": 10.0}}
+
+
+class _MarineFetcher:
+    async def get_marine_data(self):
+        return {"current": {"wave_height": 0.5, "wave_period": 6.0}, "forecast": {}}
+
+
+def test_one_fetch_per_cycle_for_all_sensors(hass, monkeypatch):
+    astro_calls = []
+
+    async def fake_astro(hass, lat, lon, days=2):
+        astro_calls.append((lat, lon, days))
+        return {}
+
+    monkeypatch.setattr(astro, "calculate_astronomy_forecast", fake_astro)
+    fetcher = _WeatherFetcher()
+
+    async def run():
+        coordinator = FishingDataCoordinator(hass, "entry", 52.0, 5.0, weather_fetcher=fetcher)
+        # Three species sensors asking at once share one refresh
+        return await asyncio.gather(*(coordinator.async_get_snapshot() for _ in range(3)))
+
+    snapshots = asyncio.run(run())
+
+    assert snapshots[0] is snapshots[1] is snapshots[2]
+    assert snapshots[0].weather == {"temperature": 12.0}
+    assert fetcher.weather_calls == 1
+    assert fetcher.forecast_calls == 1
+    assert len(astro_calls) == 1
+
+
+class _LiveSource:
+    def __init__(self, values):
+        self.values = values
+
+    async def async_get_live_current(self):
+        return self.values
+
+
+def test_live_conditions_overlay_current_values_only(hass, monkeypatch):
+    async def fake_astro(hass, lat, lon, days=2):
+        return {}
+
+    monkeypatch.setattr(astro, "calculate_astronomy_forecast", fake_astro)
+    fetcher = _WeatherFetcher()
+    live_at = datetime(2026, 1, 1, 12, 15, tzinfo=timezone.utc)
+    fetcher.open_meteo_client = _LiveSource({"temperature_2m": 14.0, "wind_speed_10m": None, "time": live_at})
+    marine_fetcher = _MarineFetcher()
+
+    async def run():
+        coordinator = FishingDataCoordinator(
+            hass, "entry", 52.0, 5.0, weather_fetcher=fetcher, marine_fetcher=marine_fetcher
+        )
+        base = await coordinator.async_get_snapshot()
+        fetcher.open_meteo_client.values = {**fetcher.open_meteo_client.values, "wave_height": 1.5}
+        live = await coordinator.async_refresh_current()
+        return base, live, coordinator.data
+
+    base, live, data = asyncio.run(run())
+
+    assert live is data
+    assert live.live_at == live_at
+    assert live.weather["temperature"] == 14.0
+    # Missing live values are not overlaid
+    assert "wind_speed" not in live.weather
+    assert live.marine["current"] == {"wave_height": 1.5, "wave_period": 6.0, "timestamp": "2026-01-01T12:15:00Z"}
+    assert live.forecast is base.forecast
+    assert base.weather == {"temperature": 12.0}
@@ -0,0 +1,55 @@
+"""Tests for the shared skyfield ephemeris service and its tide proxy consumer."""
+
+import asyncio
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.fishing_assistant.helpers import astro
+from custom_components.fishing_assistant.helpers.cache import CACHE
+from custom_components.fishing_assistant.helpers.ephemeris import EPHEMERIS
+from custom_components.fishing_assistant.tide_proxy import TideProxy
+
+LAT, LON = 52.0, 5.0
+
+
+def test_kernel_loads_once_and_locations_are_built_once(hass, test_kernel):
+    async def run():
+        return await asyncio.gather(*(EPHEMERIS.async_get(hass) for _ in range(3)))
+
+    kernels = asyncio.run(run())
+
+    assert kernels[0] is kernels[1] is kernels[2]
+    assert EPHEMERIS.loads == 1
+    assert EPHEMERIS.observer(LAT, LON) is EPHEMERIS.observer(LAT + 1e-7, LON)
+    assert EPHEMERIS.topos(LAT, LON) is EPHEMERIS.topos(LAT, LON)
+    assert EPHEMERIS.stats()["locations"] == 1
+
+
+def test_tide_altitudes_come_from_the_samples_or_the_executor(hass, test_kernel, monkeypatch):
+    monkeypatch.setattr(dt_util, "utcnow", lambda: test_kernel)
+    jobs = []
+    run_in_executor = hass.async_add_executor_job
+
+    async def add_executor_job(target, *args):
+        jobs.append(getattr(target, "__name__", target))
+        return await run_in_executor(target, *args)
+
+    hass.async_add_executor_job = add_executor_job
+    proxy = TideProxy(hass, LAT, LON)
+
+    async def run():
+        await astro.calculate_astronomy_forecast(hass, LAT, LON, days=1)
+        jobs.clear()
+        sampled = await proxy._async_altitude_now("sun")
+        from_samples = list(jobs)
+        CACHE.__init__()
+        observed = await proxy._async_altitude_now("sun")
+        return sampled, from_samples, observed
+
+    sampled, from_samples, observed = asyncio.run(run())
+
+    assert from_samples == []
+    assert jobs == ["_observe_altitude"]
+    # Topocentric altitude of the sun late on a February morning at 52N
+    assert 15.0 < observed < 35.0
+    assert abs(sampled - observed) < 0.5
@@ -0,0 +1,34 @@
+"""Tests for grid-cell snapping and sharing."""
+
+import asyncio
+
+from custom_components.fishing_assistant.helpers.grid import GRID_CELLS, grid_cell_key, snap_location
+from custom_components.fishing_assistant.open_meteo_adapter import OpenMeteoAdapter
+
+from common import FakeOpenMeteoClient
+
+
+def test_nearby_locations_snap_to_one_cell():
+    assert snap_location(52.0012, 4.9987, 0.01) == (52.0, 5.0)
+    assert grid_cell_key(52.0012, 4.9987, 0.01) == grid_cell_key(51.9991, 5.0031, 0.01)
+    assert grid_cell_key(52.0012, 4.9987, 0.01) != grid_cell_key(52.02, 5.0, 0.01)
+
+
+def test_entries_in_one_cell_share_the_upstream_fetch():
+    client = FakeOpenMeteoClient()
+
+    async def run():
+        a = OpenMeteoAdapter(client, 52.0012, 4.9987, grid_tolerance=0.01, member="a")
+        b = OpenMeteoAdapter(client, 51.9991, 5.0031, grid_tolerance=0.01, member="b")
+        await a.get_forecast()
+        await b.get_forecast()
+
+    asyncio.run(run())
+
+    assert len(client.series_calls) == 1
+    # The cell centre is requested upstream
+    assert (client.series_calls[0]["latitude"], client.series_calls[0]["longitude"]) == (52.0, 5.0)
+    GRID_CELLS.release("a")
+    assert GRID_CELLS.get("52.0_5.0") is not None
+    GRID_CELLS.release("b")
+    assert GRID_CELLS.get("52.0_5.0") is None
@@ -0,0 +1,79 @@
+"""Tests for the columnar HourlySeries."""
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.fishing_assistant.hourly_series import HourlySeries
+
+from common import hourly_arrays
+
+START = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def test_merged_columns_and_storage_round_trip():
+    weather = hourly_arrays(START, 3, temperature_2m=[1.0, 2.0, None], wave_height=[9.0, None, None])
+    marine = hourly_arrays(START, 3, wave_height=[0.5, 0.6, 0.7])
+
+    series = HourlySeries.from_hourly_arrays(weather, marine)
+
+    assert len(series) == 3
+    assert series.value("temperature_2m", 2) is None
+    # Weather wins; marine only fills what is missing
+    assert [series.value("wave_height", i) for i in range(3)] == [9.0, 0.6, 0.7]
+    restored = HourlySeries.from_storage(series.to_storage())
+    assert restored.rows() == series.rows()
+
+
+def test_interpolation_takes_the_short_way_round_for_directions():
+    series = HourlySeries.from_hourly_arrays(
+        hourly_arrays(START, 2, temperature_2m=[10.0, 20.0], wave_direction=[350.0, 10.0])
+    )
+
+    row = series.interpolate(START + timedelta(minutes=30))
+
+    assert row["temperature_2m"] == 15.0
+    assert row["wave_direction"] == 0.0
+
+
+def test_regular_axis_is_indexed_arithmetically():
+    series = HourlySeries.from_hourly_arrays(hourly_arrays(START, 48, temperature_2m=1.0))
+
+    assert series.is_regular
+    assert series.axis_step == 3600
+    assert series.index_at_or_before(START + timedelta(hours=5, minutes=59)) == 5
+    assert series.index_at_or_before(START - timedelta(seconds=1)) == -1
+    assert series.index_of(START + timedelta(hours=47)) == 47
+    assert series.index_of(START + timedelta(minutes=30)) is None
+    assert [(day, lo, hi) for day, lo, hi in series.day_slices()] == [
+        ("2026-03-01", 0, 24),
+        ("2026-03-02", 24, 48),
+    ]
+
+
+def test_irregular_axis_falls_back_to_searching():
+    arrays = hourly_arrays(START, 4, temperature_2m=[1.0, 2.0, 3.0, 4.0])
+    arrays["time"][3] = (START + timedelta(hours=5)).strftime("%Y-%m-%dT%H:%M")
+
+    series = HourlySeries.from_hourly_arrays(arrays)
+
+    assert not series.is_regular
+    assert series.index_at_or_before(START + timedelta(hours=4)) == 2
+    assert series.index_of(START + timedelta(hours=5)) == 3
+
+
+def test_splice_replaces_covered_rows_and_keeps_the_axis():
+    series = HourlySeries.from_hourly_arrays(hourly_arrays(START, 4, temperature_2m=[1.0, 2.0, 3.0, 4.0]))
+    update = HourlySeries.from_hourly_arrays(
+        hourly_arrays(START + timedelta(hours=2), 4, temperature_2m=[3.0, None, 7.0, 8.0])
+    )
+
+    spliced, changed = series.splice(update)
+
+    assert [spliced.value("temperature_2m", i) for i in range(len(spliced))] == [1.0, 2.0, 3.0, 4.0]
+    assert changed == 0
+    assert spliced.start == START and len(spliced) == 4
+
+    spliced, changed = series.splice(
+        HourlySeries.from_hourly_arrays(hourly_arrays(START + timedelta(hours=1), 2, temperature_2m=[5.0, 3.0]))
+    )
+    assert [spliced.value("temperature_2m", i) for i in range(4)] == [1.0, 5.0, 3.0, 4.0]
+    assert changed == 1
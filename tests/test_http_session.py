@@ -0,0 +1,29 @@
+"""Tests for the pooled HTTP session."""
+
+import asyncio
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+
+from custom_components.fishing_assistant.http_session import (
+    LIMIT_PER_HOST,
+    async_get_session,
+    async_get_session_stats,
+)
+
+
+def test_one_session_per_instance_closed_on_shutdown(hass):
+    async def run():
+        first = async_get_session(hass)
+        second = async_get_session(hass)
+        assert first is second
+        assert first.connector.limit_per_host == LIMIT_PER_HOST
+        event_type, close = hass.bus.listeners[0]
+        assert event_type == EVENT_HOMEASSISTANT_CLOSE
+        await close(None)
+        return first
+
+    session = asyncio.run(run())
+
+    assert session.closed
+    assert len(hass.bus.listeners) == 1
+    assert async_get_session_stats(hass)["requests"] == 0
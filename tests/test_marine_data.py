@@ -0,0 +1,56 @@
+"""Tests for MarineDataFetcher."""
+
+import asyncio
+from datetime import timedelta
+
+from custom_components.fishing_assistant.marine_data import MarineDataFetcher
+
+from common import hour_floor, make_series
+
+
+class _Source:
+    """An hourly source like OpenMeteoAdapter with marine enabled."""
+
+    def __init__(self, series):
+        self.series = series
+        self.series_fetched_at = hour_floor()
+        self.reads = 0
+
+    async def async_get_hourly_series(self, days=7):
+        self.reads += 1
+        return self.series
+
+
+def test_marine_data_is_derived_from_the_hourly_series(hass):
+    start = hour_floor() - timedelta(hours=2)
+    heights = [0.5 + 0.1 * i for i in range(48)]
+    source = _Source(make_series(start, 48, wave_height=heights, wave_period=6.0, swell_wave_height=0.4))
+    fetcher = MarineDataFetcher(hass, 52.0, 5.0, hourly_source=source)
+
+    async def run():
+        first = await fetcher.get_marine_data()
+        second = await fetcher.get_marine_data()
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    # The row at "now" is the third hour of the series
+    assert round(first["current"]["wave_height"], 2) == 0.7
+    assert first["current"]["wave_period"] == 6.0
+    assert first["source"] == "open-meteo"
+    day = start.date().isoformat()
+    assert first["forecast"][day]["wave_height_min"] == 0.5
+    # Unchanged series: the parsed snapshot is reused
+    assert second is first
+    assert source.reads == 2
+
+
+def test_required_inputs_are_exactly_the_columns_read(hass):
+    inputs = MarineDataFetcher.required_inputs()
+    fetcher = MarineDataFetcher(hass, 52.0, 5.0)
+
+    parsed = fetcher._parse_marine_series(make_series(hour_floor(), 24, **{name: 1.0 for name in inputs.marine}))
+
+    assert not inputs.weather
+    assert set(parsed["current"]) - {"timestamp"} == inputs.marine
+    assert all(value == 1.0 for day in parsed["forecast"].values() for value in day.values())
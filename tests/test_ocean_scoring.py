@@ -0,0 +1,41 @@
+"""Tests for OceanFishingScorer."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from custom_components.fishing_assistant.const import LIGHT_DAWN, LIGHT_DAY, LIGHT_DUSK, LIGHT_NIGHT
+from custom_components.fishing_assistant.helpers import astro
+from custom_components.fishing_assistant.helpers.cache import CACHE
+from custom_components.fishing_assistant.ocean_scoring import OceanFishingScorer
+
+LAT, LON = 52.0, 5.0
+
+
+def test_light_condition_uses_sunrise_and_sunset_found_in_the_samples(hass, test_kernel):
+    forecast = asyncio.run(astro.calculate_astronomy_forecast(hass, LAT, LON, days=1))
+    day = forecast[test_kernel.date().isoformat()]
+    sunrise, sunset = (datetime.fromisoformat(day[key]) for key in ("sunrise", "sunset"))
+
+    sampled = astro.sun_times_at(LAT, LON, test_kernel)
+    assert abs(sampled[0] - sunrise) < timedelta(minutes=1)
+    assert abs(sampled[1] - sunset) < timedelta(minutes=1)
+
+    scorer = OceanFishingScorer(LAT, LON, [], {})
+    checks = {
+        sunrise - timedelta(minutes=40): LIGHT_NIGHT,
+        sunrise - timedelta(minutes=20): LIGHT_DAWN,
+        sunrise + timedelta(minutes=20): LIGHT_DAWN,
+        test_kernel: LIGHT_DAY,
+        sunset - timedelta(minutes=20): LIGHT_DUSK,
+        sunset + timedelta(minutes=20): LIGHT_DUSK,
+        sunset + timedelta(minutes=40): LIGHT_NIGHT,
+    }
+    from_samples = {when: scorer._determine_light_condition({}, when) for when in checks}
+
+    # Without samples the day's sunrise/sunset strings give the same answers
+    CACHE.__init__()
+    assert astro.sun_times_at(LAT, LON, test_kernel) is None
+    from_events = {when: scorer._determine_light_condition(day, when) for when in checks}
+
+    assert from_samples == checks
+    assert from_events == checks
@@ -0,0 +1,106 @@
+"""Tests for OpenMeteoAdapter, the per-grid-cell Open-Meteo source."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from custom_components.fishing_assistant.open_meteo_adapter import OpenMeteoAdapter
+from custom_components.fishing_assistant.persistent_cache import PersistedEntry
+
+from common import WEATHER, FakeOpenMeteoClient, hour_floor, make_series
+
+
+def test_current_and_forecast_come_from_one_series():
+    client = FakeOpenMeteoClient()
+
+    async def run():
+        adapter = OpenMeteoAdapter(client, 52.0, 5.0)
+        current = await adapter.get_current()
+        forecast = await adapter.get_forecast(days=3)
+        return current, forecast
+
+    current, forecast = asyncio.run(run())
+
+    assert len(client.series_calls) == 1
+    assert current["temperature"] == 15.0
+    # m/s -> km/h
+    assert current["wind_speed"] == 18.0
+    assert current["cloud_cover"] == 40
+    assert len(forecast) == 3
+
+
+class _Persistent:
+    """PersistentCache stand-in holding entries in a dict."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def set(self, key, data, fetched_at, generated_at=None):
+        self.entries[key] = PersistedEntry(data=data, fetched_at=fetched_at, generated_at=generated_at)
+
+
+def test_restored_series_is_served_while_refreshing_in_the_background():
+    persistent = _Persistent()
+    fetched = hour_floor() - timedelta(hours=3)
+    restored = make_series(fetched, 7 * 24, **WEATHER)
+    persistent.set(
+        "series:52.0_5.0:hourly",
+        {"days": 7, "series": restored.to_storage(), "variables": sorted(WEATHER)},
+        fetched,
+    )
+    client = FakeOpenMeteoClient()
+
+    async def run():
+        adapter = OpenMeteoAdapter(client, 52.0, 5.0, persistent_cache=persistent)
+        served = await adapter.async_get_hourly_series()
+        calls_when_served = len(client.series_calls)
+        stale_since = adapter.series_stale_since
+        await asyncio.sleep(0.01)
+        return adapter, served, calls_when_served, stale_since
+
+    adapter, served, calls_when_served, stale_since = asyncio.run(run())
+
+    assert served.start == fetched
+    assert calls_when_served == 0
+    assert stale_since is not None
+    # The background refresh swapped in a new series and persisted it
+    assert len(client.series_calls) == 1
+    assert adapter.series_fetched_at > fetched
+    assert adapter.series_stale_since is None
+    assert persistent.get("series:52.0_5.0:hourly").fetched_at == adapter.series_fetched_at
+
+
+def test_near_term_refresh_is_spliced_into_the_series():
+    client = FakeOpenMeteoClient()
+
+    async def run():
+        adapter = OpenMeteoAdapter(client, 52.0, 5.0)
+        first = await adapter.async_get_hourly_series()
+        adapter._series_state.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        second = await adapter.async_get_hourly_series()
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert [call["forecast_hours"] for call in client.series_calls] == [None, OpenMeteoAdapter.NEAR_HOURS]
+    assert second.start == first.start
+    assert len(second) == len(first)
+
+
+def test_series_from_a_past_day_is_fetched_in_full():
+    today = hour_floor().replace(hour=0)
+    client = FakeOpenMeteoClient(start=today - timedelta(days=1))
+
+    async def run():
+        adapter = OpenMeteoAdapter(client, 52.0, 5.0)
+        await adapter.async_get_hourly_series()
+        client.start = None
+        return await adapter.get_forecast(days=3)
+
+    forecast = asyncio.run(run())
+
+    # The first series starts yesterday: it is never served as fresh nor spliced
+    assert [call["forecast_hours"] for call in client.series_calls] == [None, None]
+    assert next(iter(forecast)) == today.date().isoformat()
@@ -0,0 +1,33 @@
+"""Tests for the disk-backed PersistentCache."""
+
+import asyncio
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.fishing_assistant.persistent_cache import (
+    async_get_persistent_cache,
+    get_persistent_cache,
+)
+
+
+def test_entries_survive_a_restart_and_old_ones_are_dropped(hass, fake_store):
+    now = dt_util.utcnow()
+    fake_store.stored = {
+        "entries": {
+            "series:old": {"data": 1, "fetched_at": (now - timedelta(days=8)).isoformat()},
+            "series:recent": {"data": 2, "fetched_at": (now - timedelta(hours=1)).isoformat()},
+        }
+    }
+
+    assert get_persistent_cache(hass) is None
+    cache = asyncio.run(async_get_persistent_cache(hass))
+
+    assert get_persistent_cache(hass) is cache
+    assert cache.get("series:old") is None
+    assert cache.get("series:recent").data == 2
+
+    cache.set("marine:52.0_5.0", {"wave_height": 1.0}, now, generated_at=now)
+    assert fake_store.saved["entries"]["marine:52.0_5.0"]["data"] == {"wave_height": 1.0}
+    assert cache.get("marine:52.0_5.0").generated_at == now
+    assert cache.stats()["namespaces"] == {"series": 1, "marine": 1}
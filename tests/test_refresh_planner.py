@@ -0,0 +1,46 @@
+"""Tests for the model-run-aware refresh planner."""
+
+from datetime import datetime, timedelta, timezone
+
+from custom_components.fishing_assistant.refresh_planner import (
+    DATE_MARGIN,
+    MAX_INTERVAL,
+    RUN_MARGIN,
+    ModelRun,
+    RefreshPlanner,
+)
+
+NOON = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _run(available: datetime, hours: int = 6) -> ModelRun:
+    return ModelRun(initialised=available - timedelta(hours=2), available=available, update_interval=timedelta(hours=hours))
+
+
+def test_check_is_planned_after_the_next_run():
+    planner = RefreshPlanner(fallback_ttl=timedelta(hours=1))
+    runs = {"a": _run(NOON - timedelta(hours=1)), "b": _run(NOON - timedelta(hours=4))}
+
+    assert planner.expiry(NOON, runs) == NOON + timedelta(hours=2) + RUN_MARGIN
+    assert planner.expiry(NOON, {}) == NOON + timedelta(hours=1)
+    assert planner.expiry(NOON, {"a": _run(NOON, hours=24)}) == NOON + MAX_INTERVAL
+
+
+def test_new_runs_are_detected_and_unknown_origin_refetches():
+    known = {"a": _run(NOON)}
+
+    assert not RefreshPlanner.has_new_run(known, {"a": _run(NOON)})
+    assert RefreshPlanner.has_new_run(known, {"a": _run(NOON + timedelta(hours=6))})
+    assert RefreshPlanner.has_new_run({}, known)
+
+
+def test_check_is_never_planned_past_the_utc_date_change():
+    planner = RefreshPlanner(fallback_ttl=timedelta(hours=6))
+    late = datetime(2024, 6, 1, 23, 30, tzinfo=timezone.utc)
+    midnight = datetime(2024, 6, 2, tzinfo=timezone.utc)
+
+    assert planner.expiry(late, {}) == midnight + DATE_MARGIN
+    assert planner.expiry(late, {"a": _run(late, hours=12)}) == midnight + DATE_MARGIN
+    # Local offsets do not move the cap
+    local = late.astimezone(timezone(timedelta(hours=10)))
+    assert planner.expiry(local, {}) == midnight + DATE_MARGIN
@@ -0,0 +1,89 @@
+"""Tests for the shared Open-Meteo request budget."""
+
+import asyncio
+
+import pytest
+
+from custom_components.fishing_assistant.helpers.request_budget import (
+    RequestBudget,
+    RequestBudgetExceeded,
+    call_weight,
+    request_priority,
+)
+
+URL = "https://api.open-meteo.com/v1/forecast"
+
+
+def test_reserve_is_kept_for_entries_with_visible_sensors():
+    async def run() -> None:
+        budget = RequestBudget(minute_limit=100, hour_limit=100, day_limit=10, visible_reserve=0.2)
+        hidden, visible = request_priority(False, 60), request_priority(True, 60)
+        for _ in range(8):
+            async with budget.slot(URL, priority=hidden):
+                pass
+
+        with pytest.raises(RequestBudgetExceeded):
+            async with budget.slot(URL, priority=hidden):
+                pass
+        for _ in range(2):
+            async with budget.slot(URL, priority=visible):
+                pass
+        with pytest.raises(RequestBudgetExceeded):
+            async with budget.slot(URL, priority=visible):
+                pass
+
+        stats = budget.stats()
+        assert stats["calls_today"] == 10
+        assert stats["rejected"] == 2
+
+    asyncio.run(run())
+
+
+def test_waiting_requests_are_served_in_priority_order():
+    async def run() -> None:
+        budget = RequestBudget(max_concurrent=1, minute_limit=100, hour_limit=100, day_limit=100)
+        order = []
+        gate = asyncio.Event()
+
+        async def request(name: str, priority) -> None:
+            async with budget.slot(URL, priority=priority):
+                order.append(name)
+                await gate.wait()
+
+        first = asyncio.create_task(request("first", request_priority(False, 0)))
+        await asyncio.sleep(0)
+        hidden = asyncio.create_task(request("hidden", request_priority(False, 3600)))
+        stale = asyncio.create_task(request("visible stale", request_priority(True, 7200)))
+        fresh = asyncio.create_task(request("visible", request_priority(True, 60)))
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(first, hidden, stale, fresh)
+
+        assert order == ["first", "visible stale", "visible", "hidden"]
+
+    asyncio.run(run())
+
+
+def test_call_weight_follows_open_meteo_counting():
+    assert call_weight(1, 10, 7) == 1
+    assert call_weight(3, 11, 16) == 12
+
+
+def test_listeners_follow_recorded_and_rejected_calls():
+    async def run() -> None:
+        budget = RequestBudget(minute_limit=100, hour_limit=100, day_limit=1, visible_reserve=0)
+        seen = []
+        remove = budget.add_listener(lambda: seen.append(budget.stats()["calls_today"]))
+        async with budget.slot(URL):
+            pass
+        with pytest.raises(RequestBudgetExceeded):
+            async with budget.slot(URL):
+                pass
+        remove()
+        budget.day_limit = 2
+        async with budget.slot(URL):
+            pass
+
+        assert seen == [1, 1]
+
+    asyncio.run(run())
@@ -0,0 +1,47 @@
+"""Tests for the integration-wide UpdateScheduler."""
+
+import asyncio
+from datetime import datetime
+
+from custom_components.fishing_assistant import scheduler as scheduler_module
+from custom_components.fishing_assistant.scheduler import UpdateScheduler
+
+
+def test_entries_run_on_their_interval_and_requests_coalesce(hass, monkeypatch):
+    pending = []
+    monkeypatch.setattr(scheduler_module, "async_track_time_change", lambda hass, action, **kw: lambda: None)
+
+    def fake_call_later(hass, delay, action):
+        pending.append(action)
+        return lambda: pending.remove(action)
+
+    monkeypatch.setattr(scheduler_module, "async_call_later", fake_call_later)
+    runs = []
+
+    def action(name):
+        async def _run():
+            runs.append(name)
+
+        return _run
+
+    scheduler = UpdateScheduler(hass)
+    scheduler.async_register("every_2h", 2, action("every_2h"))
+    scheduler.async_register("every_3h", 3, action("every_3h"))
+
+    scheduler._async_on_tick(datetime(2026, 1, 1, 4))
+    assert len(pending) == 1
+    scheduler._async_on_tick(datetime(2026, 1, 1, 6))
+    # The 2-hour entry's earlier run was replaced, not queued twice
+    assert len(pending) == 2
+    # A requested run is absorbed by the pending one
+    assert scheduler.async_request_run("every_3h")
+    assert len(pending) == 2
+    assert not scheduler.async_request_run("unknown")
+
+    async def fire():
+        for run in list(pending):
+            await run(datetime(2026, 1, 1, 6))
+
+    asyncio.run(fire())
+    assert sorted(runs) == ["every_2h", "every_3h"]
+    assert scheduler.stats()["entries"]["every_3h"]["requested_runs"] == 1
@@ -0,0 +1,24 @@
+"""Tests for the sensor platform setup helpers."""
+
+from types import SimpleNamespace
+
+from custom_components.fishing_assistant.sensor import OpenMeteoBudgetSensor, _budget_sensors
+
+from common import FakeHass
+
+
+def test_one_budget_sensor_for_the_whole_integration():
+    hass = FakeHass()
+    first, second = SimpleNamespace(entry_id="a"), SimpleNamespace(entry_id="b")
+
+    sensors = _budget_sensors(hass, first)
+    assert [type(s) for s in sensors] == [OpenMeteoBudgetSensor]
+    assert _budget_sensors(hass, second) == []
+    # A reloaded owner provides it again
+    assert len(_budget_sensors(hass, first)) == 1
+
+    sensor = sensors[0]
+    assert not sensor.should_poll
+    sensor.hass = hass
+    sensor._release_owner()
+    assert len(_budget_sensors(hass, second)) == 1
@@ -0,0 +1,53 @@
+"""Tests for WeatherFetcher."""
+
+import asyncio
+
+from custom_components.fishing_assistant.open_meteo_adapter import OpenMeteoAdapter
+from custom_components.fishing_assistant.weather_fetcher import WeatherFetcher
+
+from common import FakeOpenMeteoClient
+
+
+class _SlowSource:
+    def __init__(self):
+        self.calls = 0
+
+    async def get_current(self):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return {"temperature": 10.0, "wind_speed": 12.0, "wind_gust": 15.0}
+
+
+def test_concurrent_misses_share_one_fetch(hass):
+    source = _SlowSource()
+
+    async def run():
+        fetchers = [WeatherFetcher(hass, 52.0, 5.0, open_meteo_client=source) for _ in range(4)]
+        results = await asyncio.gather(*(f.get_weather_data() for f in fetchers))
+        # Served from the cell's cache afterwards
+        results.append(await fetchers[0].get_weather_data())
+        return results
+
+    results = asyncio.run(run())
+
+    assert source.calls == 1
+    assert all(r["temperature"] == 10.0 for r in results)
+
+
+def test_freshwater_and_ocean_sources_in_one_cell_do_not_share_entries(hass):
+    client = FakeOpenMeteoClient()
+
+    async def run():
+        freshwater = WeatherFetcher(hass, 52.0, 5.0, open_meteo_client=OpenMeteoAdapter(client, 52.0, 5.0))
+        ocean = WeatherFetcher(
+            hass, 52.0, 5.0, open_meteo_client=OpenMeteoAdapter(client, 52.0, 5.0, include_marine=True)
+        )
+        await freshwater.get_weather_data()
+        await freshwater.get_forecast(days=3)
+        await ocean.get_weather_data()
+        await ocean.get_forecast(days=3)
+
+    asyncio.run(run())
+
+    # Each source built its own series instead of reading the other's cached results
+    assert [call["include_marine"] for call in client.series_calls] == [False, True]